@@ -0,0 +1,59 @@
+"""add_groups_indexes
+
+Revision ID: 8c4e2a6f1b37
+Revises: 3f0b5c7d9a21
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c4e2a6f1b37'
+down_revision: Union[str, None] = '3f0b5c7d9a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Duplicated groups of the same owner can not be merged automatically, since they could have different members:
+    duplicated_groups: int = op.get_bind().scalar(
+        sa.text(
+            'SELECT count(*) FROM '
+            '(SELECT owner_id, name FROM groups GROUP BY owner_id, name HAVING count(*) > 1) AS duplicated_groups'
+        )
+    )
+    if duplicated_groups:
+        raise RuntimeError(
+            f'{duplicated_groups} groups names are duplicated by their owners, so that "uq_groups_owner_id_name" '
+            f'can not be created. Rename or delete duplicated groups and run the migration again.'
+        )
+
+    # Duplicated memberships are the same, so only the first of them is kept:
+    op.execute(
+        'DELETE FROM group_members WHERE id NOT IN (SELECT min(id) FROM group_members GROUP BY group_id, user_id)'
+    )
+
+    # SQLite can not alter constraints of existing tables, so they are changed in batch mode, which recreates tables:
+    with op.batch_alter_table('groups') as batch_op:
+        batch_op.create_unique_constraint('uq_groups_owner_id_name', ['owner_id', 'name'])
+
+    with op.batch_alter_table('group_members') as batch_op:
+        batch_op.create_unique_constraint('uq_group_members_group_id_user_id', ['group_id', 'user_id'])
+
+    op.create_index('ix_groups_owner_id_id', 'groups', ['owner_id', 'id'], unique=False, postgresql_include=['name'])
+    op.create_index('ix_group_members_user_id', 'group_members', ['user_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_group_members_user_id', table_name='group_members')
+    op.drop_index('ix_groups_owner_id_id', table_name='groups')
+
+    with op.batch_alter_table('group_members') as batch_op:
+        batch_op.drop_constraint('uq_group_members_group_id_user_id', type_='unique')
+
+    with op.batch_alter_table('groups') as batch_op:
+        batch_op.drop_constraint('uq_groups_owner_id_name', type_='unique')
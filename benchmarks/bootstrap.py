@@ -0,0 +1,80 @@
+"""
+Microbenchmark of per-request cost of creating messagebus and handling one command through it.
+
+"before" reproduces previous Bootstrap behaviour: inspect.signature() is called for every registered handler and all
+of them are instantiated on each request. "after" uses current Bootstrap with cached injection plans and lazily built
+handlers.
+
+Usage (environment variables should be provided the same way as for the application):
+    python -m dotenv -f .env.test run python -m benchmarks.bootstrap
+"""
+
+import asyncio
+import inspect
+import timeit
+from typing import Any, Dict, List, Type
+
+from src.core.bootstrap import Bootstrap
+from src.core.interfaces import AbstractEvent, AbstractCommand, AbstractEventHandler, AbstractCommandHandler
+from src.core.messagebus import MessageBus
+from src.users.service_layer.units_of_work import SQLAlchemyUsersUnitOfWork
+from src.users.service_layer.handlers import EVENTS_HANDLERS_FOR_INJECTION, COMMANDS_HANDLERS_FOR_INJECTION
+
+
+ITERATIONS: int = 20_000
+
+
+def inject_eagerly(handler: Any, dependencies: Dict[str, Any]) -> Any:
+    params = inspect.signature(handler).parameters
+    return handler(**{name: dependency for name, dependency in dependencies.items() if name in params})
+
+
+async def get_messagebus_before() -> MessageBus:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork()
+    dependencies: Dict[str, Any] = {'uow': uow}
+    event_handlers: Dict[Type[AbstractEvent], List[AbstractEventHandler]] = {
+        event_type: [inject_eagerly(handler=handler, dependencies=dependencies) for handler in handlers]
+        for event_type, handlers in EVENTS_HANDLERS_FOR_INJECTION.items()
+    }
+
+    command_handlers: Dict[Type[AbstractCommand], AbstractCommandHandler] = {
+        command_type: inject_eagerly(handler=handler, dependencies=dependencies)
+        for command_type, handler in COMMANDS_HANDLERS_FOR_INJECTION.items()
+    }
+
+    # Simulating dispatch of a single command type:
+    command_handlers[next(iter(command_handlers))]
+    return MessageBus(uow=uow, event_handlers=event_handlers, command_handlers=command_handlers)
+
+
+async def get_messagebus_after() -> MessageBus:
+    bootstrap: Bootstrap = Bootstrap(
+        uow=SQLAlchemyUsersUnitOfWork(),
+        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
+        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION
+    )
+
+    messagebus: MessageBus = await bootstrap.get_messagebus()
+
+    # Simulating dispatch of a single command type:
+    messagebus._command_handlers[next(iter(COMMANDS_HANDLERS_FOR_INJECTION))]
+    return messagebus
+
+
+def measure(name: str, coroutine_function: Any, loop: asyncio.AbstractEventLoop) -> float:
+    seconds: float = timeit.timeit(lambda: loop.run_until_complete(coroutine_function()), number=ITERATIONS)
+    per_request: float = seconds / ITERATIONS * 1_000_000
+    print(f'{name:<8} {per_request:8.2f} us per request')
+    return per_request
+
+
+def main() -> None:
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    before: float = measure(name='before', coroutine_function=get_messagebus_before, loop=loop)
+    after: float = measure(name='after', coroutine_function=get_messagebus_after, loop=loop)
+    print(f'speedup  {before / after:8.2f}x')
+    loop.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+"""
+Benchmark of adding and removing group members on groups with 10k and 100k members.
+
+"before" reproduces previous GroupsService behaviour: group is loaded together with all its members by "selectin"
+loading, members set is changed in Python and ORM flushes the difference, deleting removed members one by one.
+"after" uses set based statements of GroupsService, which never load existing members: one
+"INSERT ... SELECT ... ON CONFLICT DO NOTHING" and one "DELETE ... WHERE user_id IN (...)".
+
+Benchmark uses its own sqlite database file, which is removed afterwards.
+
+Usage (environment variables should be provided the same way as for the application):
+    python -m dotenv -f .env.test run python -m benchmarks.group_members
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Tuple, Set, Optional
+from sqlalchemy import insert, select, delete
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from src.core.database.metadata import metadata
+from src.groups.adapters.orm import groups_table, group_members_table, start_mappers as start_groups_mappers
+from src.groups.adapters.repositories import GROUP_LOAD_OPTIONS
+from src.groups.constants import GroupLoadProfiles
+from src.groups.domain.models import GroupModel, GroupMemberModel
+from src.groups.service_layer.service import GroupsService
+from src.groups.service_layer.units_of_work import SQLAlchemyGroupsUnitOfWork
+from src.users.adapters.orm import users_table, start_mappers as start_users_mappers
+
+
+DATABASE_NAME: str = 'benchmark_group_members.db'
+MEMBERS_COUNTS: Tuple[int, ...] = (10_000, 100_000)
+CHANGED_MEMBERS_COUNT: int = 1000
+REPEATS: int = 5
+GROUP_ID: int = 1
+
+
+async def seed_group(engine: AsyncEngine, members_count: int) -> None:
+    users: List[Dict[str, Any]] = [
+        {
+            'email': f'user_{index}@yandex.ru',
+            'password': 'a' * 64,
+            'username': f'user_{index}',
+            'email_verified': True,
+        }
+        for index in range(members_count + CHANGED_MEMBERS_COUNT)
+    ]
+
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(insert(users_table), users)
+        await conn.execute(insert(groups_table).values(id=GROUP_ID, owner_id=1, name='benchmark_group'))
+        await conn.execute(
+            insert(group_members_table),
+            [{'group_id': GROUP_ID, 'user_id': user_id} for user_id in range(1, members_count + 1)]
+        )
+
+
+async def reset_changed_members(engine: AsyncEngine, members_count: int) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(delete(group_members_table).where(group_members_table.c.user_id > members_count))
+
+
+async def change_members_before(session_factory: async_sessionmaker, members: Set[GroupMemberModel]) -> None:
+    async with session_factory() as session:
+        group: Optional[GroupModel] = (
+            await session.execute(
+                select(GroupModel).filter_by(id=GROUP_ID).options(*GROUP_LOAD_OPTIONS[GroupLoadProfiles.DETAIL])
+            )
+        ).scalar_one_or_none()
+
+        assert group is not None
+        group.members.update(members)
+        await session.commit()
+
+    async with session_factory() as session:
+        group = (
+            await session.execute(
+                select(GroupModel).filter_by(id=GROUP_ID).options(*GROUP_LOAD_OPTIONS[GroupLoadProfiles.DETAIL])
+            )
+        ).scalar_one_or_none()
+
+        assert group is not None
+        for member in members:
+            group.members.remove(member)
+
+        await session.commit()
+
+
+async def change_members_after(session_factory: async_sessionmaker, members: Set[GroupMemberModel]) -> None:
+    groups_service: GroupsService = GroupsService(uow=SQLAlchemyGroupsUnitOfWork(session_factory=session_factory))
+    group: GroupModel = await groups_service.get_group_by_id(id=GROUP_ID, profile=GroupLoadProfiles.MEMBERSHIP_CHECK)
+    assert await groups_service.add_group_members(group=group, members=members) == members
+    assert await groups_service.remove_group_members(group=group, members=members) == members
+
+
+async def measure(
+        name: str,
+        coroutine_function: Any,
+        engine: AsyncEngine,
+        session_factory: async_sessionmaker,
+        members_count: int
+) -> float:
+
+    best: float = float('inf')
+    for _ in range(REPEATS):
+        await reset_changed_members(engine=engine, members_count=members_count)
+
+        # New model instances for each run, for them not to be bound to sessions of previous runs:
+        members: Set[GroupMemberModel] = {
+            GroupMemberModel(group_id=GROUP_ID, user_id=user_id)
+            for user_id in range(members_count + 1, members_count + CHANGED_MEMBERS_COUNT + 1)
+        }
+
+        started_at: float = time.perf_counter()
+        await coroutine_function(session_factory, members)
+        best = min(best, time.perf_counter() - started_at)
+
+    print(f'{members_count:>7} members {name:<8} {best * 1000:10.2f} ms')
+    return best
+
+
+async def main() -> None:
+    start_users_mappers()
+    start_groups_mappers()
+    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{DATABASE_NAME}')
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    try:
+        for members_count in MEMBERS_COUNTS:
+            await seed_group(engine=engine, members_count=members_count)
+            before: float = await measure('before', change_members_before, engine, session_factory, members_count)
+            after: float = await measure('after', change_members_after, engine, session_factory, members_count)
+            print(f'{members_count:>7} members speedup  {before / after:10.2f}x')
+    finally:
+        await engine.dispose()
+        os.remove(DATABASE_NAME)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+Benchmark of GET /users read path on 10k and 100k users.
+
+"before" reproduces previous UsersViews behaviour: users are loaded through repository as ORM mapped UserModel
+instances, which are tracked by session identity map, and then password of each user is cleared by
+protect_password(). "after" uses Core read model query, which selects only returned columns and maps rows to
+UserReadModel directly.
+
+Benchmark uses its own sqlite database file, which is removed afterwards.
+
+Usage (environment variables should be provided the same way as for the application):
+    python -m dotenv -f .env.test run python -m benchmarks.views
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from src.core.database.metadata import metadata
+from src.core.pagination import PageRequest
+from src.users.adapters.orm import users_table, start_mappers
+from src.users.domain.models import UserModel
+from src.users.domain.read_models import UserReadModel
+from src.users.service_layer.service import UsersService
+from src.users.service_layer.units_of_work import SQLAlchemyUsersUnitOfWork
+
+
+DATABASE_NAME: str = 'benchmark_views.db'
+USERS_COUNTS: Tuple[int, ...] = (10_000, 100_000)
+REPEATS: int = 5
+
+
+async def seed_users(engine: AsyncEngine, count: int) -> None:
+    users: List[Dict[str, Any]] = [
+        {
+            'email': f'user_{index}@yandex.ru',
+            'password': 'a' * 64,
+            'username': f'user_{index}',
+            'email_verified': True,
+        }
+        for index in range(count)
+    ]
+
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+        await conn.execute(insert(users_table), users)
+
+
+async def get_all_users_before(session_factory: async_sessionmaker, count: int) -> int:
+    users_service: UsersService = UsersService(SQLAlchemyUsersUnitOfWork(session_factory=session_factory))
+    users: List[UserModel] = await users_service.get_all_users()
+    for user in users:
+        await user.protect_password()
+
+    return len(users)
+
+
+async def get_all_users_after(session_factory: async_sessionmaker, count: int) -> int:
+    uow: SQLAlchemyUsersUnitOfWork = SQLAlchemyUsersUnitOfWork(session_factory=session_factory, read_only=True)
+    async with uow:
+        users: List[UserReadModel] = await uow.users_queries.get_all_users(page_request=PageRequest(limit=count))
+
+    return len(users)
+
+
+async def measure(name: str, coroutine_function: Any, session_factory: async_sessionmaker, count: int) -> float:
+    best: float = float('inf')
+    for _ in range(REPEATS):
+        started_at: float = time.perf_counter()
+        assert await coroutine_function(session_factory, count) == count
+        best = min(best, time.perf_counter() - started_at)
+
+    print(f'{count:>7} users {name:<8} {best * 1000:10.2f} ms')
+    return best
+
+
+async def main() -> None:
+    start_mappers()
+    engine: AsyncEngine = create_async_engine(f'sqlite+aiosqlite:///{DATABASE_NAME}')
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine, expire_on_commit=False)
+    try:
+        for count in USERS_COUNTS:
+            await seed_users(engine=engine, count=count)
+            before: float = await measure('before', get_all_users_before, session_factory, count)
+            after: float = await measure('after', get_all_users_after, session_factory, count)
+            print(f'{count:>7} users speedup  {before / after:10.2f}x')
+    finally:
+        await engine.dispose()
+        os.remove(DATABASE_NAME)
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -6,4 +6,8 @@ elif [[ "${1}" == "flower" ]]; then
     celery --app=src.celery.celery_app:celery flower
 elif [[ "${1}" == "beat" ]]; then
     celery --app=src.celery.celery_app:celery beat -l INFO
+elif [[ "${1}" == "outbox" ]]; then
+    python -m src.celery.outbox_relay
+elif [[ "${1}" == "reconcile" ]]; then
+    python -m src.celery.member_counts
 fi
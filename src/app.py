@@ -2,7 +2,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import RedirectResponse
+from fastapi.responses import RedirectResponse, PlainTextResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import clear_mappers
@@ -13,6 +13,11 @@ from src.users.entrypoints.router import router as users_router
 from src.groups.entypoints.router import router as groups_router
 from src.users.adapters.orm import start_mappers as start_users_mappers
 from src.groups.adapters.orm import start_mappers as start_groups_mappers
+from src.bootstrap import create_messagebus_factory
+from src.core.bootstrap import MessageBusFactory
+from src.core.metrics import metrics_registry
+from src.core.database.config import database_config
+from src.middlewares import ReadYourWritesMiddleware
 
 
 @asynccontextmanager
@@ -24,10 +29,14 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator:
     # Startup events:
     start_users_mappers()
     start_groups_mappers()
+    messagebus_factory: MessageBusFactory = create_messagebus_factory()
+    await messagebus_factory.start()
+    _app.state.messagebus_factory = messagebus_factory
 
     yield
 
     # Shutdown events:
+    await messagebus_factory.stop()
     clear_mappers()
 
 app = FastAPI(lifespan=lifespan)
@@ -40,6 +49,8 @@ app.add_middleware(
     allow_methods=cors_config.ALLOW_METHODS,
     allow_headers=cors_config.ALLOW_HEADERS,
 )
+if database_config.DATABASE_READ_YOUR_WRITES_SECONDS:
+    app.add_middleware(ReadYourWritesMiddleware, seconds=database_config.DATABASE_READ_YOUR_WRITES_SECONDS)
 
 # Routers:
 app.include_router(users_router)
@@ -61,3 +72,18 @@ async def homepage():
         status_code=status.HTTP_303_SEE_OTHER,
         url=URLPathsConfig.DOCS
     )
+
+
+@app.get(
+    path=URLPathsConfig.METRICS,
+    response_class=PlainTextResponse,
+    name=URLNamesConfig.METRICS,
+    status_code=status.HTTP_200_OK,
+    include_in_schema=False
+)
+async def metrics():
+    """
+    Renders metrics of current worker process in Prometheus text format.
+    """
+
+    return PlainTextResponse(content=metrics_registry.render(), media_type='text/plain; version=0.0.4')
@@ -0,0 +1,113 @@
+import os
+import socket
+from redis.asyncio import Redis
+from typing import Dict, List, Type, Optional, Sequence
+
+from src.core.bootstrap import (
+    MessageBusFactory,
+    merge_events_handlers_for_injection,
+    merge_commands_handlers_for_injection
+)
+from src.core.interfaces import (
+    AbstractEvent,
+    AbstractCommand,
+    AbstractEventHandler,
+    AbstractCommandHandler,
+    AbstractEventsDispatcher,
+    AbstractMessageBusMiddleware
+)
+from src.core.config import messagebus_config
+from src.core.messagebus import DeferredEventsDispatcher
+from src.core.middlewares import MessageBusMetricsMiddleware, register_deferred_events_metrics
+from src.core.redis.config import redis_streams_config
+from src.core.redis.connection import REDIS_URL
+from src.core.redis.streams import EventsSerializer, RedisStreamsEventsDispatcher, RedisStreamsEventsConsumer
+from src.users.service_layer.units_of_work import SQLAlchemyUsersUnitOfWork
+from src.groups.service_layer.units_of_work import SQLAlchemyGroupsUnitOfWork
+from src.users.service_layer.handlers import (
+    EVENTS_HANDLERS_FOR_INJECTION as USERS_EVENTS_HANDLERS_FOR_INJECTION,
+    COMMANDS_HANDLERS_FOR_INJECTION as USERS_COMMANDS_HANDLERS_FOR_INJECTION
+)
+from src.groups.service_layer.handlers import (
+    EVENTS_HANDLERS_FOR_INJECTION as GROUPS_EVENTS_HANDLERS_FOR_INJECTION,
+    COMMANDS_HANDLERS_FOR_INJECTION as GROUPS_COMMANDS_HANDLERS_FOR_INJECTION
+)
+
+
+# Mypy treats "Self" return types of bases' "__aenter__" as incompatible, though both resolve to this class:
+class SQLAlchemyApplicationUnitOfWork(SQLAlchemyUsersUnitOfWork, SQLAlchemyGroupsUnitOfWork):  # type: ignore[misc]
+    """
+    Unit of work, which provides repositories of all domains within one session, so that handlers of any domain
+    can be injected with it and events of one domain can be handled by handlers of another.
+    """
+
+
+EVENTS_HANDLERS_FOR_INJECTION: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]] = (
+    merge_events_handlers_for_injection(
+        USERS_EVENTS_HANDLERS_FOR_INJECTION,
+        GROUPS_EVENTS_HANDLERS_FOR_INJECTION
+    )
+)
+
+COMMANDS_HANDLERS_FOR_INJECTION: Dict[Type[AbstractCommand], Type[AbstractCommandHandler]] = (
+    merge_commands_handlers_for_injection(
+        USERS_COMMANDS_HANDLERS_FOR_INJECTION,
+        GROUPS_COMMANDS_HANDLERS_FOR_INJECTION
+    )
+)
+
+
+def create_middlewares() -> Sequence[AbstractMessageBusMiddleware]:
+    if messagebus_config.MESSAGEBUS_METRICS:
+        return [MessageBusMetricsMiddleware()]
+
+    return []
+
+
+def create_messagebus_factory() -> MessageBusFactory:
+    """
+    Creates messagebus factory for API workers. If Redis Streams transport is enabled, events, raised by commands
+    handlers, are published to the stream and are handled by events consumers.
+    """
+
+    events_dispatcher: Optional[AbstractEventsDispatcher] = None
+    if redis_streams_config.REDIS_STREAMS_EVENTS:
+        events_dispatcher = RedisStreamsEventsDispatcher(
+            redis=Redis.from_url(REDIS_URL, decode_responses=True),
+            serializer=EventsSerializer(events_types=EVENTS_HANDLERS_FOR_INJECTION.keys())
+        )
+
+    messagebus_factory: MessageBusFactory = MessageBusFactory(
+        uow_factory=SQLAlchemyApplicationUnitOfWork,
+        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
+        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION,
+        events_dispatcher=events_dispatcher,
+        middlewares=create_middlewares()
+    )
+
+    deferred_events_dispatcher: Optional[AbstractEventsDispatcher] = messagebus_factory.events_dispatcher
+    if messagebus_config.MESSAGEBUS_METRICS and isinstance(deferred_events_dispatcher, DeferredEventsDispatcher):
+        register_deferred_events_metrics(events_dispatcher=deferred_events_dispatcher)
+
+    return messagebus_factory
+
+
+def create_events_consumer() -> RedisStreamsEventsConsumer:
+    """
+    Creates Redis Streams consumer group worker, which handles events inline with its own messagebus.
+    """
+
+    messagebus_factory: MessageBusFactory = MessageBusFactory(
+        uow_factory=SQLAlchemyApplicationUnitOfWork,
+        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
+        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION,
+        defer_events=False,
+        middlewares=create_middlewares()
+    )
+
+    return RedisStreamsEventsConsumer(
+        redis=Redis.from_url(REDIS_URL, decode_responses=True),
+        serializer=EventsSerializer(events_types=EVENTS_HANDLERS_FOR_INJECTION.keys()),
+        messagebus_factory=messagebus_factory.get_messagebus,
+        consumer=f'{socket.gethostname()}-{os.getpid()}'
+    )
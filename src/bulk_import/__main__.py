@@ -0,0 +1,54 @@
+"""
+Bulk import of users, groups and group members from CSV or NDJSON file:
+    python -m src.bulk_import users users.csv --workers 8
+    python -m src.bulk_import groups groups.ndjson
+    python -m src.bulk_import members members.csv --batch-size 10000
+
+Users records should have "email", "username", "password" and, optionally, "email_verified" fields, groups records -
+"owner_id" and "name" fields, and members records - "group_id" and "user_id" fields. Records, which already exist, are
+skipped. If import is interrupted, running the same command resumes it from the checkpoint.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.bulk_import.config import BulkImportConfig
+from src.bulk_import.importer import BulkImporter
+from src.core.database.connection import engine
+
+
+def parse_args() -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog='python -m src.bulk_import')
+    parser.add_argument('entity', choices=('users', 'groups', 'members'))
+    parser.add_argument('source', help='path to CSV or NDJSON file')
+    parser.add_argument('--format', dest='source_format', choices=BulkImportConfig.formats())
+    parser.add_argument('--batch-size', type=int, default=BulkImportConfig.BATCH_SIZE)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='password hashing processes')
+    parser.add_argument('--checkpoint', help='path to checkpoint file, defaults to source path with ".checkpoint"')
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace) -> None:
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        importer: BulkImporter = BulkImporter(
+            entity=args.entity,
+            source=args.source,
+            engine=engine,
+            executor=executor,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            source_format=args.source_format,
+            checkpoint=args.checkpoint
+        )
+        try:
+            await importer.run()
+        finally:
+            await engine.dispose()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(args=parse_args()))
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class BulkImportConfig:
+    BATCH_SIZE: int = 5000  # rows, which are prepared, loaded and committed at once
+    CHECKPOINT_SUFFIX: str = '.checkpoint'
+    CSV_FORMAT: str = 'csv'
+    NDJSON_FORMAT: str = 'ndjson'
+
+    @classmethod
+    def formats(cls) -> Sequence[str]:
+        return cls.CSV_FORMAT, cls.NDJSON_FORMAT
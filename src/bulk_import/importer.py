@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import Executor
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Callable, Awaitable, TextIO
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection
+
+from src.bulk_import.config import BulkImportConfig
+from src.bulk_import.loaders import AbstractBulkLoader, get_bulk_loader
+from src.bulk_import.sources import read_records, read_batches, read_checkpoint, write_checkpoint, detect_format
+from src.groups.adapters.member_counts import recount_member_counts
+from src.groups.adapters.orm import groups_table, group_members_table
+from src.users.adapters.orm import users_table
+from src.users.utils import pwd_context
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+Rows = List[Dict[str, Any]]
+
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    """
+    Hashes passwords in a worker process, since hashing is CPU bound and would block event loop and each other.
+    """
+
+    return [pwd_context.hash(secret=password) for password in passwords]
+
+
+def parse_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes')
+
+    return bool(value)
+
+
+class BulkImporter:
+    """
+    Imports users, groups or group members from CSV or NDJSON source in batches. Each batch is prepared, loaded by
+    dialect's bulk loader and committed in its own transaction, after which count of imported records is saved to
+    checkpoint, so that interrupted import is resumed from the first not committed batch. Only one batch is kept in
+    memory at once.
+
+    Users passwords are hashed by executor's worker processes. Groups and members refer to users and groups by ids.
+    Member counts of groups, which got members in a batch, are recounted in the batch's transaction.
+    """
+
+    def __init__(
+            self,
+            entity: str,
+            source: str,
+            engine: AsyncEngine,
+            executor: Optional[Executor] = None,
+            workers: int = 1,
+            batch_size: int = BulkImportConfig.BATCH_SIZE,
+            source_format: Optional[str] = None,
+            checkpoint: Optional[str] = None
+    ) -> None:
+
+        preparers: Dict[str, Callable[[Rows], Awaitable[Rows]]] = {
+            'users': self._prepare_users,
+            'groups': self._prepare_groups,
+            'members': self._prepare_members
+        }
+        finalizers: Dict[str, Callable[[AsyncConnection, Rows], Awaitable[None]]] = {
+            'members': self._recount_member_counts
+        }
+        tables: Dict[str, Table] = {'users': users_table, 'groups': groups_table, 'members': group_members_table}
+        assert entity in tables, f'{entity} can not be imported'
+
+        self._entity: str = entity
+        self._table: Table = tables[entity]
+        self._prepare: Callable[[Rows], Awaitable[Rows]] = preparers[entity]
+        self._finalize: Optional[Callable[[AsyncConnection, Rows], Awaitable[None]]] = finalizers.get(entity)
+        self._source: str = source
+        self._engine: AsyncEngine = engine
+        self._loader: AbstractBulkLoader = get_bulk_loader(dialect=engine.dialect.name)
+        self._executor: Optional[Executor] = executor
+        self._workers: int = workers
+        self._batch_size: int = batch_size
+        self._source_format: str = source_format or detect_format(path=source)
+        self._checkpoint: str = checkpoint or source + BulkImportConfig.CHECKPOINT_SUFFIX
+
+    async def run(self) -> int:
+        """
+        Imports all not yet imported records and returns count of records, imported by this run. Checkpoint is removed
+        after the last batch is committed.
+        """
+
+        skip: int = read_checkpoint(path=self._checkpoint, source=self._source, entity=self._entity)
+        if skip:
+            logger.info('Resuming %s import from record %s', self._entity, skip)
+
+        imported: int = 0
+        started_at: float = time.monotonic()
+        source: TextIO
+        with open(self._source, newline='') as source:
+            for batch in read_batches(
+                    records=read_records(source=source, source_format=self._source_format),
+                    batch_size=self._batch_size,
+                    skip=skip
+            ):
+                rows: Rows = await self._prepare(batch)
+                async with self._engine.begin() as connection:
+                    await self._loader.load(connection=connection, table=self._table, rows=rows)
+                    if self._finalize:
+                        await self._finalize(connection, rows)
+
+                imported += len(batch)
+                write_checkpoint(
+                    path=self._checkpoint,
+                    source=self._source,
+                    entity=self._entity,
+                    imported=skip + imported
+                )
+                logger.info(
+                    'Imported %s %s records, %.0f records/s',
+                    skip + imported,
+                    self._entity,
+                    imported / max(time.monotonic() - started_at, 1e-9)
+                )
+
+        if os.path.exists(self._checkpoint):
+            os.remove(self._checkpoint)
+
+        return imported
+
+    async def _prepare_users(self, records: Rows) -> Rows:
+        passwords: List[str] = [record['password'] for record in records]
+        hashed_passwords: List[str] = []
+        if self._executor:
+            chunk_size: int = -(-len(passwords) // self._workers)
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            for hashed_chunk in await asyncio.gather(
+                *(
+                    loop.run_in_executor(self._executor, hash_passwords, passwords[index:index + chunk_size])
+                    for index in range(0, len(passwords), chunk_size)
+                )
+            ):
+                hashed_passwords.extend(hashed_chunk)
+        else:
+            hashed_passwords = hash_passwords(passwords=passwords)
+
+        now: datetime = datetime.now(tz=timezone.utc)
+        return [
+            {
+                'email': record['email'],
+                'username': record['username'],
+                'password': hashed_password,
+                'email_verified': parse_bool(record.get('email_verified', False)),
+                'created_at': now,
+                'updated_at': now
+            }
+            for record, hashed_password in zip(records, hashed_passwords)
+        ]
+
+    async def _prepare_groups(self, records: Rows) -> Rows:
+        now: datetime = datetime.now(tz=timezone.utc)
+        return [
+            {'owner_id': int(record['owner_id']), 'name': record['name'], 'created_at': now, 'updated_at': now}
+            for record in records
+        ]
+
+    async def _prepare_members(self, records: Rows) -> Rows:
+        now: datetime = datetime.now(tz=timezone.utc)
+        return [
+            {
+                'group_id': int(record['group_id']),
+                'user_id': int(record['user_id']),
+                'created_at': now,
+                'updated_at': now
+            }
+            for record in records
+        ]
+
+    async def _recount_member_counts(self, connection: AsyncConnection, rows: Rows) -> None:
+        """
+        Members are loaded bypassing groups repository and some of them could be skipped as duplicates, so member
+        counts of affected groups are recounted instead of being incremented.
+        """
+
+        await connection.execute(recount_member_counts(groups_table.c.id.in_({row['group_id'] for row in rows})))
@@ -0,0 +1,66 @@
+from abc import ABC, abstractmethod
+from typing import List, Dict, Any, Sequence
+from sqlalchemy import Table
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+class AbstractBulkLoader(ABC):
+    """
+    Loads one batch of rows into table within current transaction of connection. Rows, which violate unique
+    constraints, are skipped, so that a batch, which was loaded, but was not checkpointed, could be loaded once more.
+    """
+
+    @abstractmethod
+    async def load(self, connection: AsyncConnection, table: Table, rows: List[Dict[str, Any]]) -> None:
+        raise NotImplementedError
+
+
+class PostgresCopyLoader(AbstractBulkLoader):
+    """
+    Copies rows into temporary staging table with asyncpg's COPY protocol, which is much faster than inserts, and
+    moves them into the table by one "INSERT ... SELECT ... ON CONFLICT DO NOTHING", since COPY itself can not skip
+    conflicting rows. Staging table is dropped on commit.
+
+    Staging table has only the loaded columns without defaults and constraints, so that ids are assigned only once,
+    by the final insert, and rows do not use up sequence values in staging.
+    """
+
+    async def load(self, connection: AsyncConnection, table: Table, rows: List[Dict[str, Any]]) -> None:
+        columns: Sequence[str] = list(rows[0])
+        staging_table: str = f'{table.name}_import'
+        columns_list: str = ', '.join(columns)
+
+        await connection.exec_driver_sql(
+            f'CREATE TEMPORARY TABLE {staging_table} ON COMMIT DROP AS '
+            f'SELECT {columns_list} FROM {table.name} WITH NO DATA'
+        )
+
+        # COPY is not supported by SQLAlchemy, so it is performed by asyncpg connection in the same transaction:
+        raw_connection: Any = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            staging_table,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns
+        )
+
+        await connection.exec_driver_sql(
+            f'INSERT INTO {table.name} ({columns_list}) SELECT {columns_list} FROM {staging_table} '
+            f'ON CONFLICT DO NOTHING'
+        )
+
+
+class SQLiteExecuteManyLoader(AbstractBulkLoader):
+    """
+    SQLite has no COPY, so rows are inserted by one executemany() call per batch.
+    """
+
+    async def load(self, connection: AsyncConnection, table: Table, rows: List[Dict[str, Any]]) -> None:
+        await connection.execute(sqlite_insert(table).on_conflict_do_nothing(), rows)
+
+
+def get_bulk_loader(dialect: str) -> AbstractBulkLoader:
+    if dialect == 'sqlite':
+        return SQLiteExecuteManyLoader()
+
+    return PostgresCopyLoader()
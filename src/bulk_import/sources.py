@@ -0,0 +1,88 @@
+import csv
+import json
+import os
+from typing import Iterator, Dict, Any, List, Optional, TextIO
+
+from src.bulk_import.config import BulkImportConfig
+
+
+def detect_format(path: str) -> str:
+    """
+    Detects source format by file extension. Files with ".jsonl" extension are treated as NDJSON too.
+    """
+
+    extension: str = os.path.splitext(path)[1].lstrip('.').lower()
+    if extension in ('jsonl', BulkImportConfig.NDJSON_FORMAT):
+        return BulkImportConfig.NDJSON_FORMAT
+
+    return BulkImportConfig.CSV_FORMAT
+
+
+def read_records(source: TextIO, source_format: str) -> Iterator[Dict[str, Any]]:
+    """
+    Reads records one by one, so that memory usage does not depend on source size. Empty NDJSON lines are skipped.
+    """
+
+    if source_format == BulkImportConfig.NDJSON_FORMAT:
+        for line in source:
+            if line.strip():
+                yield json.loads(line)
+
+        return
+
+    yield from csv.DictReader(source)
+
+
+def read_batches(
+        records: Iterator[Dict[str, Any]],
+        batch_size: int,
+        skip: int = 0
+) -> Iterator[List[Dict[str, Any]]]:
+
+    """
+    Groups records into batches of batch_size records. First skip records, which were already imported, are read but
+    are not yielded.
+    """
+
+    batch: List[Dict[str, Any]] = []
+    for index, record in enumerate(records):
+        if index < skip:
+            continue
+
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+def read_checkpoint(path: str, source: str, entity: str) -> int:
+    """
+    Returns count of records, which were already imported from source, or 0, if there is no checkpoint for source.
+    """
+
+    if not os.path.exists(path):
+        return 0
+
+    with open(path) as checkpoint_file:
+        checkpoint: Dict[str, Any] = json.load(checkpoint_file)
+
+    if checkpoint.get('source') != os.path.abspath(source) or checkpoint.get('entity') != entity:
+        return 0
+
+    imported: Optional[int] = checkpoint.get('imported')
+    return imported or 0
+
+
+def write_checkpoint(path: str, source: str, entity: str, imported: int) -> None:
+    """
+    Replaces checkpoint atomically, so that it is never left partially written, if process is killed.
+    """
+
+    temporary_path: str = path + '.tmp'
+    with open(temporary_path, 'w') as checkpoint_file:
+        json.dump({'source': os.path.abspath(source), 'entity': entity, 'imported': imported}, checkpoint_file)
+
+    os.replace(temporary_path, path)
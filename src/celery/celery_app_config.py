@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 from typing import Dict, Any, List, Tuple
 
 from src.core.redis.connection import REDIS_URL
-from src.celery.config import celery_config
+from src.celery.config import celery_config, member_counts_config
 
 
 @dataclass(frozen=True)
@@ -27,5 +27,11 @@ DEFAULT_RESULT_BACKEND: str = 'rpc'
 celery_app_config: CeleryAppConfig = CeleryAppConfig(
     broker_url=REDIS_URL if celery_config.USE_BROKER else DEFAULT_BROKER_URL,
     result_backend=REDIS_URL if celery_config.USE_RESULT_BACKEND else DEFAULT_RESULT_BACKEND,
-    include=['src.celery.tasks.users_tasks']
+    include=['src.celery.tasks.users_tasks', 'src.celery.tasks.groups_tasks'],
+    beat_schedule={
+        'reconcile-group-member-counts': {
+            'task': 'src.celery.tasks.groups_tasks.reconcile_group_member_counts',
+            'schedule': member_counts_config.MEMBER_COUNTS_RECONCILE_INTERVAL
+        }
+    }
 )
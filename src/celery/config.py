@@ -27,5 +27,17 @@ class CeleryConfig(BaseSettings):
     USE_RESULT_BACKEND: bool
 
 
+class OutboxConfig(BaseSettings):
+    OUTBOX_BATCH_SIZE: int = 500
+    OUTBOX_POLL_INTERVAL: float = 1
+
+
+class MemberCountsConfig(BaseSettings):
+    MEMBER_COUNTS_BATCH_SIZE: int = 1000
+    MEMBER_COUNTS_RECONCILE_INTERVAL: float = 3600
+
+
 smtp_config: SMTPConfig = SMTPConfig()
 celery_config: CeleryConfig = CeleryConfig()
+outbox_config: OutboxConfig = OutboxConfig()
+member_counts_config: MemberCountsConfig = MemberCountsConfig()
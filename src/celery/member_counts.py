@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from sqlalchemy import select, CursorResult
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, AsyncEngine
+from typing import List, Optional, Tuple
+
+from src.celery.config import member_counts_config
+from src.core.database.connection import (
+    DATABASE_URL,
+    create_engine,
+    create_session_factory,
+    session_factory as default_session_factory
+)
+from src.groups.adapters.member_counts import recount_member_counts
+from src.groups.adapters.orm import groups_table
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class MemberCountsReconciler:
+    """
+    Repairs drift of denormalized groups member counts, which could be caused by members, deleted by cascade together
+    with their users, or by writes, bypassing groups repository.
+
+    Groups are walked in batches by id, and each batch is reconciled in its own short transaction. Groups rows of the
+    batch are locked before their members are counted, so that concurrent membership changes of these groups are
+    either committed before counting, or increment already repaired count after it.
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker = default_session_factory,
+            batch_size: int = member_counts_config.MEMBER_COUNTS_BATCH_SIZE
+    ) -> None:
+
+        self._session_factory: async_sessionmaker = session_factory
+        self._batch_size: int = batch_size
+
+    async def reconcile_batch(self, after_id: int) -> Tuple[Optional[int], int]:
+        """
+        Reconciles batch of groups, following group with provided id. Returns id of the last group of the batch, or
+        None, if there are no more groups, and count of repaired groups.
+        """
+
+        session: AsyncSession
+        async with self._session_factory() as session:
+            async with session.begin():
+                ids: List[int] = list(
+                    (
+                        await session.execute(
+                            select(groups_table.c.id)
+                            .where(groups_table.c.id > after_id)
+                            .order_by(groups_table.c.id)
+                            .limit(self._batch_size)
+                            .with_for_update()
+                        )
+                    ).scalars().all()
+                )
+                if not ids:
+                    return None, 0
+
+                result: CursorResult = await session.execute(
+                    recount_member_counts(groups_table.c.id > after_id, groups_table.c.id <= ids[-1])
+                )
+
+        return ids[-1], result.rowcount
+
+    async def reconcile(self) -> int:
+        """
+        Reconciles all groups and returns count of repaired groups.
+        """
+
+        repaired: int = 0
+        last_id: Optional[int] = 0
+        while last_id is not None:
+            batch_repaired: int
+            last_id, batch_repaired = await self.reconcile_batch(after_id=last_id)
+            repaired += batch_repaired
+
+        logger.info('Repaired member counts of %s groups', repaired)
+        return repaired
+
+
+async def reconcile_member_counts() -> int:
+    """
+    Runs reconciliation with its own engine, since it is called by Celery worker in a new event loop each time, and
+    pooled connections can not be shared between event loops.
+    """
+
+    engine: AsyncEngine = create_engine(url=DATABASE_URL)
+    try:
+        return await MemberCountsReconciler(session_factory=create_session_factory(bind=engine)).reconcile()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(reconcile_member_counts())
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+from celery import Celery
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+from typing import List
+
+from src.celery.celery_app import celery as default_celery
+from src.celery.config import outbox_config
+from src.core.database.connection import session_factory as default_session_factory
+from src.core.outbox.models import OutboxMessageModel
+from src.core.outbox.repositories import SQLAlchemyOutboxRepository
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    """
+    Publishes outbox messages to Celery in batches.
+
+    Each batch is selected with "SELECT ... FOR UPDATE SKIP LOCKED", published through one producer connection and
+    deleted in the same transaction, so several relays could be run concurrently. If transaction fails after messages
+    were published, they would be published once more by the next batch, so tasks should be idempotent.
+    """
+
+    def __init__(
+            self,
+            celery: Celery = default_celery,
+            session_factory: async_sessionmaker = default_session_factory,
+            batch_size: int = outbox_config.OUTBOX_BATCH_SIZE,
+            poll_interval: float = outbox_config.OUTBOX_POLL_INTERVAL
+    ) -> None:
+
+        self._celery: Celery = celery
+        self._session_factory: async_sessionmaker = session_factory
+        self._batch_size: int = batch_size
+        self._poll_interval: float = poll_interval
+
+    async def relay(self) -> int:
+        """
+        Publishes one batch of messages and returns count of published messages.
+        """
+
+        session: AsyncSession
+        async with self._session_factory() as session:
+            async with session.begin():
+                outbox: SQLAlchemyOutboxRepository = SQLAlchemyOutboxRepository(session=session)
+                messages: List[OutboxMessageModel] = await outbox.list_unpublished(limit=self._batch_size)
+                if not messages:
+                    return 0
+
+                with self._celery.producer_or_acquire() as producer:
+                    for message in messages:
+                        self._celery.send_task(name=message.task, kwargs=message.kwargs, producer=producer)
+
+                await outbox.delete_many(ids=[message.id for message in messages])
+
+        logger.info('Published %s outbox messages', len(messages))
+        return len(messages)
+
+    async def run(self) -> None:
+        """
+        Publishes messages till the process is stopped. Waits for poll interval only when outbox is drained.
+        """
+
+        while True:
+            try:
+                published: int = await self.relay()
+            except Exception:
+                logger.exception('Failed to publish outbox messages')
+                published = 0
+
+            if published < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(OutboxRelay().run())
@@ -0,0 +1,9 @@
+import asyncio
+
+from src.celery.celery_app import celery
+from src.celery.member_counts import reconcile_member_counts
+
+
+@celery.task
+def reconcile_group_member_counts() -> int:
+    return asyncio.run(reconcile_member_counts())
@@ -16,12 +16,20 @@ class URLPathsConfig:
     HOMEPAGE: str = '/'
     STATIC: str = '/static'
     DOCS: str = '/docs'
+    METRICS: str = '/metrics'
 
 
 @dataclass(frozen=True)
 class URLNamesConfig:
     HOMEPAGE: str = 'homepage'
     STATIC: str = 'static'
+    METRICS: str = 'metrics'
+
+
+@dataclass(frozen=True)
+class ReadYourWritesConfig:
+    COOKIE_KEY: str = 'Read-Primary'
+    SAFE_METHODS: Tuple[str, ...] = ('GET', 'HEAD', 'OPTIONS')
 
 
 @dataclass(frozen=True)
@@ -1,15 +1,63 @@
 import inspect
-from types import MappingProxyType
-from typing import Union, Type, Dict, Any, List, Optional
+from functools import cache
+from typing import Union, Type, Dict, Any, List, Optional, Tuple, Mapping, Callable, Iterator, TypeVar, Sequence
 
 from src.core.interfaces import (
     AbstractCommand,
     AbstractEvent,
     AbstractUnitOfWork,
     AbstractEventHandler,
-    AbstractCommandHandler
+    AbstractCommandHandler,
+    AbstractEventsDispatcher,
+    AbstractMessageBusMiddleware
 )
-from src.core.messagebus import MessageBus
+from src.core.config import messagebus_config
+from src.core.messagebus import MessageBus, DeferredEventsDispatcher
+
+
+MessageType = TypeVar('MessageType')
+HandlerType = TypeVar('HandlerType')
+
+
+@cache
+def get_injection_plan(handler: Union[Type[AbstractEventHandler], Type[AbstractCommandHandler]]) -> Tuple[str, ...]:
+    """
+    Inspects handler's signature and returns names of its init params, which are used for dependencies injection.
+
+    Handlers classes are not changed during process lifetime, so the plan is compiled only once per handler class
+    and cached, instead of calling inspect.signature() for each handler on each request.
+    """
+
+    return tuple(inspect.signature(handler).parameters)
+
+
+class LazyHandlersMapping(Mapping[MessageType, HandlerType]):
+    """
+    Read-only mapping of message types to injected handlers, which builds handlers only when their message type is
+    dispatched for the first time. Already built handlers are reused during the mapping's lifetime.
+    """
+
+    def __init__(
+            self,
+            handlers_for_injection: Mapping[MessageType, Any],
+            factory: Callable[[Any], HandlerType]
+    ) -> None:
+
+        self._handlers_for_injection: Mapping[MessageType, Any] = handlers_for_injection
+        self._factory: Callable[[Any], HandlerType] = factory
+        self._handlers: Dict[MessageType, HandlerType] = {}
+
+    def __getitem__(self, message_type: MessageType) -> HandlerType:
+        if message_type not in self._handlers:
+            self._handlers[message_type] = self._factory(self._handlers_for_injection[message_type])
+
+        return self._handlers[message_type]
+
+    def __iter__(self) -> Iterator[MessageType]:
+        return iter(self._handlers_for_injection)
+
+    def __len__(self) -> int:
+        return len(self._handlers_for_injection)
 
 
 class Bootstrap:
@@ -22,10 +70,14 @@ class Bootstrap:
             uow: AbstractUnitOfWork,
             events_handlers_for_injection: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]],
             commands_handlers_for_injection: Dict[Type[AbstractCommand], Type[AbstractCommandHandler]],
-            dependencies: Optional[Dict[str, Any]] = None
+            dependencies: Optional[Dict[str, Any]] = None,
+            events_dispatcher: Optional[AbstractEventsDispatcher] = None,
+            middlewares: Sequence[AbstractMessageBusMiddleware] = ()
     ) -> None:
 
         self._uow: AbstractUnitOfWork = uow
+        self._events_dispatcher: Optional[AbstractEventsDispatcher] = events_dispatcher
+        self._middlewares: Sequence[AbstractMessageBusMiddleware] = middlewares
         self._dependencies: Dict[str, Any] = {'uow': self._uow}
         self._events_handlers_for_injection: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]] = (
             events_handlers_for_injection
@@ -39,43 +91,145 @@ class Bootstrap:
 
     async def get_messagebus(self) -> MessageBus:
         """
-        Makes necessary injections to commands handlers and events handlers for creating appropriate messagebus,
-        after which returns messagebus instance.
+        Creates messagebus, which handlers would be injected with necessary dependencies lazily, only when message of
+        appropriate type is handled by messagebus.
         """
 
-        injected_event_handlers: Dict[Type[AbstractEvent], List[AbstractEventHandler]] = {
-            event_type: [
-                await self._inject_dependencies(handler=handler)
-                for handler in event_handlers
-            ]
-            for event_type, event_handlers in self._events_handlers_for_injection.items()
-        }
+        injected_event_handlers: Mapping[Type[AbstractEvent], List[AbstractEventHandler]] = LazyHandlersMapping(
+            handlers_for_injection=self._events_handlers_for_injection,
+            factory=lambda event_handlers: [self._build_handler(handler=handler) for handler in event_handlers]
+        )
 
-        injected_command_handlers: Dict[Type[AbstractCommand], AbstractCommandHandler] = {
-            command_type: await self._inject_dependencies(handler=handler)
-            for command_type, handler in self._commands_handlers_for_injection.items()
-        }
+        injected_command_handlers: Mapping[Type[AbstractCommand], AbstractCommandHandler] = LazyHandlersMapping(
+            handlers_for_injection=self._commands_handlers_for_injection,
+            factory=lambda handler: self._build_handler(handler=handler)
+        )
 
         return MessageBus(
             uow=self._uow,
             event_handlers=injected_event_handlers,
             command_handlers=injected_command_handlers,
+            events_dispatcher=self._events_dispatcher,
+            middlewares=self._middlewares
         )
 
-    async def _inject_dependencies(
+    def _build_handler(
             self,
             handler: Union[Type[AbstractEventHandler], Type[AbstractCommandHandler]]
-    ) -> Union[AbstractEventHandler, AbstractCommandHandler]:
+    ) -> Any:
 
         """
-        Inspecting handler to know its signature and init params, after which only necessary dependencies will be
-        injected to the handler.
+        Injects to the handler only those of dependencies, which are its init params according to its cached injection
+        plan.
         """
 
-        params: MappingProxyType[str, inspect.Parameter] = inspect.signature(handler).parameters
         handler_dependencies: Dict[str, Any] = {
-            name: dependency
-            for name, dependency in self._dependencies.items()
-            if name in params
+            name: self._dependencies[name]
+            for name in get_injection_plan(handler)
+            if name in self._dependencies
         }
         return handler(**handler_dependencies)
+
+
+class MessageBusFactory:
+    """
+    Process-wide registry of events handlers and commands handlers for injection, which is built only once and creates
+    messagebus, bound to a fresh unit of work, upon each call.
+
+    If events dispatcher is provided, events, raised by commands handlers, are passed to it instead of being handled
+    inline. Otherwise, if defer_events is True, they are handled by per-worker events dispatcher after the response
+    had been returned. Dispatcher should be started and stopped with start() and stop() methods.
+    """
+
+    def __init__(
+            self,
+            uow_factory: Callable[[], AbstractUnitOfWork],
+            events_handlers_for_injection: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]],
+            commands_handlers_for_injection: Dict[Type[AbstractCommand], Type[AbstractCommandHandler]],
+            dependencies: Optional[Dict[str, Any]] = None,
+            defer_events: bool = messagebus_config.MESSAGEBUS_DEFER_EVENTS,
+            events_dispatcher: Optional[AbstractEventsDispatcher] = None,
+            middlewares: Sequence[AbstractMessageBusMiddleware] = ()
+    ) -> None:
+
+        self._uow_factory: Callable[[], AbstractUnitOfWork] = uow_factory
+        self._events_handlers_for_injection: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]] = (
+            events_handlers_for_injection
+        )
+        self._commands_handlers_for_injection: Dict[Type[AbstractCommand], Type[AbstractCommandHandler]] = (
+            commands_handlers_for_injection
+        )
+        self._dependencies: Optional[Dict[str, Any]] = dependencies
+        self._middlewares: Sequence[AbstractMessageBusMiddleware] = middlewares
+        self.events_dispatcher: Optional[AbstractEventsDispatcher] = events_dispatcher
+        if not events_dispatcher and defer_events:
+            self.events_dispatcher = DeferredEventsDispatcher(messagebus_factory=self._get_messagebus_for_events)
+
+    async def get_messagebus(self) -> MessageBus:
+        bootstrap: Bootstrap = Bootstrap(
+            uow=self._uow_factory(),
+            events_handlers_for_injection=self._events_handlers_for_injection,
+            commands_handlers_for_injection=self._commands_handlers_for_injection,
+            dependencies=self._dependencies,
+            events_dispatcher=self.events_dispatcher,
+            middlewares=self._middlewares
+        )
+
+        return await bootstrap.get_messagebus()
+
+    async def start(self) -> None:
+        if self.events_dispatcher:
+            await self.events_dispatcher.start()
+
+    async def stop(self) -> None:
+        if self.events_dispatcher:
+            await self.events_dispatcher.stop()
+
+    async def _get_messagebus_for_events(self) -> MessageBus:
+        """
+        Creates messagebus without events dispatcher for handling deferred events inline in background.
+        """
+
+        bootstrap: Bootstrap = Bootstrap(
+            uow=self._uow_factory(),
+            events_handlers_for_injection=self._events_handlers_for_injection,
+            commands_handlers_for_injection=self._commands_handlers_for_injection,
+            dependencies=self._dependencies,
+            middlewares=self._middlewares
+        )
+
+        return await bootstrap.get_messagebus()
+
+
+def merge_events_handlers_for_injection(
+        *events_handlers_for_injection: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]]
+) -> Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]]:
+
+    """
+    Merges events handlers of several domains, so that events of one domain could be handled by handlers of another.
+    """
+
+    merged_events_handlers: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]] = {}
+    for domain_events_handlers in events_handlers_for_injection:
+        for event_type, event_handlers in domain_events_handlers.items():
+            merged_events_handlers.setdefault(event_type, []).extend(event_handlers)
+
+    return merged_events_handlers
+
+
+def merge_commands_handlers_for_injection(
+        *commands_handlers_for_injection: Dict[Type[AbstractCommand], Type[AbstractCommandHandler]]
+) -> Dict[Type[AbstractCommand], Type[AbstractCommandHandler]]:
+
+    """
+    Merges commands handlers of several domains. Each command should be handled only by one handler, so command types
+    should not intersect between domains.
+    """
+
+    merged_commands_handlers: Dict[Type[AbstractCommand], Type[AbstractCommandHandler]] = {}
+    for domain_commands_handlers in commands_handlers_for_injection:
+        for command_type, command_handler in domain_commands_handlers.items():
+            assert command_type not in merged_commands_handlers, f'{command_type} already has a handler'
+            merged_commands_handlers[command_type] = command_handler
+
+    return merged_commands_handlers
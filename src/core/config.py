@@ -0,0 +1,14 @@
+from pydantic_settings import BaseSettings
+
+
+class MessageBusConfig(BaseSettings):
+    MESSAGEBUS_CONCURRENT_EVENTS: bool = False
+    MESSAGEBUS_MAX_CONCURRENT_HANDLERS: int = 10
+    MESSAGEBUS_HANDLER_TIMEOUT: float = 30
+    MESSAGEBUS_DEFER_EVENTS: bool = False
+    MESSAGEBUS_DEFERRED_EVENTS_BACKLOG: int = 1000
+    MESSAGEBUS_DEFERRED_EVENTS_WORKERS: int = 1
+    MESSAGEBUS_METRICS: bool = True
+
+
+messagebus_config: MessageBusConfig = MessageBusConfig()
@@ -7,3 +7,9 @@ class ErrorDetails:
     PERMISSION_DENIED: str = 'Permission denied'
     BAD_REQUEST: str = 'Bad Request'
     MESSAGEBUS_MESSAGE_ERROR: str = 'Message bus message should be eiter of Event type, or Command type'
+    EVENT_SERIALIZATION_ERROR: str = 'Event can not be serialized or deserialized'
+    UNIT_OF_WORK_ROLLBACK_ONLY_ERROR: str = 'Transaction can not be committed, because it was marked as rollback-only'
+    INVALID_CURSOR: str = 'Pagination cursor is invalid'
+    UNIT_OF_WORK_READ_ONLY_ERROR: str = 'Transaction can not be committed, because unit of work is read-only'
+    UNIT_OF_WORK_NOT_REENTRANT_ERROR: str = 'Commands can not be handled in one transaction by this unit of work'
+    INVALID_FIELDS: str = 'Requested fields are invalid'
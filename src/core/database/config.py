@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 
@@ -15,5 +16,29 @@ class DatabaseConfig(BaseSettings):
     DATABASE_AUTO_FLUSH: bool
     DATABASE_EXPIRE_ON_COMMIT: bool
 
+    # Pool settings, which are applied only to dialects with connections pool, not to sqlite:
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_USE_LIFO: bool = False
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100  # asyncpg prepared statements cache size per connection
+
+    # Connections are made through PgBouncer in transaction pooling mode, so that prepared statements are not cached
+    # and connections are not pooled by the application:
+    DATABASE_PGBOUNCER: bool = False
+
+    # Total count of connections for all workers. If provided, pool size and overflow of each worker are limited by
+    # the worker's share of the budget:
+    DATABASE_CONNECTIONS_BUDGET: Optional[int] = None
+    WORKERS: int = 1
+
+    # Read replica, which is used by views. If host is not provided, views are served by the primary database:
+    DATABASE_REPLICA_HOST: Optional[str] = None
+    DATABASE_REPLICA_PORT: Optional[int] = None
+
+    # Seconds, during which client is read from the primary database after a successful write request, so that it
+    # could see its own changes despite replication lag. Zero disables pinning:
+    DATABASE_READ_YOUR_WRITES_SECONDS: int = 0
+
 
 database_config: DatabaseConfig = DatabaseConfig()
@@ -1,39 +1,72 @@
+from typing import Optional
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, async_sessionmaker
 
 from src.core.database.config import database_config
+from src.core.database.pool import get_pool_options, register_pool_metrics
 
 
-"""
-Due to the fact, that sqlite is serverless and has no host, port and so on, there is a need to create
-database url in different patterns.
-"""
-DATABASE_URL: str
-if database_config.DATABASE_DIALECT == 'sqlite':
-    DATABASE_URL = '{}+{}:///{}'.format(
-        database_config.DATABASE_DIALECT,
-        database_config.DATABASE_DRIVER,
-        database_config.DATABASE_NAME,
-    )
-else:
-    DATABASE_URL = '{}+{}://{}:{}@{}:{}/{}'.format(
+def get_database_url(host: str, port: int) -> str:
+    """
+    Due to the fact, that sqlite is serverless and has no host, port and so on, there is a need to create
+    database url in different patterns.
+    """
+
+    if database_config.DATABASE_DIALECT == 'sqlite':
+        return '{}+{}:///{}'.format(
+            database_config.DATABASE_DIALECT,
+            database_config.DATABASE_DRIVER,
+            database_config.DATABASE_NAME,
+        )
+
+    return '{}+{}://{}:{}@{}:{}/{}'.format(
         database_config.DATABASE_DIALECT,
         database_config.DATABASE_DRIVER,
         database_config.DATABASE_USER,
         database_config.DATABASE_PASSWORD,
-        database_config.DATABASE_HOST,
-        database_config.DATABASE_PORT,
+        host,
+        port,
         database_config.DATABASE_NAME
     )
 
-engine: AsyncEngine = create_async_engine(
-    url=DATABASE_URL,
-    pool_pre_ping=database_config.DATABASE_POOL_PRE_PING,
-    pool_recycle=database_config.DATABASE_POOL_RECYCLE,
-    echo=database_config.DATABASE_ECHO,
-)
-
-session_factory: async_sessionmaker = async_sessionmaker(
-    bind=engine,
-    autoflush=database_config.DATABASE_AUTO_FLUSH,
-    expire_on_commit=database_config.DATABASE_EXPIRE_ON_COMMIT
-)
+
+def create_engine(url: str) -> AsyncEngine:
+    return create_async_engine(
+        url=url,
+        pool_pre_ping=database_config.DATABASE_POOL_PRE_PING,
+        pool_recycle=database_config.DATABASE_POOL_RECYCLE,
+        echo=database_config.DATABASE_ECHO,
+        **get_pool_options(config=database_config)
+    )
+
+
+def create_session_factory(bind: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(
+        bind=bind,
+        autoflush=database_config.DATABASE_AUTO_FLUSH,
+        expire_on_commit=database_config.DATABASE_EXPIRE_ON_COMMIT
+    )
+
+
+DATABASE_URL: str = get_database_url(host=database_config.DATABASE_HOST, port=database_config.DATABASE_PORT)
+
+engine: AsyncEngine = create_engine(url=DATABASE_URL)
+register_pool_metrics(engine=engine)
+session_factory: async_sessionmaker = create_session_factory(bind=engine)
+
+"""
+Read replica is used only by views. If it is not configured, or database is sqlite, views are served by the primary
+engine, so that replica_session_factory could be used unconditionally.
+"""
+REPLICA_DATABASE_URL: Optional[str] = None
+if database_config.DATABASE_REPLICA_HOST and database_config.DATABASE_DIALECT != 'sqlite':
+    REPLICA_DATABASE_URL = get_database_url(
+        host=database_config.DATABASE_REPLICA_HOST,
+        port=database_config.DATABASE_REPLICA_PORT or database_config.DATABASE_PORT
+    )
+
+replica_engine: AsyncEngine = engine
+replica_session_factory: async_sessionmaker = session_factory
+if REPLICA_DATABASE_URL:
+    replica_engine = create_engine(url=REPLICA_DATABASE_URL)
+    register_pool_metrics(engine=replica_engine, role='replica')
+    replica_session_factory = create_session_factory(bind=replica_engine)
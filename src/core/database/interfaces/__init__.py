@@ -1,2 +1,3 @@
 from src.core.database.interfaces.repositories import SQLAlchemyAbstractRepository
+from src.core.database.interfaces.queries import SQLAlchemyAbstractQueries
 from src.core.database.interfaces.units_of_work import SQLAlchemyAbstractUnitOfWork
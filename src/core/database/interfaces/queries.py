@@ -0,0 +1,51 @@
+from abc import ABC
+from typing import Optional, Sequence, Tuple
+from sqlalchemy import Table, Column, select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.interfaces import AbstractQueries
+from src.core.projection import Projection
+
+
+class SQLAlchemyAbstractQueries(AbstractQueries, ABC):
+    """
+    Queries interface for SQLAlchemy, from which should be inherited all other queries, which would be based on
+    SQLAlchemy Core statements. Rows are mapped to read models directly, bypassing ORM identity map.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session: AsyncSession = session
+
+    @staticmethod
+    def _project_columns(columns: Sequence[Column], projection: Optional[Projection]) -> Tuple[Column, ...]:
+        """
+        Returns columns of fields, requested by projection, so that other columns are never selected. Primary key is
+        always selected, because it is needed for keyset pagination, even if it is not returned to client.
+        """
+
+        if not projection:
+            return tuple(columns)
+
+        return tuple(column for column in columns if column.primary_key or projection.includes(column.name))
+
+    async def _get_approximate_count(self, table: Table) -> Optional[int]:
+        """
+        Returns approximate count of table rows without scanning the table. Postgres count is taken from planner
+        statistics, which are updated by autovacuum. Other dialects have no such statistics, so the greatest primary
+        key is used, which is an upper bound of rows count.
+        """
+
+        if self._session.get_bind().dialect.name == 'postgresql':
+            reltuples: Optional[float] = await self._session.scalar(
+                text('SELECT reltuples FROM pg_class WHERE oid = CAST(:table_name AS regclass)'),
+                {'table_name': table.name}
+            )
+
+            # Table was never analyzed:
+            if reltuples is None or reltuples < 0:
+                return None
+
+            return int(reltuples)
+
+        max_id: Optional[int] = await self._session.scalar(select(func.max(table.c.id)))
+        return max_id or 0
@@ -1,5 +1,11 @@
+import json
 from abc import ABC
+from typing import Any, Dict, Optional, Sequence, Iterable, Union
+from sqlalchemy import Insert, Integer, Subquery, select, func, literal, column
+from sqlalchemy.dialects.postgresql import ARRAY, Insert as PostgresInsert, insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import Insert as SQLiteInsert, insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
 
 from src.core.interfaces import AbstractRepository
 
@@ -12,3 +18,47 @@ class SQLAlchemyAbstractRepository(AbstractRepository, ABC):
 
     def __init__(self, session: AsyncSession) -> None:
         self._session: AsyncSession = session
+
+    async def _insert_if_not_exists(
+            self,
+            entity: Any,
+            values: Dict[str, Any],
+            options: Sequence[ORMOption] = ()
+    ) -> Optional[Any]:
+
+        """
+        Inserts row by one "INSERT ... ON CONFLICT DO NOTHING RETURNING" statement, so that violation of any unique
+        constraint, including one caused by concurrent request, results in None instead of an error, and no existence
+        check is needed before insert. Both Postgres and SQLite support the clause, each with its own insert construct.
+
+        Loader options could be used to skip loading relationships of the returned entity, which are known to be empty.
+        """
+
+        statement: Insert = self._insert(entity=entity).values(**values).on_conflict_do_nothing()
+        return (await self._session.execute(statement.returning(entity).options(*options))).scalar_one_or_none()
+
+    def _insert(self, entity: Any) -> Union[PostgresInsert, SQLiteInsert]:
+        """
+        Returns dialect specific insert construct, which supports "ON CONFLICT" clause.
+        """
+
+        if self._session.get_bind().dialect.name == 'sqlite':
+            return sqlite_insert(entity)
+
+        return postgresql_insert(entity)
+
+    def _ids_subquery(self, ids: Iterable[int]) -> Subquery:
+        """
+        Returns subquery with one "id" column, which rows are provided ids, bound as a single parameter, so that set
+        based statements do not depend on count of ids and do not exceed bind parameters limit of the driver. Postgres
+        unnests an array parameter, and SQLite reads a JSON array parameter by json_each().
+        """
+
+        if self._session.get_bind().dialect.name == 'sqlite':
+            return select(
+                column('value', Integer).label('id')
+            ).select_from(
+                func.json_each(json.dumps(list(ids)))
+            ).subquery()
+
+        return select(func.unnest(literal(list(ids), type_=ARRAY(Integer))).label('id')).subquery()
@@ -1,34 +1,113 @@
-from typing import Self
+from typing import Self, List, Optional, Type
+from types import TracebackType
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 
+from src.core.exceptions import UnitOfWorkRollbackOnlyError, UnitOfWorkReadOnlyError
 from src.core.interfaces import AbstractUnitOfWork
 from src.core.database.connection import session_factory as default_session_factory
+from src.core.outbox.models import OutboxMessageModel
+from src.core.outbox.repositories import SQLAlchemyOutboxRepository
 
 
 class SQLAlchemyAbstractUnitOfWork(AbstractUnitOfWork):
     """
     Unit of work interface for SQLAlchemy, from which should be inherited all other units of work,
     which would be based on SQLAlchemy logics.
+
+    Unit of work is reentrant: only the outermost "async with" creates a session, and all nested scopes reuse its
+    session and transaction. Commits in nested scopes only flush changes and request commit, which is performed on
+    the outermost scope exit. If nested scope fails or rollbacks, the whole transaction becomes rollback-only.
+
+    Read-only unit of work, which is used by views, starts its transaction with "SET TRANSACTION READ ONLY", so that
+    it could be served by a read replica, and can not be committed.
     """
 
-    def __init__(self, session_factory: async_sessionmaker = default_session_factory) -> None:
+    def __init__(self, session_factory: async_sessionmaker = default_session_factory, read_only: bool = False) -> None:
         super().__init__()
         self._session_factory: async_sessionmaker = session_factory
+        self._read_only: bool = read_only
+        self._depth: int = 0
+        self._commit_requested: bool = False
+        self._rollback_only: bool = False
 
     async def __aenter__(self) -> Self:
-        self._session: AsyncSession = self._session_factory()
+        if not self._depth:
+            self._session: AsyncSession = self._session_factory()
+            self._commit_requested = False
+            self._rollback_only = False
+
+            # Sqlite has no read-only transactions, so read-only unit of work is only protected from commits:
+            if self._read_only and self._session.get_bind().dialect.name != 'sqlite':
+                await self._session.execute(text('SET TRANSACTION READ ONLY'))
+
+        self._depth += 1
         return await super().__aenter__()
 
-    async def __aexit__(self, *args, **kwargs) -> None:
-        await super().__aexit__(*args, **kwargs)
-        await self._session.close()
+    async def __aexit__(
+            self,
+            exc_type: Optional[Type[BaseException]],
+            exc_value: Optional[BaseException],
+            traceback: Optional[TracebackType]
+    ) -> None:
+
+        self._depth -= 1
+        if exc_type:
+            self._rollback_only = True
+
+        if self._depth:
+            return
+
+        try:
+            if self._commit_requested and not self._rollback_only:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self._session.close()
+
+    @property
+    def is_reentrant(self) -> bool:
+        return True
+
+    @property
+    def is_nested(self) -> bool:
+        return self._depth > 1
+
+    @property
+    def is_read_only(self) -> bool:
+        return self._read_only
 
     async def commit(self) -> None:
+        """
+        Saves staged outbox messages in the same transaction, as all other changes, so that messages are published
+        only if changes were committed.
+        """
+
+        if self._read_only:
+            await self.rollback()
+            raise UnitOfWorkReadOnlyError
+
+        if self.is_nested:
+            await self._session.flush()
+            self._commit_requested = True
+            return
+
+        if self._rollback_only:
+            await self.rollback()
+            raise UnitOfWorkRollbackOnlyError
+
+        outbox_messages: List[OutboxMessageModel] = list(self.get_outbox_messages())
+        if outbox_messages:
+            await SQLAlchemyOutboxRepository(session=self._session).add_many(messages=outbox_messages)
+
         await self._session.commit()
+        self._commit_requested = False
 
     async def rollback(self) -> None:
         """
-        Rollbacks all uncommited changes.
+        Rollbacks all uncommited changes and discards outbox messages, which were not saved yet. In nested scope only
+        marks transaction as rollback-only.
 
         Uses self._session.expunge_all() to avoid sqlalchemy.orm.exc.DetachedInstanceError after session rollback,
         due to the fact that selected object is cached by Session. And self._session.rollback() deletes all Session
@@ -38,5 +117,12 @@ class SQLAlchemyAbstractUnitOfWork(AbstractUnitOfWork):
         https://pythonhint.com/post/1123713161982291/how-does-a-sqlalchemy-object-get-detached
         """
 
+        if self.is_nested:
+            self._rollback_only = True
+            return
+
+        self._outbox_messages.clear()
         self._session.expunge_all()
         await self._session.rollback()
+        self._commit_requested = False
+        self._rollback_only = False
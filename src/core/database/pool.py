@@ -0,0 +1,155 @@
+import time
+from typing import Dict, Any, Tuple, Optional
+from uuid import uuid4
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool, NullPool, Pool
+from sqlalchemy.pool.base import ConnectionPoolEntry
+
+from src.core.database.config import DatabaseConfig
+from src.core.metrics import MetricsRegistry, Histogram, Gauge, metrics_registry
+
+
+CHECKOUT_WAIT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5, 10, 30)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool, which records time, spent by each checkout on waiting for a free connection, including opening of
+    a new connection, if pool is not full yet.
+
+    Histogram and role of the pool are bound by register_pool_metrics, so that checkouts of primary and replica engines
+    are observed separately. They are carried over to the pool, which replaces this one on engine disposal.
+    """
+
+    checkout_wait: Optional[Histogram] = None
+    role: str = 'primary'
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started_at: float = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.checkout_wait is not None:
+                self.checkout_wait.observe(time.perf_counter() - started_at, role=self.role)
+
+    def recreate(self) -> 'TimedAsyncAdaptedQueuePool':
+        pool: QueuePool = super().recreate()
+        assert isinstance(pool, TimedAsyncAdaptedQueuePool)
+        pool.checkout_wait = self.checkout_wait
+        pool.role = self.role
+        return pool
+
+
+def get_pool_limits(config: DatabaseConfig) -> Tuple[int, int]:
+    """
+    Returns pool size and max overflow of one worker. If connections budget is provided, it is divided between
+    workers, and pool size and overflow are reduced to fit the worker's share.
+    """
+
+    pool_size: int = config.DATABASE_POOL_SIZE
+    max_overflow: int = config.DATABASE_MAX_OVERFLOW
+    if config.DATABASE_CONNECTIONS_BUDGET is None:
+        return pool_size, max_overflow
+
+    worker_budget: int = max(config.DATABASE_CONNECTIONS_BUDGET // max(config.WORKERS, 1), 1)
+    pool_size = min(pool_size, worker_budget)
+    max_overflow = min(max_overflow, worker_budget - pool_size)
+    return pool_size, max_overflow
+
+
+def get_prepared_statement_name() -> str:
+    """
+    Unique prepared statement name, which does not conflict with statements, prepared by other clients on the same
+    server connection behind PgBouncer, unlike asyncpg's default numeric names.
+    """
+
+    return f'__asyncpg_{uuid4()}__'
+
+
+def get_pgbouncer_options(config: DatabaseConfig) -> Dict[str, Any]:
+    """
+    Returns engine options for PgBouncer in transaction pooling mode, where subsequent transactions of one client
+    connection could be served by different server connections.
+
+    Connections are pooled by PgBouncer, so application does not keep its own pool. Prepared statements are neither
+    cached by asyncpg, nor by SQLAlchemy, and are named uniquely, because they could not be reused on another server
+    connection.
+    """
+
+    options: Dict[str, Any] = {'poolclass': NullPool}
+    if config.DATABASE_DRIVER == 'asyncpg':
+        options['connect_args'] = {
+            'statement_cache_size': 0,
+            'prepared_statement_cache_size': 0,
+            'prepared_statement_name_func': get_prepared_statement_name,
+        }
+
+    return options
+
+
+def get_pool_options(config: DatabaseConfig) -> Dict[str, Any]:
+    """
+    Returns engine options for connections pool. Sqlite is served by its own pool, so options are not applied to it.
+    """
+
+    if config.DATABASE_DIALECT == 'sqlite':
+        return {}
+
+    if config.DATABASE_PGBOUNCER:
+        return get_pgbouncer_options(config=config)
+
+    pool_size, max_overflow = get_pool_limits(config=config)
+    options: Dict[str, Any] = {
+        'poolclass': TimedAsyncAdaptedQueuePool,
+        'pool_size': pool_size,
+        'max_overflow': max_overflow,
+        'pool_timeout': config.DATABASE_POOL_TIMEOUT,
+        'pool_use_lifo': config.DATABASE_POOL_USE_LIFO,
+    }
+
+    if config.DATABASE_DRIVER == 'asyncpg':
+        options['connect_args'] = {'statement_cache_size': config.DATABASE_STATEMENT_CACHE_SIZE}
+
+    return options
+
+
+def register_pool_metrics(
+        engine: AsyncEngine,
+        registry: MetricsRegistry = metrics_registry,
+        role: str = 'primary'
+) -> None:
+
+    """
+    Exposes current state of the engine's queue pool, which is read from pool on each metrics rendering, and time,
+    spent by its checkouts on waiting for a connection. Pools of primary and replica engines are distinguished by role
+    label.
+    """
+
+    pool: Pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+
+    gauge: Gauge = registry.gauge(
+        name='database_pool_connections',
+        documentation='Connections of the worker pool by state.',
+        labels=('role', 'state')
+    )
+
+    def collect() -> None:
+        current_pool: Pool = engine.pool  # Pool is replaced by a new one on engine disposal.
+        assert isinstance(current_pool, QueuePool)
+        gauge.set(current_pool.size(), role=role, state='size')
+        gauge.set(current_pool.checkedin(), role=role, state='checked_in')
+        gauge.set(current_pool.checkedout(), role=role, state='checked_out')
+        gauge.set(max(current_pool.overflow(), 0), role=role, state='overflow')
+
+    registry.set_collector(name=f'database_pool_connections_{role}', collector=collect)
+
+    if isinstance(pool, TimedAsyncAdaptedQueuePool):
+        pool.checkout_wait = registry.histogram(
+            name='database_pool_checkout_wait_seconds',
+            documentation='Time, spent on waiting for a connection from the pool.',
+            labels=('role', ),
+            buckets=CHECKOUT_WAIT_BUCKETS
+        )
+        pool.role = role
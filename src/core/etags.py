@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from starlette.responses import Response
+
+
+@dataclass(frozen=True)
+class ETagConfig:
+    ETAG_HEADER: str = 'ETag'
+    ANY_ETAG: str = '*'
+    WEAK_ETAG_PREFIX: str = 'W/'
+
+
+def format_etag(version: int) -> str:
+    """
+    Entity tag is the quoted version of an entity, so that it changes on each update of the entity.
+    """
+
+    return f'"{version}"'
+
+
+def parse_if_match(if_match: Optional[str]) -> Optional[Tuple[int, ...]]:
+    """
+    Returns versions, listed in "If-Match" header, or None, if any version matches: header is absent or is "*".
+
+    "If-Match" uses strong comparison, so weak entity tags, as well as tags, which are not versions, never match. If
+    none of listed tags is a version, empty tuple is returned, and the precondition fails for any entity.
+    """
+
+    if not if_match or if_match.strip() == ETagConfig.ANY_ETAG:
+        return None
+
+    versions: Tuple[int, ...] = ()
+    for etag in if_match.split(','):
+        etag = etag.strip()
+        if etag.startswith(ETagConfig.WEAK_ETAG_PREFIX) or len(etag) < 3 or etag[0] != '"' or etag[-1] != '"':
+            continue
+
+        if etag[1:-1].isdigit():
+            versions += (int(etag[1:-1]), )
+
+    return versions
+
+
+def set_etag_header(response: Response, version: int) -> None:
+    response.headers[ETagConfig.ETAG_HEADER] = format_etag(version=version)
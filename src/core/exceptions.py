@@ -41,3 +41,31 @@ class ValidationError(DetailedHTTPException):
 class MessageBusMessageError(DetailedHTTPException):
     STATUS_CODE = status.HTTP_500_INTERNAL_SERVER_ERROR
     DETAIL = ErrorDetails.MESSAGEBUS_MESSAGE_ERROR
+
+
+class EventSerializationError(DetailedHTTPException):
+    STATUS_CODE = status.HTTP_500_INTERNAL_SERVER_ERROR
+    DETAIL = ErrorDetails.EVENT_SERIALIZATION_ERROR
+
+
+class UnitOfWorkRollbackOnlyError(DetailedHTTPException):
+    STATUS_CODE = status.HTTP_500_INTERNAL_SERVER_ERROR
+    DETAIL = ErrorDetails.UNIT_OF_WORK_ROLLBACK_ONLY_ERROR
+
+
+class UnitOfWorkReadOnlyError(DetailedHTTPException):
+    STATUS_CODE = status.HTTP_500_INTERNAL_SERVER_ERROR
+    DETAIL = ErrorDetails.UNIT_OF_WORK_READ_ONLY_ERROR
+
+
+class UnitOfWorkNotReentrantError(DetailedHTTPException):
+    STATUS_CODE = status.HTTP_500_INTERNAL_SERVER_ERROR
+    DETAIL = ErrorDetails.UNIT_OF_WORK_NOT_REENTRANT_ERROR
+
+
+class InvalidCursorError(BadRequestError):
+    DETAIL = ErrorDetails.INVALID_CURSOR
+
+
+class InvalidFieldsError(BadRequestError):
+    DETAIL = ErrorDetails.INVALID_FIELDS
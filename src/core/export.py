@@ -0,0 +1,82 @@
+import csv
+import io
+import json
+from dataclasses import dataclass, asdict
+from typing import AsyncIterator, Callable, Optional, Sequence, Any, Dict
+from starlette.responses import StreamingResponse
+
+
+@dataclass(frozen=True)
+class ExportConfig:
+    NDJSON_MEDIA_TYPE: str = 'application/x-ndjson'
+    CSV_MEDIA_TYPE: str = 'text/csv'
+    YIELD_PER: int = 1000  # rows fetched from server-side cursor at once and sent as one chunk
+
+    @classmethod
+    def media_types(cls) -> Sequence[str]:
+        return cls.NDJSON_MEDIA_TYPE, cls.CSV_MEDIA_TYPE
+
+
+def parse_export_media_type(accept: Optional[str]) -> Optional[str]:
+    """
+    Returns the first export media type, listed in "Accept" header, or None, if client expects a regular JSON response.
+    """
+
+    if not accept:
+        return None
+
+    for media_range in accept.split(','):
+        media_type: str = media_range.split(';')[0].strip().lower()
+        if media_type in ExportConfig.media_types():
+            return media_type
+
+    return None
+
+
+async def serialize_ndjson(
+        partitions: AsyncIterator[Sequence[Any]],
+        to_json: Callable[[Any], Dict[str, Any]] = asdict
+) -> AsyncIterator[str]:
+
+    async for partition in partitions:
+        yield ''.join(json.dumps(to_json(item)) + '\n' for item in partition)
+
+
+async def serialize_csv(
+        partitions: AsyncIterator[Sequence[Any]],
+        header: Sequence[str],
+        to_row: Callable[[Any], Sequence[Any]]
+) -> AsyncIterator[str]:
+
+    buffer: io.StringIO = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    yield buffer.getvalue()
+
+    async for partition in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(to_row(item) for item in partition)
+        yield buffer.getvalue()
+
+
+def create_export_response(
+        partitions: AsyncIterator[Sequence[Any]],
+        media_type: str,
+        csv_header: Sequence[str],
+        to_csv_row: Callable[[Any], Sequence[Any]],
+        to_json: Callable[[Any], Dict[str, Any]] = asdict
+) -> StreamingResponse:
+
+    """
+    Streams partitions of read models as they are fetched from the database, one chunk per partition, so that memory
+    usage does not depend on rows count, and response starts before the query is exhausted.
+    """
+
+    content: AsyncIterator[str]
+    if media_type == ExportConfig.CSV_MEDIA_TYPE:
+        content = serialize_csv(partitions=partitions, header=csv_header, to_row=to_csv_row)
+    else:
+        content = serialize_ndjson(partitions=partitions, to_json=to_json)
+
+    return StreamingResponse(content=content, media_type=media_type)
@@ -1,6 +1,9 @@
 from src.core.interfaces.units_of_work import AbstractUnitOfWork
 from src.core.interfaces.repositories import AbstractRepository
+from src.core.interfaces.queries import AbstractQueries
 from src.core.interfaces.models import AbstractModel
 from src.core.interfaces.handlers import AbstractEventHandler, AbstractCommandHandler
 from src.core.interfaces.events import AbstractEvent
 from src.core.interfaces.commands import AbstractCommand
+from src.core.interfaces.dispatchers import AbstractEventsDispatcher
+from src.core.interfaces.middlewares import AbstractMessageBusMiddleware
@@ -0,0 +1,25 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.core.interfaces.events import AbstractEvent
+
+
+class AbstractEventsDispatcher(ABC):
+    """
+    Interface for any events dispatcher, to which messagebus passes events, raised by commands handlers, instead of
+    handling them inline.
+    """
+
+    @abstractmethod
+    async def submit(self, events: List[AbstractEvent]) -> bool:
+        """
+        Accepts events for handling. Returns False, if events can not be accepted and should be handled by the caller.
+        """
+
+        raise NotImplementedError
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
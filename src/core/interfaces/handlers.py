@@ -9,8 +9,13 @@ from src.core.interfaces.events import AbstractEvent
 class AbstractEventHandler(ABC):
     """
     Abstract event handler class, from which every event handler should be inherited from.
+
+    Handlers, which do not work with unit of work, should set CONCURRENCY_SAFE to True, so that messagebus in
+    concurrent mode could run them concurrently with other handlers of the same event.
     """
 
+    CONCURRENCY_SAFE: bool = False
+
     @abstractmethod
     def __init__(self, uow: AbstractUnitOfWork) -> None:
         raise NotImplementedError
@@ -0,0 +1,26 @@
+from abc import ABC, abstractmethod
+from typing import Callable, Awaitable, TYPE_CHECKING
+
+from src.core.interfaces.messages import Message
+
+if TYPE_CHECKING:
+    from src.core.messagebus import MessageBus
+
+
+class AbstractMessageBusMiddleware(ABC):
+    """
+    Interface for any messagebus middleware, which wraps handling of each command and event.
+
+    call_next handles the message by the next middleware or, for the last one, by the messagebus itself, and returns
+    count of events, produced by message handlers.
+    """
+
+    @abstractmethod
+    async def __call__(
+            self,
+            messagebus: 'MessageBus',
+            message: Message,
+            call_next: Callable[[Message], Awaitable[int]]
+    ) -> int:
+
+        raise NotImplementedError
@@ -0,0 +1,10 @@
+from abc import ABC
+
+
+class AbstractQueries(ABC):
+    """
+    Interface for read side queries, which are used by views, according CQRS.
+
+    Unlike repositories, queries do not return domain models, but read models, which contain only those fields,
+    which are returned to the client, and which are not tracked by any storage session.
+    """
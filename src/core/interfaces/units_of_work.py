@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Self, List, Generator
 
 from src.core.interfaces.events import AbstractEvent
+from src.core.outbox.models import OutboxMessageModel
 
 
 class AbstractUnitOfWork(ABC):
@@ -13,12 +14,23 @@ class AbstractUnitOfWork(ABC):
         # Creating events storage for retrieve them in MessageBus:
         self._events: List[AbstractEvent] = []
 
+        # Creating outbox messages storage, which should be saved in the same transaction, as aggregates changes:
+        self._outbox_messages: List[OutboxMessageModel] = []
+
     async def __aenter__(self) -> Self:
         return self
 
     async def __aexit__(self, *args, **kwargs) -> None:
         await self.rollback()
 
+    @property
+    def is_reentrant(self) -> bool:
+        """
+        Whether nested scopes of unit of work join transaction of the outermost one, instead of committing on their own.
+        """
+
+        return False
+
     @abstractmethod
     async def commit(self) -> None:
         raise NotImplementedError
@@ -38,3 +50,14 @@ class AbstractUnitOfWork(ABC):
 
         while self._events:
             yield self._events.pop(0)
+
+    async def add_outbox_message(self, message: OutboxMessageModel) -> None:
+        self._outbox_messages.append(message)
+
+    def get_outbox_messages(self) -> Generator[OutboxMessageModel, None, None]:
+        """
+        Retrieves outbox messages, staged for saving on commit, the same way as events.
+        """
+
+        while self._outbox_messages:
+            yield self._outbox_messages.pop(0)
@@ -1,53 +1,319 @@
-from typing import Dict, List, Type, Any
-from queue import Queue
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Mapping, List, Type, Any, Deque, Optional, Callable, Awaitable, Sequence
 
-from src.core.exceptions import MessageBusMessageError
+from src.core.config import messagebus_config
+from src.core.exceptions import MessageBusMessageError, UnitOfWorkNotReentrantError
 from src.core.interfaces import AbstractUnitOfWork
 from src.core.interfaces.commands import AbstractCommand
+from src.core.interfaces.dispatchers import AbstractEventsDispatcher
 from src.core.interfaces.events import AbstractEvent
 from src.core.interfaces.handlers import AbstractEventHandler, AbstractCommandHandler
 from src.core.interfaces.messages import Message
+from src.core.interfaces.middlewares import AbstractMessageBusMiddleware
+
+
+logger: logging.Logger = logging.getLogger(__name__)
 
 
 class MessageBus:
+    """
+    Handles commands and events, raised during their handling, in the context of provided unit of work.
+
+    By default, event handlers are awaited sequentially, because they share the same unit of work. In concurrent mode
+    event handlers, which are marked as CONCURRENCY_SAFE, are run concurrently with each other, limited by
+    max_concurrent_handlers and handler_timeout, while other handlers of the event are still awaited sequentially.
+
+    If events dispatcher is provided, events, raised by command handler, are not handled inline, but are passed to
+    dispatcher, so that command result could be returned to the client without waiting for events handling. Events are
+    passed to dispatcher only after changes of the command were committed. Events of a batch of commands are passed to
+    dispatcher or handled inline only after the whole batch was committed, and they are discarded, if the batch fails.
+
+    Middlewares wrap handling of each message in provided order, the first one being the outermost.
+    """
 
     def __init__(
         self,
         uow: AbstractUnitOfWork,
-        event_handlers: Dict[Type[AbstractEvent], List[AbstractEventHandler]],
-        command_handlers: Dict[Type[AbstractCommand], AbstractCommandHandler],
+        event_handlers: Mapping[Type[AbstractEvent], List[AbstractEventHandler]],
+        command_handlers: Mapping[Type[AbstractCommand], AbstractCommandHandler],
+        concurrent_events: bool = messagebus_config.MESSAGEBUS_CONCURRENT_EVENTS,
+        max_concurrent_handlers: int = messagebus_config.MESSAGEBUS_MAX_CONCURRENT_HANDLERS,
+        handler_timeout: float = messagebus_config.MESSAGEBUS_HANDLER_TIMEOUT,
+        events_dispatcher: Optional[AbstractEventsDispatcher] = None,
+        middlewares: Sequence[AbstractMessageBusMiddleware] = (),
     ) -> None:
 
         self._uow = uow
         self._event_handlers = event_handlers
         self._command_handlers = command_handlers
-        self._queue: Queue = Queue()
+        self._queue: Deque[Message] = deque()
         self._command_result: Any = None
+        self._deferred_events: List[AbstractEvent] = []
+        self._in_batch: bool = False
+
+        self._concurrent_events: bool = concurrent_events
+        self._handler_timeout: float = handler_timeout
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent_handlers)
+        self._events_dispatcher: Optional[AbstractEventsDispatcher] = events_dispatcher
+
+        self._handle_message: Callable[[Message], Awaitable[int]] = self._dispatch
+        for middleware in reversed(middlewares):
+            self._handle_message = self._wrap(middleware=middleware, call_next=self._handle_message)
 
     async def handle(self, message: Message) -> None:
-        self._queue.put(message)
-        while not self._queue.empty():
-            message = self._queue.get()
-            if isinstance(message, AbstractEvent):
-                await self._handle_event(event=message)
-            elif isinstance(message, AbstractCommand):
-                await self._handle_command(command=message)
-            else:
-                raise MessageBusMessageError
-
-    async def _handle_event(self, event: AbstractEvent) -> None:
+        self._queue.append(message)
+        await self._handle_queue()
+        if not self._in_batch:
+            await self._release_deferred_events()
+
+    async def handle_many(self, commands: Sequence[AbstractCommand]) -> List[Any]:
+        """
+        Handles provided commands one by one within one unit of work scope and returns their results in the same
+        order. Commands changes are committed together, and handling stops on the first failed command, which
+        rollbacks changes of all commands and discards all events, raised by them.
+
+        Commands handlers open their own scopes of unit of work, so batch is atomic only if these scopes join the batch
+        transaction. Otherwise, batch is rejected before any command is handled, not to commit part of it.
+        """
+
+        if not self._uow.is_reentrant:
+            raise UnitOfWorkNotReentrantError
+
+        results: List[Any] = []
+        self._in_batch = True
+        try:
+            async with self._uow:
+                for command in commands:
+                    await self.handle(message=command)
+                    results.append(self._command_result)
+
+                await self._uow.commit()
+        except BaseException:
+            self._discard_pending_messages()
+            raise
+        finally:
+            self._in_batch = False
+
+        await self._release_deferred_events()
+        return results
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    async def _handle_queue(self) -> None:
+        while self._queue:
+            message: Message = self._queue.popleft()
+            await self._handle_message(message)
+
+    async def _release_deferred_events(self) -> None:
+        """
+        Passes events, raised by already committed commands, to dispatcher. If there is no dispatcher, or it is not
+        able to accept them, they are handled inline.
+        """
+
+        if not self._deferred_events:
+            return
+
+        events: List[AbstractEvent] = self._deferred_events
+        self._deferred_events = []
+        if self._events_dispatcher and await self._events_dispatcher.submit(events=events):
+            return
+
+        self._queue.extend(events)
+        await self._handle_queue()
+
+    def _discard_pending_messages(self) -> None:
+        """
+        Discards messages and events, which were not handled yet, including events, left in unit of work by the failed
+        handler, so that they are not handled by the next call, if messagebus is reused.
+        """
+
+        self._queue.clear()
+        self._deferred_events.clear()
+        for _ in self._uow.get_events():
+            pass
+
+    def _wrap(
+            self,
+            middleware: AbstractMessageBusMiddleware,
+            call_next: Callable[[Message], Awaitable[int]]
+    ) -> Callable[[Message], Awaitable[int]]:
+
+        async def handle_message(message: Message) -> int:
+            return await middleware(messagebus=self, message=message, call_next=call_next)
+
+        return handle_message
+
+    async def _dispatch(self, message: Message) -> int:
+        """
+        Handles message by appropriate handlers and returns count of events, produced by them.
+        """
+
+        if isinstance(message, AbstractEvent):
+            return await self._handle_event(event=message)
+        elif isinstance(message, AbstractCommand):
+            return await self._handle_command(command=message)
+        else:
+            raise MessageBusMessageError
+
+    async def _handle_event(self, event: AbstractEvent) -> int:
+        handlers: List[AbstractEventHandler] = self._event_handlers[type(event)]
+        concurrent_handlers: List[AbstractEventHandler] = []
+        produced_events: int = 0
         handler: AbstractEventHandler
-        for handler in self._event_handlers[type(event)]:
+        for handler in handlers:
+            if self._concurrent_events and handler.CONCURRENCY_SAFE:
+                concurrent_handlers.append(handler)
+                continue
+
             await handler(event)
-            for event in self._uow.get_events():
-                self._queue.put_nowait(event)
+            produced_events += self._collect_events()
+
+        if concurrent_handlers:
+            await self._handle_event_concurrently(event=event, handlers=concurrent_handlers)
+            produced_events += self._collect_events()
+
+        return produced_events
 
-    async def _handle_command(self, command: AbstractCommand) -> None:
+    async def _handle_event_concurrently(self, event: AbstractEvent, handlers: List[AbstractEventHandler]) -> None:
+        """
+        Runs all provided handlers till the end, even if some of them failed, after which raises the first error,
+        if any, to keep the same behaviour as in sequential mode.
+        """
+
+        results: List[Optional[BaseException]] = await asyncio.gather(
+            *[self._run_event_handler(handler=handler, event=event) for handler in handlers],
+            return_exceptions=True
+        )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _run_event_handler(self, handler: AbstractEventHandler, event: AbstractEvent) -> None:
+        async with self._semaphore:
+            await asyncio.wait_for(handler(event), timeout=self._handler_timeout)
+
+    async def _handle_command(self, command: AbstractCommand) -> int:
         handler: AbstractCommandHandler = self._command_handlers[type(command)]
         self._command_result = await handler(command)
+        if self._events_dispatcher or self._in_batch:
+            # Command could be a part of not yet committed batch, so events are released after the commit:
+            events: List[AbstractEvent] = list(self._uow.get_events())
+            self._deferred_events.extend(events)
+            return len(events)
+
+        return self._collect_events()
+
+    def _collect_events(self) -> int:
+        collected_events: int = 0
         for event in self._uow.get_events():
-            self._queue.put_nowait(event)
+            self._queue.append(event)
+            collected_events += 1
+
+        return collected_events
 
     @property
     def command_result(self) -> Any:
         return self._command_result
+
+
+@dataclass(frozen=True)
+class DeferredEventsMetrics:
+    backlog_size: int
+    backlog_max_size: int
+    submitted: int
+    rejected: int
+    processed: int
+    failed: int
+
+
+class DeferredEventsDispatcher(AbstractEventsDispatcher):
+    """
+    Per-worker bounded backlog of events, raised by commands handlers, which are handled by background tasks after
+    the response had been returned to the client.
+
+    Each batch of events is handled by a new messagebus with its own unit of work, because the messagebus, which
+    handled the command, could still be used during request handling. If backlog is full or dispatcher is not running,
+    events are rejected and should be handled inline by the caller.
+    """
+
+    def __init__(
+            self,
+            messagebus_factory: Callable[[], Awaitable[MessageBus]],
+            max_backlog: int = messagebus_config.MESSAGEBUS_DEFERRED_EVENTS_BACKLOG,
+            workers: int = messagebus_config.MESSAGEBUS_DEFERRED_EVENTS_WORKERS
+    ) -> None:
+
+        self._messagebus_factory: Callable[[], Awaitable[MessageBus]] = messagebus_factory
+        self._backlog: asyncio.Queue[List[AbstractEvent]] = asyncio.Queue(maxsize=max_backlog)
+        self._workers_count: int = workers
+        self._workers: List[asyncio.Task] = []
+
+        self._submitted: int = 0
+        self._rejected: int = 0
+        self._processed: int = 0
+        self._failed: int = 0
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    async def submit(self, events: List[AbstractEvent]) -> bool:
+        if not self.is_running:
+            self._rejected += 1
+            return False
+
+        try:
+            self._backlog.put_nowait(events)
+        except asyncio.QueueFull:
+            self._rejected += 1
+            return False
+
+        self._submitted += 1
+        return True
+
+    async def start(self) -> None:
+        self._workers = [asyncio.create_task(self._work()) for _ in range(self._workers_count)]
+
+    async def stop(self) -> None:
+        """
+        Handles all events, which are left in the backlog, after which stops background tasks.
+        """
+
+        await self._backlog.join()
+        for worker in self._workers:
+            worker.cancel()
+
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _work(self) -> None:
+        while True:
+            events: List[AbstractEvent] = await self._backlog.get()
+            try:
+                messagebus: MessageBus = await self._messagebus_factory()
+                for event in events:
+                    await messagebus.handle(event)
+
+                self._processed += 1
+            except Exception:
+                self._failed += 1
+                logger.exception('Failed to handle deferred events %s', events)
+            finally:
+                self._backlog.task_done()
+
+    @property
+    def metrics(self) -> DeferredEventsMetrics:
+        return DeferredEventsMetrics(
+            backlog_size=self._backlog.qsize(),
+            backlog_max_size=self._backlog.maxsize,
+            submitted=self._submitted,
+            rejected=self._rejected,
+            processed=self._processed,
+            failed=self._failed
+        )
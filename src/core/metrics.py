@@ -0,0 +1,202 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Dict, Tuple, Sequence, List, Iterator, Callable, Optional, TypeVar, Type
+
+
+LabelsValues = Tuple[str, ...]
+MetricType = TypeVar('MetricType', bound='AbstractMetric')
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class AbstractMetric(ABC):
+    """
+    Base in-process metric, which values are stored per labels values and rendered in Prometheus text format.
+    Metrics are not shared between processes, so each worker exposes its own values.
+    """
+
+    TYPE: str
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labels: Tuple[str, ...] = tuple(labels)
+
+    def render(self) -> str:
+        lines: List[str] = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} {self.TYPE}']
+        lines.extend(self._samples())
+        return '\n'.join(lines)
+
+    def _get_labels_values(self, labels: Dict[str, str]) -> LabelsValues:
+        assert set(labels) == set(self.labels), f'{self.name} expects labels {self.labels}, got {tuple(labels)}'
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def _format_labels(self, labels_values: LabelsValues, extra: Optional[Dict[str, str]] = None) -> str:
+        pairs: List[Tuple[str, str]] = list(zip(self.labels, labels_values))
+        if extra:
+            pairs.extend(extra.items())
+
+        if not pairs:
+            return ''
+
+        escaped: str = ','.join(
+            '{}="{}"'.format(label, value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+            for label, value in pairs
+        )
+
+        return '{' + escaped + '}'
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        raise NotImplementedError
+
+
+class Counter(AbstractMetric):
+    TYPE = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name=name, documentation=documentation, labels=labels)
+        self._values: Dict[LabelsValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        labels_values: LabelsValues = self._get_labels_values(labels=labels)
+        self._values[labels_values] = self._values.get(labels_values, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._get_labels_values(labels=labels), 0)
+
+    def _samples(self) -> Iterator[str]:
+        for labels_values, value in self._values.items():
+            yield f'{self.name}{self._format_labels(labels_values)} {value}'
+
+
+class Gauge(AbstractMetric):
+    TYPE = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()) -> None:
+        super().__init__(name=name, documentation=documentation, labels=labels)
+        self._values: Dict[LabelsValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._get_labels_values(labels=labels)] = value
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._get_labels_values(labels=labels), 0)
+
+    def _samples(self) -> Iterator[str]:
+        for labels_values, value in self._values.items():
+            yield f'{self.name}{self._format_labels(labels_values)} {value}'
+
+
+@dataclass
+class HistogramValue:
+    buckets: List[int]
+    sum: float = 0
+    count: int = 0
+
+
+class Histogram(AbstractMetric):
+    TYPE = 'histogram'
+
+    def __init__(
+            self,
+            name: str,
+            documentation: str,
+            labels: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+
+        super().__init__(name=name, documentation=documentation, labels=labels)
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self._values: Dict[LabelsValues, HistogramValue] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        labels_values: LabelsValues = self._get_labels_values(labels=labels)
+        histogram_value: Optional[HistogramValue] = self._values.get(labels_values)
+        if not histogram_value:
+            histogram_value = HistogramValue(buckets=[0] * len(self.buckets))
+            self._values[labels_values] = histogram_value
+
+        # Buckets are stored not cumulative, to increment only one of them on each observation:
+        bucket_index: int = bisect_left(self.buckets, value)
+        if bucket_index < len(self.buckets):
+            histogram_value.buckets[bucket_index] += 1
+
+        histogram_value.sum += value
+        histogram_value.count += 1
+
+    def get(self, **labels: str) -> HistogramValue:
+        return self._values.get(self._get_labels_values(labels=labels), HistogramValue(buckets=[0] * len(self.buckets)))
+
+    def _samples(self) -> Iterator[str]:
+        for labels_values, value in self._values.items():
+            cumulative_count: int = 0
+            for bound, bucket_count in zip(self.buckets, value.buckets):
+                cumulative_count += bucket_count
+                yield f'{self.name}_bucket{self._format_labels(labels_values, {"le": str(bound)})} {cumulative_count}'
+
+            yield f'{self.name}_bucket{self._format_labels(labels_values, {"le": "+Inf"})} {value.count}'
+            yield f'{self.name}_sum{self._format_labels(labels_values)} {value.sum}'
+            yield f'{self.name}_count{self._format_labels(labels_values)} {value.count}'
+
+
+class MetricsRegistry:
+    """
+    Process-wide registry of metrics. Metrics are created on the first request by name and reused afterwards, so
+    that they could be declared at module level by any module.
+
+    Collectors are called before rendering to update metrics, which values are stored outside the registry.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, AbstractMetric] = {}
+        self._collectors: Dict[str, Callable[[], None]] = {}
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(metric_class=Counter, name=name, documentation=documentation, labels=labels)
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(metric_class=Gauge, name=name, documentation=documentation, labels=labels)
+
+    def histogram(
+            self,
+            name: str,
+            documentation: str,
+            labels: Sequence[str] = (),
+            buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+
+        if name not in self._metrics:
+            self._metrics[name] = Histogram(name=name, documentation=documentation, labels=labels, buckets=buckets)
+
+        histogram: AbstractMetric = self._metrics[name]
+        assert isinstance(histogram, Histogram), f'{name} is already registered as {histogram.TYPE}'
+        return histogram
+
+    def set_collector(self, name: str, collector: Callable[[], None]) -> None:
+        self._collectors[name] = collector
+
+    def render(self) -> str:
+        for collector in self._collectors.values():
+            collector()
+
+        return '\n'.join(metric.render() for metric in self._metrics.values()) + '\n'
+
+    def _get_or_create(
+            self,
+            metric_class: Type[MetricType],
+            name: str,
+            documentation: str,
+            labels: Sequence[str]
+    ) -> MetricType:
+
+        if name not in self._metrics:
+            self._metrics[name] = metric_class(name=name, documentation=documentation, labels=labels)
+
+        metric: AbstractMetric = self._metrics[name]
+        assert isinstance(metric, metric_class), f'{name} is already registered as {metric.TYPE}'
+        return metric
+
+
+metrics_registry: MetricsRegistry = MetricsRegistry()
@@ -0,0 +1,107 @@
+import time
+from typing import Callable, Awaitable, Tuple, TYPE_CHECKING
+
+from src.core.interfaces import AbstractCommand, AbstractEvent, AbstractMessageBusMiddleware
+from src.core.interfaces.messages import Message
+from src.core.metrics import MetricsRegistry, Histogram, Counter, Gauge, metrics_registry
+
+if TYPE_CHECKING:
+    from src.core.messagebus import MessageBus, DeferredEventsDispatcher, DeferredEventsMetrics
+
+
+QUEUE_DEPTH_BUCKETS: Tuple[float, ...] = (0, 1, 2, 5, 10, 25, 50, 100)
+
+
+class MessageBusMetricsMiddleware(AbstractMessageBusMiddleware):
+    """
+    Records per message type handling latency, errors and count of produced events, and messagebus queue depth at
+    the moment of message handling.
+    """
+
+    def __init__(self, registry: MetricsRegistry = metrics_registry) -> None:
+        self._duration: Histogram = registry.histogram(
+            name='messagebus_message_duration_seconds',
+            documentation='Duration of message handling, including handling by nested middlewares.',
+            labels=('kind', 'message_type')
+        )
+
+        self._errors: Counter = registry.counter(
+            name='messagebus_message_errors_total',
+            documentation='Count of messages, which handling failed.',
+            labels=('kind', 'message_type', 'error')
+        )
+
+        self._produced_events: Counter = registry.counter(
+            name='messagebus_produced_events_total',
+            documentation='Count of events, produced by message handlers.',
+            labels=('kind', 'message_type')
+        )
+
+        self._queue_depth: Histogram = registry.histogram(
+            name='messagebus_queue_depth',
+            documentation='Count of messages, waiting in messagebus queue, when message handling starts.',
+            labels=('kind', ),
+            buckets=QUEUE_DEPTH_BUCKETS
+        )
+
+    async def __call__(
+            self,
+            messagebus: 'MessageBus',
+            message: Message,
+            call_next: Callable[[Message], Awaitable[int]]
+    ) -> int:
+
+        kind: str = 'unknown'
+        if isinstance(message, AbstractCommand):
+            kind = 'command'
+        elif isinstance(message, AbstractEvent):
+            kind = 'event'
+
+        message_type: str = type(message).__name__
+        self._queue_depth.observe(messagebus.queue_size, kind=kind)
+        started_at: float = time.perf_counter()
+        try:
+            produced_events: int = await call_next(message)
+        except Exception as e:
+            self._errors.inc(kind=kind, message_type=message_type, error=type(e).__name__)
+            raise
+        finally:
+            self._duration.observe(time.perf_counter() - started_at, kind=kind, message_type=message_type)
+
+        self._produced_events.inc(produced_events, kind=kind, message_type=message_type)
+        return produced_events
+
+
+def register_deferred_events_metrics(
+        events_dispatcher: 'DeferredEventsDispatcher',
+        registry: MetricsRegistry = metrics_registry
+) -> None:
+
+    """
+    Exposes deferred events dispatcher metrics, which are read from dispatcher on each metrics rendering. Backlog state
+    is exposed as gauge, while counts of events batches by outcome only grow, so they are exposed as counter.
+    """
+
+    backlog: Gauge = registry.gauge(
+        name='messagebus_deferred_events_backlog',
+        documentation='Deferred events dispatcher backlog size and its limit.',
+        labels=('state', )
+    )
+
+    batches: Counter = registry.counter(
+        name='messagebus_deferred_events_batches_total',
+        documentation='Count of deferred events batches by outcome.',
+        labels=('outcome', )
+    )
+
+    def collect() -> None:
+        metrics: 'DeferredEventsMetrics' = events_dispatcher.metrics
+        backlog.set(metrics.backlog_size, state='size')
+        backlog.set(metrics.backlog_max_size, state='max_size')
+
+        # Totals are counted by dispatcher, so counter is incremented by their growth since the previous rendering:
+        for outcome in ('submitted', 'rejected', 'processed', 'failed'):
+            total: int = getattr(metrics, outcome)
+            batches.inc(total - batches.get(outcome=outcome), outcome=outcome)
+
+    registry.set_collector(name='messagebus_deferred_events', collector=collect)
@@ -0,0 +1,15 @@
+from dataclasses import dataclass, field
+from typing import Dict, Any
+
+from src.core.interfaces.models import AbstractModel
+
+
+@dataclass
+class OutboxMessageModel(AbstractModel):
+    """
+    Message, which should be published to Celery as a task, after transaction, in which it was added, is committed.
+    """
+
+    task: str
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    id: int = 0
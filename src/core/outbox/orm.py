@@ -0,0 +1,15 @@
+from sqlalchemy import Table, Column, Integer, String, DateTime, JSON
+from datetime import datetime, timezone
+
+from src.core.database.metadata import mapper_registry
+
+
+outbox_table = Table(
+    'outbox',
+    mapper_registry.metadata,
+    Column('id', Integer, primary_key=True, autoincrement=True, nullable=False, unique=True),
+    Column('task', String(255), nullable=False),
+    Column('kwargs', JSON, nullable=False),
+    # Default is called for each inserted row, so that messages keep time of their own transactions:
+    Column('created_at', DateTime(timezone=True), nullable=False, default=lambda: datetime.now(tz=timezone.utc)),
+)
@@ -0,0 +1,41 @@
+from typing import List, Sequence
+from sqlalchemy import insert, select, delete, Result, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.outbox.models import OutboxMessageModel
+from src.core.outbox.orm import outbox_table
+
+
+class SQLAlchemyOutboxRepository:
+    """
+    Repository for outbox messages. Uses Core statements instead of ORM mapping, because messages are written and
+    relayed in batches and never loaded as domain models for changing.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session: AsyncSession = session
+
+    async def add_many(self, messages: Sequence[OutboxMessageModel]) -> None:
+        await self._session.execute(
+            insert(outbox_table),
+            [await message.to_dict(exclude={'id'}) for message in messages]
+        )
+
+    async def list_unpublished(self, limit: int) -> List[OutboxMessageModel]:
+        """
+        Selects the oldest messages and locks them till the end of the transaction. Rows, already locked by other
+        relays, are skipped, so that several relays could publish messages concurrently without duplicates.
+        """
+
+        result: Result = await self._session.execute(
+            select(outbox_table.c.id, outbox_table.c.task, outbox_table.c.kwargs)
+            .order_by(outbox_table.c.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+
+        rows: Sequence[Row] = result.all()
+        return [OutboxMessageModel(id=row.id, task=row.task, kwargs=row.kwargs) for row in rows]
+
+    async def delete_many(self, ids: Sequence[int]) -> None:
+        await self._session.execute(delete(outbox_table).where(outbox_table.c.id.in_(ids)))
@@ -0,0 +1,88 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Generic, TypeVar, List, Optional, Callable, Dict, Any
+from starlette.responses import Response
+
+from src.core.exceptions import InvalidCursorError
+
+
+ItemType = TypeVar('ItemType')
+
+
+@dataclass(frozen=True)
+class PaginationConfig:
+    DEFAULT_LIMIT: int = 50
+    MAX_LIMIT: int = 500
+    NEXT_CURSOR_HEADER: str = 'X-Next-Cursor'
+    TOTAL_COUNT_HEADER: str = 'X-Total-Count'
+
+
+@dataclass(frozen=True)
+class PageRequest:
+    """
+    Keyset pagination request: items, which keys are greater than after_id, are returned, no more than limit of them.
+    """
+
+    limit: int = PaginationConfig.DEFAULT_LIMIT
+    after_id: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Page(Generic[ItemType]):
+    items: List[ItemType]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+def encode_cursor(after_id: int) -> str:
+    """
+    Cursor is opaque for clients, so that keyset could be changed without breaking them.
+    """
+
+    return base64.urlsafe_b64encode(json.dumps({'id': after_id}).encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        data: Dict[str, Any] = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        after_id: Any = data['id']
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise InvalidCursorError
+
+    if not isinstance(after_id, int) or isinstance(after_id, bool):
+        raise InvalidCursorError
+
+    return after_id
+
+
+def build_page(
+        items: List[ItemType],
+        page_request: PageRequest,
+        get_id: Callable[[ItemType], int],
+        total: Optional[int] = None
+) -> Page[ItemType]:
+
+    """
+    Builds page from items, selected with limit + 1, so that existence of the next page is known without
+    additional count query.
+    """
+
+    if len(items) <= page_request.limit:
+        return Page(items=items, total=total)
+
+    items = items[:page_request.limit]
+    return Page(items=items, next_cursor=encode_cursor(after_id=get_id(items[-1])), total=total)
+
+
+def set_pagination_headers(response: Response, page: Page) -> None:
+    """
+    Pagination metadata is provided by headers, so that response body stays a plain list of items.
+    """
+
+    if page.next_cursor:
+        response.headers[PaginationConfig.NEXT_CURSOR_HEADER] = page.next_cursor
+
+    if page.total is not None:
+        response.headers[PaginationConfig.TOTAL_COUNT_HEADER] = str(page.total)
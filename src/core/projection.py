@@ -0,0 +1,50 @@
+from dataclasses import dataclass, fields as dataclass_fields, asdict
+from typing import Tuple, Optional, Type, Dict, Any, Set
+
+from src.core.exceptions import InvalidFieldsError
+
+
+@dataclass(frozen=True)
+class ProjectionConfig:
+    SEPARATOR: str = ','
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    Fields of read model, requested by client with "fields" query param. Queries select only columns of requested
+    fields, and responses contain only requested fields, while fields, which were not selected, are left None in read
+    models.
+    """
+
+    fields: Tuple[str, ...]
+    is_partial: bool = False
+
+    def includes(self, field: str) -> bool:
+        return field in self.fields
+
+    def serialize(self, item: Any) -> Dict[str, Any]:
+        return {field: value for field, value in asdict(item).items() if field in self.fields}
+
+    def to_row(self, item: Any) -> Tuple[Any, ...]:
+        return tuple(getattr(item, field) for field in self.fields)
+
+
+def parse_projection(fields: Optional[str], read_model: Type[Any]) -> Projection:
+    """
+    Parses comma separated fields names of read model. If no fields were requested, all read model fields are
+    returned. Fields are kept in order of read model, not in order of request, so that responses have stable layout.
+    """
+
+    read_model_fields: Tuple[str, ...] = tuple(field.name for field in dataclass_fields(read_model))
+    if not fields:
+        return Projection(fields=read_model_fields)
+
+    requested_fields: Set[str] = {field.strip() for field in fields.split(ProjectionConfig.SEPARATOR) if field.strip()}
+    if not requested_fields or not requested_fields.issubset(read_model_fields):
+        raise InvalidFieldsError
+
+    return Projection(
+        fields=tuple(field for field in read_model_fields if field in requested_fields),
+        is_partial=len(requested_fields) < len(read_model_fields)
+    )
@@ -7,4 +7,17 @@ class RedisConfig(BaseSettings):
     REDIS_PORT: int
 
 
+class RedisStreamsConfig(BaseSettings):
+    REDIS_STREAMS_EVENTS: bool = False
+    REDIS_STREAMS_EVENTS_STREAM: str = 'events'
+    REDIS_STREAMS_EVENTS_MAX_LENGTH: int = 100_000
+    REDIS_STREAMS_CONSUMER_GROUP: str = 'events_handlers'
+    REDIS_STREAMS_CONSUMER_BATCH_SIZE: int = 100
+    REDIS_STREAMS_CONSUMER_BLOCK_MS: int = 5000
+    REDIS_STREAMS_CONSUMER_CLAIM_IDLE_MS: int = 60_000
+    REDIS_STREAMS_CONSUMER_MAX_DELIVERIES: int = 5
+    REDIS_STREAMS_DEAD_LETTERS_STREAM: str = 'events_dead_letters'
+
+
 redis_config: RedisConfig = RedisConfig()
+redis_streams_config: RedisStreamsConfig = RedisStreamsConfig()
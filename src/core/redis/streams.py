@@ -0,0 +1,297 @@
+import asyncio
+import json
+import logging
+from dataclasses import asdict
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+from typing import (
+    Dict,
+    Type,
+    Iterable,
+    List,
+    Tuple,
+    Any,
+    Mapping,
+    Optional,
+    Callable,
+    Awaitable,
+    get_type_hints,
+    get_origin
+)
+
+from src.core.exceptions import EventSerializationError
+from src.core.interfaces import AbstractEvent, AbstractEventsDispatcher
+from src.core.messagebus import MessageBus
+from src.core.redis.config import redis_streams_config
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+StreamMessage = Tuple[str, Optional[Dict[str, str]]]
+
+
+class EventsSerializer:
+    """
+    Registry of events types, which serializes events to Redis Stream entries and back.
+
+    Events are registered by their class names, so events names should be unique across all domains. Sets are
+    serialized as JSON arrays and are converted back to sets according to event's type hints.
+    """
+
+    def __init__(self, events_types: Iterable[Type[AbstractEvent]]) -> None:
+        self._events_types: Dict[str, Type[AbstractEvent]] = {}
+        for event_type in events_types:
+            assert event_type.__name__ not in self._events_types, f'{event_type.__name__} is already registered'
+            self._events_types[event_type.__name__] = event_type
+
+    def serialize(self, event: AbstractEvent) -> Dict[str, str]:
+        if type(event).__name__ not in self._events_types:
+            raise EventSerializationError
+
+        return {
+            'type': type(event).__name__,
+            'data': json.dumps(asdict(event), default=list)
+        }
+
+    def deserialize(self, fields: Mapping[str, str]) -> AbstractEvent:
+        try:
+            event_type: Type[AbstractEvent] = self._events_types[fields['type']]
+            data: Dict[str, Any] = json.loads(fields['data'])
+        except (KeyError, TypeError, ValueError):
+            raise EventSerializationError
+
+        type_hints: Dict[str, Any] = get_type_hints(event_type)
+        for name, value in data.items():
+            if get_origin(type_hints.get(name)) in (set, frozenset):
+                data[name] = set(value)
+
+        return event_type(**data)
+
+
+class RedisStreamsEventsDispatcher(AbstractEventsDispatcher):
+    """
+    Publishes events, raised by commands handlers, to Redis Stream, from which they are consumed by consumer group
+    workers, instead of handling them in the API process.
+
+    Events of one command are added to the stream within one pipeline round trip. If Redis is unavailable, events are
+    rejected and handled inline by messagebus.
+    """
+
+    def __init__(
+            self,
+            redis: Redis,
+            serializer: EventsSerializer,
+            stream: str = redis_streams_config.REDIS_STREAMS_EVENTS_STREAM,
+            max_length: int = redis_streams_config.REDIS_STREAMS_EVENTS_MAX_LENGTH
+    ) -> None:
+
+        self._redis: Redis = redis
+        self._serializer: EventsSerializer = serializer
+        self._stream: str = stream
+        self._max_length: int = max_length
+
+    async def submit(self, events: List[AbstractEvent]) -> bool:
+        try:
+            async with self._redis.pipeline(transaction=False) as pipeline:
+                for event in events:
+                    fields: Dict[Any, Any] = self._serializer.serialize(event=event)
+                    pipeline.xadd(
+                        name=self._stream,
+                        fields=fields,
+                        maxlen=self._max_length,
+                        approximate=True
+                    )
+
+                await pipeline.execute()
+        except RedisError:
+            logger.exception('Failed to publish events %s to stream "%s"', events, self._stream)
+            return False
+
+        return True
+
+    async def stop(self) -> None:
+        await self._redis.aclose()
+
+
+class RedisStreamsEventsConsumer:
+    """
+    Consumer group worker, which reads events from Redis Stream in batches and handles them with messagebus.
+
+    Successfully handled events are acknowledged once per batch. Events, which failed to be handled, are left pending
+    and are reclaimed by any worker of the group after claim_idle_ms. Events, which can not be deserialized, are
+    acknowledged right away, not to be reclaimed endlessly. For the same reason reclaimed events, which were already
+    delivered max_deliveries times, are moved to dead letters stream and acknowledged instead of being handled again.
+    """
+
+    def __init__(
+            self,
+            redis: Redis,
+            serializer: EventsSerializer,
+            messagebus_factory: Callable[[], Awaitable[MessageBus]],
+            consumer: str,
+            stream: str = redis_streams_config.REDIS_STREAMS_EVENTS_STREAM,
+            group: str = redis_streams_config.REDIS_STREAMS_CONSUMER_GROUP,
+            batch_size: int = redis_streams_config.REDIS_STREAMS_CONSUMER_BATCH_SIZE,
+            block_ms: int = redis_streams_config.REDIS_STREAMS_CONSUMER_BLOCK_MS,
+            claim_idle_ms: int = redis_streams_config.REDIS_STREAMS_CONSUMER_CLAIM_IDLE_MS,
+            max_deliveries: int = redis_streams_config.REDIS_STREAMS_CONSUMER_MAX_DELIVERIES,
+            dead_letters_stream: str = redis_streams_config.REDIS_STREAMS_DEAD_LETTERS_STREAM
+    ) -> None:
+
+        self._redis: Redis = redis
+        self._serializer: EventsSerializer = serializer
+        self._messagebus_factory: Callable[[], Awaitable[MessageBus]] = messagebus_factory
+        self._consumer: str = consumer
+        self._stream: str = stream
+        self._group: str = group
+        self._batch_size: int = batch_size
+        self._block_ms: int = block_ms
+        self._claim_idle_ms: int = claim_idle_ms
+        self._max_deliveries: int = max_deliveries
+        self._dead_letters_stream: str = dead_letters_stream
+        self._claim_start_id: str = '0-0'
+
+    async def create_group(self) -> None:
+        try:
+            await self._redis.xgroup_create(name=self._stream, groupname=self._group, id='0', mkstream=True)
+        except ResponseError as e:
+            # Group was already created by another worker:
+            if 'BUSYGROUP' not in str(e):
+                raise
+
+    async def consume(self) -> int:
+        """
+        Handles one batch of events, reclaimed from idle consumers, or, if there are none, one batch of new events.
+        Returns count of acknowledged events, except for the ones, moved to dead letters stream.
+        """
+
+        messages: List[StreamMessage] = await self._reclaim()
+        if not messages:
+            messages = await self._read()
+
+        if not messages:
+            return 0
+
+        return await self._handle(messages=messages)
+
+    async def run(self) -> None:
+        await self.create_group()
+        while True:
+            try:
+                await self.consume()
+            except RedisError:
+                logger.exception('Failed to consume events from stream "%s"', self._stream)
+                await asyncio.sleep(self._block_ms / 1000)
+
+    async def _reclaim(self) -> List[StreamMessage]:
+        response: List[Any] = await self._redis.xautoclaim(
+            name=self._stream,
+            groupname=self._group,
+            consumername=self._consumer,
+            min_idle_time=self._claim_idle_ms,
+            start_id=self._claim_start_id,
+            count=self._batch_size
+        )
+
+        self._claim_start_id = response[0]
+        return await self._move_to_dead_letters(messages=response[1])
+
+    async def _move_to_dead_letters(self, messages: List[StreamMessage]) -> List[StreamMessage]:
+        """
+        Moves reclaimed events, which delivery count exceeds max_deliveries, to dead letters stream and acknowledges
+        them within one transaction. Returns the rest of events to be handled again.
+
+        Reclaiming increments delivery count, so events, which failed to be handled max_deliveries times, are moved.
+        """
+
+        if not messages:
+            return []
+
+        async with self._redis.pipeline(transaction=False) as pipeline:
+            for message_id, _ in messages:
+                pipeline.xpending_range(
+                    name=self._stream,
+                    groupname=self._group,
+                    min=message_id,
+                    max=message_id,
+                    count=1
+                )
+
+            pending_entries: List[List[Dict[str, Any]]] = await pipeline.execute()
+
+        dead_letters: List[Tuple[str, Dict[str, str], int]] = []
+        alive_messages: List[StreamMessage] = []
+        for (message_id, fields), pending_entry in zip(messages, pending_entries):
+            times_delivered: int = pending_entry[0]['times_delivered'] if pending_entry else 0
+
+            # Entries, trimmed from the stream, are acknowledged by handling:
+            if fields and times_delivered > self._max_deliveries:
+                dead_letters.append((message_id, fields, times_delivered))
+            else:
+                alive_messages.append((message_id, fields))
+
+        if not dead_letters:
+            return alive_messages
+
+        async with self._redis.pipeline(transaction=True) as pipeline:
+            for message_id, fields, times_delivered in dead_letters:
+                logger.error('Event %s is moved to dead letters after %s deliveries', message_id, times_delivered)
+                dead_letter_fields: Dict[Any, Any] = {
+                    **fields,
+                    'message_id': message_id,
+                    'times_delivered': str(times_delivered)
+                }
+
+                pipeline.xadd(name=self._dead_letters_stream, fields=dead_letter_fields)
+
+            pipeline.xack(self._stream, self._group, *[message_id for message_id, _, _ in dead_letters])
+            await pipeline.execute()
+
+        return alive_messages
+
+    async def _read(self) -> List[StreamMessage]:
+        response: Optional[List[Any]] = await self._redis.xreadgroup(
+            groupname=self._group,
+            consumername=self._consumer,
+            streams={self._stream: '>'},
+            count=self._batch_size,
+            block=self._block_ms
+        )
+
+        if not response:
+            return []
+
+        stream_messages: List[StreamMessage] = response[0][1]
+        return stream_messages
+
+    async def _handle(self, messages: List[StreamMessage]) -> int:
+        messagebus: MessageBus = await self._messagebus_factory()
+        acknowledged_ids: List[str] = []
+        for message_id, fields in messages:
+            # Entry was trimmed from the stream, while being pending:
+            if not fields:
+                acknowledged_ids.append(message_id)
+                continue
+
+            try:
+                event: AbstractEvent = self._serializer.deserialize(fields=fields)
+            except EventSerializationError:
+                logger.exception('Failed to deserialize event %s %s', message_id, fields)
+                acknowledged_ids.append(message_id)
+                continue
+
+            try:
+                await messagebus.handle(event)
+            except Exception:
+                logger.exception('Failed to handle event %s %s', message_id, event)
+
+                # Messagebus could keep not handled events in its queue, so a new one is used for the next events:
+                messagebus = await self._messagebus_factory()
+                continue
+
+            acknowledged_ids.append(message_id)
+
+        if acknowledged_ids:
+            await self._redis.xack(self._stream, self._group, *acknowledged_ids)
+
+        return len(acknowledged_ids)
@@ -0,0 +1,72 @@
+from fastapi import Request, Query, Header
+from typing import Optional, Tuple
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config import ReadYourWritesConfig
+from src.core.bootstrap import MessageBusFactory
+from src.core.etags import parse_if_match
+from src.core.export import parse_export_media_type
+from src.core.pagination import PageRequest, PaginationConfig, decode_cursor
+from src.core.database.connection import session_factory, replica_session_factory
+from src.core.messagebus import MessageBus
+
+
+async def get_messagebus(request: Request) -> MessageBus:
+    """
+    Provides messagebus, bound to a fresh unit of work, from application-level factory, which is created only once
+    during application startup.
+    """
+
+    messagebus_factory: MessageBusFactory = request.app.state.messagebus_factory
+    return await messagebus_factory.get_messagebus()
+
+
+async def get_views_session_factory(request: Request) -> async_sessionmaker:
+    """
+    Provides session factory for views, which is bound to the read replica, unless client was pinned to the primary
+    database after its recent write request.
+    """
+
+    if ReadYourWritesConfig.COOKIE_KEY in request.cookies:
+        return session_factory
+
+    return replica_session_factory
+
+
+async def get_primary_session_factory() -> async_sessionmaker:
+    """
+    Provides session factory, bound to the primary database, for reads, which must not lag behind writes even for
+    clients, which were not pinned to the primary, such as entity tags, compared by the next conditional update.
+    """
+
+    return session_factory
+
+
+async def get_page_request(
+        limit: int = Query(default=PaginationConfig.DEFAULT_LIMIT, ge=1, le=PaginationConfig.MAX_LIMIT),
+        cursor: Optional[str] = None
+) -> PageRequest:
+
+    """
+    Provides keyset pagination request from query params. Cursor is taken from "X-Next-Cursor" header of the previous
+    page response.
+    """
+
+    return PageRequest(limit=limit, after_id=decode_cursor(cursor=cursor) if cursor else None)
+
+
+async def get_export_media_type(accept: Optional[str] = Header(default=None)) -> Optional[str]:
+    """
+    Provides export media type, if client requested streaming export by "Accept" header.
+    """
+
+    return parse_export_media_type(accept=accept)
+
+
+async def get_expected_versions(if_match: Optional[str] = Header(default=None)) -> Optional[Tuple[int, ...]]:
+    """
+    Provides versions of entity, which client expects to update, by "If-Match" header, or None, if any version is
+    expected.
+    """
+
+    return parse_if_match(if_match=if_match)
@@ -0,0 +1,23 @@
+"""
+Redis Streams consumer group worker, which handles events, published by API workers. Several workers could be run
+to scale events handling horizontally:
+    python -m src.events_consumer
+"""
+
+import asyncio
+import logging
+
+from src.bootstrap import create_events_consumer
+from src.users.adapters.orm import start_mappers as start_users_mappers
+from src.groups.adapters.orm import start_mappers as start_groups_mappers
+
+
+async def main() -> None:
+    start_users_mappers()
+    start_groups_mappers()
+    await create_events_consumer().run()
+
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,29 @@
+from typing import Any
+from sqlalchemy import select, update, func, Update, ScalarSelect
+
+from src.groups.adapters.orm import groups_table, group_members_table
+
+
+def count_members() -> ScalarSelect:
+    """
+    Correlated subquery, which counts members of the group of updated row by unique index of group and user.
+    """
+
+    return select(func.count()).where(group_members_table.c.group_id == groups_table.c.id).scalar_subquery()
+
+
+def recount_member_counts(*where: Any) -> Update:
+    """
+    Sets member_count of groups, matching provided conditions, to actual count of their members. Only drifted rows are
+    updated, so that rowcount of the statement is count of repaired groups.
+    """
+
+    actual_member_count: ScalarSelect = count_members()
+    return update(
+        groups_table
+    ).where(
+        *where,
+        groups_table.c.member_count != actual_member_count
+    ).values(
+        member_count=actual_member_count
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Table, Column, Integer, String, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship, Mapper
 from datetime import datetime, timezone
 
@@ -28,7 +28,13 @@ group_members_table = Table(
         nullable=False,
         default=datetime.now(tz=timezone.utc),
         onupdate=datetime.now(tz=timezone.utc)
-    )
+    ),
+
+    # Members of group are selected by group_id, and user_id is read from the index without visiting the table:
+    UniqueConstraint('group_id', 'user_id', name='uq_group_members_group_id_user_id'),
+
+    # Memberships of user are deleted by cascade, when user is deleted:
+    Index('ix_group_members_user_id', 'user_id')
 )
 
 groups_table = Table(
@@ -42,6 +48,14 @@ groups_table = Table(
         nullable=False
     ),
     Column('name', String(50), nullable=False, unique=False),
+
+    # Denormalized count of group_members rows, which is changed together with them, so that groups could be listed
+    # with their member counts without reading group_members:
+    Column('member_count', Integer, nullable=False, default=0, server_default='0'),
+
+    # Version of group info, which is incremented on each update and compared with expected one by the update's
+    # "WHERE" clause, so that concurrent updates do not overwrite each other without any locks:
+    Column('version', Integer, nullable=False, default=1, server_default='1'),
     Column('created_at', DateTime(timezone=True), nullable=False, default=datetime.now(tz=timezone.utc)),
     Column(
         'updated_at',
@@ -49,7 +63,13 @@ groups_table = Table(
         nullable=False,
         default=datetime.now(tz=timezone.utc),
         onupdate=datetime.now(tz=timezone.utc)
-    )
+    ),
+
+    # Group name is unique per owner, and the constraint's index serves lookups by owner and name:
+    UniqueConstraint('owner_id', 'name', name='uq_groups_owner_id_name'),
+
+    # Owner's groups are selected in order of id for keyset pagination, so that no sort is needed:
+    Index('ix_groups_owner_id_id', 'owner_id', 'id', postgresql_include=['name'])
 )
 
 
@@ -67,6 +87,10 @@ def start_mappers():
         local_table=group_members_table
     )
 
+    # Members are never loaded implicitly. Repositories choose, whether to load them, by loading profiles per call.
+    # Version is not mapped as "version_id_col": mapper checks it only on flush of loaded objects, while groups are
+    # updated by single "UPDATE ... WHERE" statements without loading them, against versions from "If-Match" header.
+    # So version is compared and incremented by update_by_owner statement itself:
     mapper_registry.map_imperatively(
         class_=GroupModel,
         local_table=groups_table,
@@ -76,7 +100,7 @@ def start_mappers():
                 backref='groups',
                 collection_class=set,
                 order_by=group_members_table.c.id,
-                lazy='selectin'
+                lazy='raise'
             )
         }
     )
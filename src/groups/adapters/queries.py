@@ -0,0 +1,132 @@
+from typing import List, Dict, AsyncIterator, Optional, Tuple
+from sqlalchemy import select, Select, Result, Row, Column
+from sqlalchemy.ext.asyncio import AsyncResult
+
+from src.core.export import ExportConfig
+from src.core.pagination import PageRequest
+from src.core.projection import Projection
+from src.groups.adapters.orm import groups_table, group_members_table
+from src.groups.domain.read_models import GroupReadModel, GroupMemberReadModel
+from src.groups.interfaces.queries import GroupsQueries
+from src.core.database.interfaces.queries import SQLAlchemyAbstractQueries
+
+
+# Columns are named as GroupReadModel fields, so that rows could be unpacked into read models:
+GROUP_READ_MODEL_COLUMNS: Tuple[Column, ...] = (
+    groups_table.c.id,
+    groups_table.c.name,
+    groups_table.c.owner_id,
+    groups_table.c.member_count,
+    groups_table.c.version,
+)
+
+
+class SQLAlchemyGroupsQueries(SQLAlchemyAbstractQueries, GroupsQueries):
+
+    async def get_user_groups(
+            self,
+            user_id: int,
+            page_request: PageRequest,
+            projection: Optional[Projection] = None
+    ) -> List[GroupReadModel]:
+
+        """
+        Selects groups and then members of all selected groups by one more statement, the same way as "selectin"
+        loading does, but without building ORM objects. Members statement is skipped, if members were not requested.
+        """
+
+        statement: Select = (
+            select(*self._project_columns(columns=GROUP_READ_MODEL_COLUMNS, projection=projection))
+            .where(groups_table.c.owner_id == user_id)
+            .order_by(groups_table.c.id)
+            .limit(page_request.limit + 1)
+        )
+        if page_request.after_id is not None:
+            statement = statement.where(groups_table.c.id > page_request.after_id)
+
+        result: Result = await self._session.execute(statement)
+        groups: Dict[int, GroupReadModel] = {row.id: GroupReadModel(**row._mapping) for row in result}
+        if not groups or (projection and not projection.includes('members')):
+            return list(groups.values())
+
+        statement = (
+            select(group_members_table.c.group_id, group_members_table.c.user_id)
+            .where(group_members_table.c.group_id.in_(groups.keys()))
+            .order_by(group_members_table.c.id)
+        )
+        result = await self._session.execute(statement)
+        for row in result:
+            groups[row.group_id].members.append(GroupMemberReadModel(*row))
+
+        return list(groups.values())
+
+    async def get_group(self, group_id: int) -> Optional[GroupReadModel]:
+        statement: Select = select(*GROUP_READ_MODEL_COLUMNS).where(groups_table.c.id == group_id)
+        row: Optional[Row] = (await self._session.execute(statement)).first()
+        if not row:
+            return None
+
+        group: GroupReadModel = GroupReadModel(**row._mapping)
+        statement = (
+            select(group_members_table.c.group_id, group_members_table.c.user_id)
+            .where(group_members_table.c.group_id == group_id)
+            .order_by(group_members_table.c.id)
+        )
+        result: Result = await self._session.execute(statement)
+        group.members.extend(GroupMemberReadModel(*row) for row in result)
+        return group
+
+    async def stream_user_groups(
+            self,
+            user_id: int,
+            partition_size: int = ExportConfig.YIELD_PER,
+            projection: Optional[Projection] = None
+    ) -> AsyncIterator[List[GroupReadModel]]:
+
+        """
+        Groups are joined with their members in one statement, so rows of each group are consecutive, and the group is
+        yielded only when its last row is read, even if its rows are split between partitions. If members were not
+        requested, groups are selected without join.
+        """
+
+        columns: Tuple[Column, ...] = self._project_columns(columns=GROUP_READ_MODEL_COLUMNS, projection=projection)
+        if projection and not projection.includes('members'):
+            statement: Select = (
+                select(*columns)
+                .where(groups_table.c.owner_id == user_id)
+                .order_by(groups_table.c.id)
+                .execution_options(yield_per=partition_size)
+            )
+            result: AsyncResult = await self._session.stream(statement)
+            async for partition in result.partitions():
+                yield [GroupReadModel(**row._mapping) for row in partition]
+
+            return
+
+        statement = (
+            select(*columns, group_members_table.c.user_id.label('member_id'))
+            .outerjoin(group_members_table, group_members_table.c.group_id == groups_table.c.id)
+            .where(groups_table.c.owner_id == user_id)
+            .order_by(groups_table.c.id, group_members_table.c.id)
+            .execution_options(yield_per=partition_size)
+        )
+
+        result = await self._session.stream(statement)
+        group: Optional[GroupReadModel] = None
+        async for partition in result.partitions():
+            groups: List[GroupReadModel] = []
+            for row in partition:
+                if not group or group.id != row.id:
+                    if group:
+                        groups.append(group)
+
+                    group = GroupReadModel(**{column.name: row._mapping[column.name] for column in columns})
+
+                if row.member_id is not None:
+                    group.members.append(GroupMemberReadModel(group_id=row.id, user_id=row.member_id))
+
+            if groups:
+                yield groups
+
+        if group:
+            yield [group]
@@ -1,35 +1,125 @@
-from typing import List, Optional, Sequence, Any
-from sqlalchemy import insert, select, delete, update, Result, Row, RowMapping
+from typing import List, Optional, Sequence, Any, Set, Dict, Tuple
+from sqlalchemy import insert, select, delete, update, literal, true, Result, Row, RowMapping, Subquery, Update
+from sqlalchemy.orm import noload, selectinload, raiseload
+from sqlalchemy.orm.interfaces import ORMOption
 
+from src.groups.adapters.orm import groups_table, group_members_table
+from src.groups.constants import GroupLoadProfiles
 from src.groups.interfaces.repositories import GroupsRepository
 from src.groups.domain.models import GroupModel
 from src.core.database.interfaces.repositories import SQLAlchemyAbstractRepository
 from src.core.interfaces import AbstractModel
 
 
+# Members is the only relationship of GroupModel, so wildcard options apply only to it:
+GROUP_LOAD_OPTIONS: Dict[str, Tuple[ORMOption, ...]] = {
+    GroupLoadProfiles.LIST: (noload('*'), ),
+    GroupLoadProfiles.DETAIL: (selectinload('*'), ),
+    GroupLoadProfiles.MEMBERSHIP_CHECK: (raiseload('*'), ),
+}
+
+
 class SQLAlchemyGroupsRepository(SQLAlchemyAbstractRepository, GroupsRepository):
 
-    async def get(self, id: int) -> Optional[GroupModel]:
-        result: Result = await self._session.execute(select(GroupModel).filter_by(id=id))
+    async def get(self, id: int, profile: str = GroupLoadProfiles.DETAIL) -> Optional[GroupModel]:
+        result: Result = await self._session.execute(
+            select(GroupModel).filter_by(id=id).options(*GROUP_LOAD_OPTIONS[profile])
+        )
+
         return result.scalar_one_or_none()
 
-    async def get_by_owner_and_name(self, name: str, owner_id: int) -> Optional[GroupModel]:
-        result: Result = await self._session.execute(select(GroupModel).filter_by(name=name, owner_id=owner_id))
+    async def get_by_owner_and_name(
+            self,
+            name: str,
+            owner_id: int,
+            profile: str = GroupLoadProfiles.DETAIL
+    ) -> Optional[GroupModel]:
+
+        result: Result = await self._session.execute(
+            select(GroupModel).filter_by(name=name, owner_id=owner_id).options(*GROUP_LOAD_OPTIONS[profile])
+        )
+
         return result.scalar_one_or_none()
 
-    async def get_user_groups(self, user_id: int) -> List[GroupModel]:
-        result: Result = await self._session.execute(select(GroupModel).filter_by(owner_id=user_id))
+    async def get_user_groups(self, user_id: int, profile: str = GroupLoadProfiles.LIST) -> List[GroupModel]:
+        result: Result = await self._session.execute(
+            select(GroupModel).filter_by(owner_id=user_id).options(*GROUP_LOAD_OPTIONS[profile])
+        )
 
-        # Using this type casting for purpose of passing mypy checks:
-        return [GroupModel(**await r.to_dict()) for r in result.scalars().all()]
+        groups: List[GroupModel] = list(result.scalars().all())
+        return groups
 
     async def add(self, model: AbstractModel) -> GroupModel:
         result: Result = await self._session.execute(
-            insert(GroupModel).values(**await model.to_dict(exclude={'id', 'members'})).returning(GroupModel)
+            insert(
+                GroupModel
+            ).values(
+                **await model.to_dict(exclude={'id', 'members', 'member_count', 'version'})
+            ).returning(
+                GroupModel
+            ).options(
+                *GROUP_LOAD_OPTIONS[GroupLoadProfiles.LIST]
+            )
         )
 
         return result.scalar_one()
 
+    async def add_if_not_exists(self, model: AbstractModel) -> Optional[GroupModel]:
+        # New group has no members yet, so they are not selected after insert:
+        return await self._insert_if_not_exists(
+            entity=GroupModel,
+            values=await model.to_dict(exclude={'id', 'members', 'member_count', 'version'}),
+            options=GROUP_LOAD_OPTIONS[GroupLoadProfiles.LIST]
+        )
+
+    async def add_members(self, group_id: int, user_ids: Set[int]) -> Set[int]:
+        """
+        Adds members by one "INSERT ... SELECT ... ON CONFLICT DO NOTHING" statement, which relies on unique constraint
+        of group and user, so that neither existing members are loaded, nor round trip per member is made.
+
+        "WHERE true" resolves SQLite parsing ambiguity of "ON CONFLICT" clause after "INSERT ... SELECT".
+
+        Member count of the group is incremented by count of actually added members in the same transaction.
+        """
+
+        ids: Subquery = self._ids_subquery(ids=user_ids)
+        result: Result = await self._session.execute(
+            self._insert(
+                entity=group_members_table
+            ).from_select(
+                ['group_id', 'user_id'],
+                select(literal(group_id), ids.c.id).where(true())
+            ).on_conflict_do_nothing().returning(
+                group_members_table.c.user_id
+            )
+        )
+
+        added_user_ids: Set[int] = set(result.scalars().all())
+        await self._change_member_count(group_id=group_id, delta=len(added_user_ids))
+        return added_user_ids
+
+    async def remove_members(self, group_id: int, user_ids: Set[int]) -> Set[int]:
+        """
+        Removes members by one "DELETE ... RETURNING" statement and decrements member count of the group by count of
+        actually removed members in the same transaction.
+        """
+
+        ids: Subquery = self._ids_subquery(ids=user_ids)
+        result: Result = await self._session.execute(
+            delete(
+                group_members_table
+            ).where(
+                group_members_table.c.group_id == group_id,
+                group_members_table.c.user_id.in_(select(ids.c.id))
+            ).returning(
+                group_members_table.c.user_id
+            )
+        )
+
+        removed_user_ids: Set[int] = set(result.scalars().all())
+        await self._change_member_count(group_id=group_id, delta=-len(removed_user_ids))
+        return removed_user_ids
+
     async def update(self, id: int, model: AbstractModel) -> GroupModel:
         result: Result = await self._session.execute(
             update(
@@ -37,18 +127,64 @@ class SQLAlchemyGroupsRepository(SQLAlchemyAbstractRepository, GroupsRepository)
             ).filter_by(
                 id=id
             ).values(
-                **await model.to_dict(exclude={'id', 'members'})
+                **await model.to_dict(exclude={'id', 'members', 'member_count', 'version'}),
+                version=groups_table.c.version + 1
             ).returning(
                 GroupModel
+            ).options(
+                *GROUP_LOAD_OPTIONS[GroupLoadProfiles.DETAIL]
             )
         )
 
         return result.scalar_one()
 
+    async def update_by_owner(
+            self,
+            id: int,
+            owner_id: int,
+            model: AbstractModel,
+            expected_versions: Optional[Tuple[int, ...]] = None
+    ) -> Optional[GroupModel]:
+
+        """
+        Ownership is checked by the "WHERE" clause of the update itself, so that no group is selected beforehand.
+        Members of the updated group are selected afterwards, since they are returned in response.
+
+        Version is not managed by mapper, so it is compared with expected ones and incremented by the statement itself.
+        Concurrent update of the same version makes the slower writer update nothing, instead of overwriting the
+        changes, without any row being locked beforehand.
+        """
+
+        statement: Update = update(
+            GroupModel
+        ).filter_by(
+            id=id,
+            owner_id=owner_id
+        ).values(
+            **await model.to_dict(exclude={'id', 'owner_id', 'members', 'member_count', 'version'}),
+            version=groups_table.c.version + 1
+        )
+
+        if expected_versions is not None:
+            statement = statement.where(groups_table.c.version.in_(expected_versions))
+
+        result: Result = await self._session.execute(
+            statement.returning(GroupModel).options(*GROUP_LOAD_OPTIONS[GroupLoadProfiles.DETAIL])
+        )
+
+        return result.scalar_one_or_none()
+
     async def delete(self, id: int) -> None:
         await self._session.execute(delete(GroupModel).filter_by(id=id))
 
-    async def list(self) -> List[GroupModel]:
+    async def delete_by_owner(self, id: int, owner_id: int) -> bool:
+        result: Result = await self._session.execute(
+            delete(groups_table).filter_by(id=id, owner_id=owner_id).returning(groups_table.c.id)
+        )
+
+        return result.scalar_one_or_none() is not None
+
+    async def list(self, profile: str = GroupLoadProfiles.DETAIL) -> List[GroupModel]:
         """
         Returning result object instead of converting to new objects by
                     [GroupModel(**await r.to_dict()) for r in result.scalars().all()]
@@ -57,7 +193,7 @@ class SQLAlchemyGroupsRepository(SQLAlchemyAbstractRepository, GroupsRepository)
         Checking by asserts, that expected return type is equal to fact return type.
         """
 
-        result: Result = await self._session.execute(select(GroupModel))
+        result: Result = await self._session.execute(select(GroupModel).options(*GROUP_LOAD_OPTIONS[profile]))
         groups: Sequence[Row | RowMapping | Any] = result.scalars().all()
 
         assert isinstance(groups, List)
@@ -65,3 +201,22 @@ class SQLAlchemyGroupsRepository(SQLAlchemyAbstractRepository, GroupsRepository)
             assert isinstance(group, GroupModel)
 
         return groups
+
+    async def _change_member_count(self, group_id: int, delta: int) -> None:
+        """
+        Changes member count relatively to its current value, so that concurrent changes of the same group's members
+        are serialized by the row lock and are not lost.
+        """
+
+        if not delta:
+            return
+
+        await self._session.execute(
+            update(
+                groups_table
+            ).where(
+                groups_table.c.id == group_id
+            ).values(
+                member_count=groups_table.c.member_count + delta
+            )
+        )
@@ -12,7 +12,9 @@ class URLPathsConfig:
     ADD_GROUP_MEMBERS: str = '/{group_id}/add-members'
     REMOVE_GROUP_MEMBERS: str = '/{group_id}/remove-members'
     UPDATE_GROUP: str = '/{group_id}'
+    GET_GROUP: str = '/{group_id}'
     INVITE_GROUP_MEMBERS: str = '/{group_id}/invite-members'
+    BATCH: str = '/batch'
 
 
 @dataclass(frozen=True)
@@ -23,13 +25,16 @@ class URLNamesConfig:
     ADD_GROUP_MEMBERS: str = 'add members to group'
     REMOVE_GROUP_MEMBERS: str = 'remove members from group'
     UPDATE_GROUP: str = 'update group info'
+    GET_GROUP: str = 'get group'
     INVITE_GROUP_MEMBERS: str = 'invite not-registered users to group'
+    BATCH: str = 'execute batch of groups operations'
 
 
 @dataclass(frozen=True)
 class GroupValidationConfig:
     NAME_MIN_LENGTH: int = 1
     NAME_MAX_LENGTH: int = 70
+    BATCH_MAX_SIZE: int = 100
 
 
 @dataclass(frozen=True)
@@ -12,3 +12,21 @@ class ErrorDetails(BaseErrorDetails):
                                         f'{GroupValidationConfig.NAME_MAX_LENGTH} characters inclusive')
     GROUP_NOT_FOUND: str = 'Group not found.'
     GROUP_OWNER_ERROR: str = 'Group doe not belong to current user.'
+    GROUP_VERSION_CONFLICT: str = 'Group was changed by another request. Get its current version and try again.'
+    GROUPS_BATCH_SIZE_ERROR: str = (f'Batch must contain from 1 to {GroupValidationConfig.BATCH_MAX_SIZE} '
+                                    f'operations inclusive')
+
+
+class GroupLoadProfiles:
+    """
+    Names of group loading profiles, which are selected by repository callers, depending on what group data they need:
+
+    LIST: groups are listed without members.
+    DETAIL: group is loaded with all its members.
+    MEMBERSHIP_CHECK: group is only checked for existence or ownership, for example, before its membership is changed,
+    so members are not loaded, and any access to them raises an error.
+    """
+
+    LIST: str = 'list'
+    DETAIL: str = 'detail'
+    MEMBERSHIP_CHECK: str = 'membership_check'
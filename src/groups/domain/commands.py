@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Set
+from typing import Set, Optional, Tuple
 
 from src.core.interfaces.commands import AbstractCommand
 from src.users.domain.models import UserModel
@@ -23,6 +23,9 @@ class UpdateGroupCommand(AbstractCommand):
     user: UserModel
     name: str
 
+    # Optional args:
+    expected_versions: Optional[Tuple[int, ...]] = None
+
 
 @dataclass(frozen=True)
 class AddGroupMembersCommand(AbstractCommand):
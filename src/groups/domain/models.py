@@ -20,5 +20,7 @@ class GroupModel(AbstractModel):
 
     # Optional args:
     id: int = 0
+    member_count: int = 0
+    version: int = 1
 
     members: Set[GroupMemberModel] = field(default_factory=set)
@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class GroupMemberReadModel:
+    group_id: int
+    user_id: int
+
+
+@dataclass(frozen=True)
+class GroupReadModel:
+    """
+    Representation of group, which is returned by views.
+
+    Fields, which were not requested by projection, are not selected and are left None. Members are selected only if
+    they were requested, while member_count is read from groups table itself.
+    Version is used by clients as entity tag of group for conditional updates.
+    """
+
+    id: int
+    name: Optional[str] = None
+    owner_id: Optional[int] = None
+    member_count: Optional[int] = None
+    version: Optional[int] = None
+    members: List[GroupMemberReadModel] = field(default_factory=list)
@@ -1,39 +1,48 @@
-from typing import List
+from typing import List, Optional, Union, Sequence, Any, Tuple
 from fastapi import Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from src.core.bootstrap import Bootstrap
 from src.core.messagebus import MessageBus
+from src.core.export import create_export_response
+from src.core.pagination import Page, PageRequest
+from src.core.projection import Projection, parse_projection
+from src.dependencies import (
+    get_messagebus,
+    get_views_session_factory,
+    get_primary_session_factory,
+    get_page_request,
+    get_export_media_type,
+    get_expected_versions
+)
 from src.groups.domain.commands import (
     CreateGroupCommand,
     DeleteGroupCommand,
     UpdateGroupCommand
 )
 from src.groups.domain.models import GroupModel
-from src.groups.entypoints.schemas import CreateOrUpdateGroupScheme
+from src.groups.domain.read_models import GroupReadModel
+from src.core.interfaces import AbstractCommand
+from src.groups.config import GroupValidationConfig
+from src.groups.entypoints.schemas import (
+    CreateOrUpdateGroupScheme,
+    GroupOperationScheme,
+    CreateGroupOperationScheme,
+    UpdateGroupOperationScheme
+)
+from src.groups.exceptions import GroupsBatchSizeValidationError
 from src.groups.service_layer.units_of_work import SQLAlchemyGroupsUnitOfWork
-from src.groups.service_layer.handlers import EVENTS_HANDLERS_FOR_INJECTION, COMMANDS_HANDLERS_FOR_INJECTION
 from src.groups.entypoints.views import GroupsViews
 from src.users.domain.models import UserModel
 from src.users.entrypoints.dependencies import authenticate_user
 
 
-"""
-Can not use Bootstrap object in dependencies, so its defined in each dependency body.
-"""
-
-
 async def create_group(
         group_data: CreateOrUpdateGroupScheme,
-        user: UserModel = Depends(authenticate_user)
+        user: UserModel = Depends(authenticate_user),
+        messagebus: MessageBus = Depends(get_messagebus)
 ) -> GroupModel:
 
-    bootstrap: Bootstrap = Bootstrap(
-        uow=SQLAlchemyGroupsUnitOfWork(),
-        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION
-    )
-
-    messagebus: MessageBus = await bootstrap.get_messagebus()
     await messagebus.handle(
         CreateGroupCommand(
             user=user,
@@ -44,14 +53,12 @@ async def create_group(
     return messagebus.command_result
 
 
-async def delete_group(group_id: int, user: UserModel = Depends(authenticate_user)) -> None:
-    bootstrap: Bootstrap = Bootstrap(
-        uow=SQLAlchemyGroupsUnitOfWork(),
-        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION
-    )
+async def delete_group(
+        group_id: int,
+        user: UserModel = Depends(authenticate_user),
+        messagebus: MessageBus = Depends(get_messagebus)
+) -> None:
 
-    messagebus: MessageBus = await bootstrap.get_messagebus()
     await messagebus.handle(
         DeleteGroupCommand(
             user=user,
@@ -60,30 +67,113 @@ async def delete_group(group_id: int, user: UserModel = Depends(authenticate_use
     )
 
 
-async def get_current_user_groups(user: UserModel = Depends(authenticate_user)) -> List[GroupModel]:
-    groups_views: GroupsViews = GroupsViews(uow=SQLAlchemyGroupsUnitOfWork())
-    return await groups_views.get_user_groups(user_id=user.id)
+async def get_groups_projection(fields: Optional[str] = None) -> Projection:
+    """
+    Provides fields of groups, requested by comma separated "fields" query param, for example "?fields=id,name".
+    Members are loaded only if "members" field is requested.
+    """
+
+    return parse_projection(fields=fields, read_model=GroupReadModel)
+
+
+def group_to_csv_row(group: GroupReadModel, projection: Projection) -> Sequence[Any]:
+    return [
+        ' '.join(str(member.user_id) for member in group.members) if field == 'members' else getattr(group, field)
+        for field in projection.fields
+    ]
+
+
+async def get_current_user_groups(
+        user: UserModel = Depends(authenticate_user),
+        page_request: PageRequest = Depends(get_page_request),
+        export_media_type: Optional[str] = Depends(get_export_media_type),
+        projection: Projection = Depends(get_groups_projection),
+        session_factory: async_sessionmaker = Depends(get_views_session_factory)
+) -> Union[Page[GroupReadModel], StreamingResponse]:
+
+    """
+    Provides one page of current user's groups, or, if export was requested by "Accept" header, streams all of them,
+    ignoring pagination params. In CSV export members are represented by space separated users ids.
+    """
+
+    groups_views: GroupsViews = GroupsViews(
+        uow=SQLAlchemyGroupsUnitOfWork(session_factory=session_factory, read_only=True)
+    )
+    if export_media_type:
+        return create_export_response(
+            partitions=groups_views.stream_user_groups(user_id=user.id, projection=projection),
+            media_type=export_media_type,
+            csv_header=projection.fields,
+            to_csv_row=lambda group: group_to_csv_row(group=group, projection=projection),
+            to_json=projection.serialize
+        )
+
+    return await groups_views.get_user_groups(user_id=user.id, page_request=page_request, projection=projection)
+
+
+async def get_group(
+        group_id: int,
+        user: UserModel = Depends(authenticate_user),
+        session_factory: async_sessionmaker = Depends(get_primary_session_factory)
+) -> GroupReadModel:
+
+    """
+    Group is read from the primary database, since its version is returned as entity tag: version, read from
+    a lagging replica, would fail the next conditional update with 412 status code.
+    """
+
+    groups_views: GroupsViews = GroupsViews(
+        uow=SQLAlchemyGroupsUnitOfWork(session_factory=session_factory, read_only=True)
+    )
+    return await groups_views.get_user_group(group_id=group_id, user_id=user.id)
 
 
 async def update_group(
         group_data: CreateOrUpdateGroupScheme,
         group_id: int,
-        user: UserModel = Depends(authenticate_user)
+        user: UserModel = Depends(authenticate_user),
+        messagebus: MessageBus = Depends(get_messagebus),
+        expected_versions: Optional[Tuple[int, ...]] = Depends(get_expected_versions)
 ) -> GroupModel:
 
-    bootstrap: Bootstrap = Bootstrap(
-        uow=SQLAlchemyGroupsUnitOfWork(),
-        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION
-    )
+    """
+    Group is updated only if it was not changed since version, provided by "If-Match" header, if any. Otherwise,
+    the update fails with 412 status code, instead of overwriting changes of another request.
+    """
 
-    messagebus: MessageBus = await bootstrap.get_messagebus()
     await messagebus.handle(
         UpdateGroupCommand(
             user=user,
             group_id=group_id,
+            expected_versions=expected_versions,
             **group_data.model_dump()
         )
     )
 
     return messagebus.command_result
+
+
+async def execute_groups_batch(
+        operations: List[GroupOperationScheme],
+        user: UserModel = Depends(authenticate_user),
+        messagebus: MessageBus = Depends(get_messagebus)
+) -> List[Optional[GroupModel]]:
+
+    """
+    Executes groups operations in provided order, so that client pays for authentication and unit of work only once
+    for the whole batch. Returns results of operations in the same order.
+    """
+
+    if not 0 < len(operations) <= GroupValidationConfig.BATCH_MAX_SIZE:
+        raise GroupsBatchSizeValidationError
+
+    commands: List[AbstractCommand] = []
+    for operation in operations:
+        if isinstance(operation, CreateGroupOperationScheme):
+            commands.append(CreateGroupCommand(user=user, name=operation.name))
+        elif isinstance(operation, UpdateGroupOperationScheme):
+            commands.append(UpdateGroupCommand(user=user, group_id=operation.group_id, name=operation.name))
+        else:
+            commands.append(DeleteGroupCommand(user=user, group_id=operation.group_id))
+
+    return await messagebus.handle_many(commands=commands)
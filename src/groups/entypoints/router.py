@@ -1,14 +1,21 @@
-from typing import MutableSequence
+from typing import MutableSequence, Optional, Union
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from src.groups.domain.models import GroupModel
+from src.groups.domain.read_models import GroupReadModel
+from src.core.etags import set_etag_header
+from src.core.pagination import Page, set_pagination_headers
+from src.core.projection import Projection
 from src.groups.config import RouterConfig, URLPathsConfig, URLNamesConfig
 from src.groups.entypoints.dependencies import (
     create_group,
     delete_group,
     get_current_user_groups,
-    update_group as update_group_dependency
+    get_group as get_group_dependency,
+    get_groups_projection,
+    update_group as update_group_dependency,
+    execute_groups_batch
 )
 
 
@@ -43,11 +50,41 @@ async def delete(deleted: None = Depends(delete_group)):  # Using this style for
     path=URLPathsConfig.MY_GROUPS,
     response_class=JSONResponse,
     name=URLNamesConfig.MY_GROUPS,
-    response_model=MutableSequence[GroupModel],
+    response_model=MutableSequence[GroupReadModel],
     status_code=status.HTTP_200_OK
 )
-async def get_my_groups(groups: MutableSequence[GroupModel] = Depends(get_current_user_groups)):
-    return groups
+async def get_my_groups(
+        response: Response,
+        page: Union[Page[GroupReadModel], StreamingResponse] = Depends(get_current_user_groups),
+        projection: Projection = Depends(get_groups_projection)
+):
+
+    if isinstance(page, StreamingResponse):
+        return page
+
+    # Not requested fields are excluded by projection, not by response model, which would return them as nulls:
+    if projection.is_partial:
+        projected_response: JSONResponse = JSONResponse(content=[projection.serialize(group) for group in page.items])
+        set_pagination_headers(response=projected_response, page=page)
+        return projected_response
+
+    set_pagination_headers(response=response, page=page)
+    return page.items
+
+
+@router.get(
+    path=URLPathsConfig.GET_GROUP,
+    response_class=JSONResponse,
+    name=URLNamesConfig.GET_GROUP,
+    response_model=GroupReadModel,
+    status_code=status.HTTP_200_OK
+)
+async def get_group(response: Response, group: GroupReadModel = Depends(get_group_dependency)):
+    # Entity tag of the read group is used by client in "If-Match" header of its update:
+    if group.version is not None:
+        set_etag_header(response=response, version=group.version)
+
+    return group
 
 
 @router.put(
@@ -57,10 +94,23 @@ async def get_my_groups(groups: MutableSequence[GroupModel] = Depends(get_curren
     response_model=GroupModel,
     status_code=status.HTTP_200_OK
 )
-async def update_group(group: GroupModel = Depends(update_group_dependency)):
+async def update_group(response: Response, group: GroupModel = Depends(update_group_dependency)):
+    # Entity tag of the updated group is used by client in "If-Match" header of the next update:
+    set_etag_header(response=response, version=group.version)
     return group
 
 
+@router.post(
+    path=URLPathsConfig.BATCH,
+    response_class=JSONResponse,
+    name=URLNamesConfig.BATCH,
+    response_model=MutableSequence[Optional[GroupModel]],
+    status_code=status.HTTP_200_OK
+)
+async def execute_batch(results: MutableSequence[Optional[GroupModel]] = Depends(execute_groups_batch)):
+    return results
+
+
 # @router.post(
 #     path=URLPathsConfig.INVITE_GROUP_MEMBERS,
 #     response_class=JSONResponse,
@@ -1,5 +1,5 @@
-from typing import Set
-from pydantic import BaseModel, field_validator, EmailStr
+from typing import Set, Literal, Union, Annotated
+from pydantic import BaseModel, field_validator, EmailStr, Field
 
 from src.groups.config import GroupValidationConfig
 from src.groups.exceptions import GroupNameValidationError
@@ -19,3 +19,23 @@ class CreateOrUpdateGroupScheme(BaseModel):
 
 class InviteGroupMembersScheme(BaseModel):
     emails: Set[EmailStr] = set()
+
+
+class CreateGroupOperationScheme(CreateOrUpdateGroupScheme):
+    operation: Literal['create']
+
+
+class UpdateGroupOperationScheme(CreateOrUpdateGroupScheme):
+    operation: Literal['update']
+    group_id: int
+
+
+class DeleteGroupOperationScheme(BaseModel):
+    operation: Literal['delete']
+    group_id: int
+
+
+GroupOperationScheme = Annotated[
+    Union[CreateGroupOperationScheme, UpdateGroupOperationScheme, DeleteGroupOperationScheme],
+    Field(discriminator='operation')
+]
@@ -1,8 +1,10 @@
-from typing import List
+from typing import List, AsyncIterator, Optional
 
-from src.groups.domain.models import GroupModel
+from src.core.pagination import Page, PageRequest, build_page
+from src.core.projection import Projection
+from src.groups.domain.read_models import GroupReadModel
+from src.groups.exceptions import GroupNotFoundError, GroupOwnerError
 from src.groups.interfaces.units_of_work import GroupsUnitOfWork
-from src.groups.service_layer.service import GroupsService
 
 
 class GroupsViews:
@@ -10,17 +12,60 @@ class GroupsViews:
     Views related to groups, which purpose is to return information upon read requests,
     due to the fact that write requests (represented by commands) are different from read requests.
 
-    # TODO At current moment uses repositories pattern to retrieve data. In future can be changed on raw SQL
-    # TODO for speed-up purpose
+    Uses queries of unit of work instead of repositories, which select only the returned columns and map rows directly
+    to read models.
     """
 
     def __init__(self, uow: GroupsUnitOfWork) -> None:
         self._uow: GroupsUnitOfWork = uow
 
-    async def get_user_groups(self, user_id: int) -> List[GroupModel]:
+    async def get_user_groups(
+            self,
+            user_id: int,
+            page_request: PageRequest,
+            projection: Optional[Projection] = None
+    ) -> Page[GroupReadModel]:
+
+        """
+        Provides one page of groups, belonging to current user.
+        """
+
+        async with self._uow as uow:
+            groups: List[GroupReadModel] = await uow.groups_queries.get_user_groups(
+                user_id=user_id,
+                page_request=page_request,
+                projection=projection
+            )
+
+        return build_page(items=groups, page_request=page_request, get_id=lambda group: group.id)
+
+    async def get_user_group(self, group_id: int, user_id: int) -> GroupReadModel:
+        """
+        Provides group with its members, if it belongs to current user.
+        """
+
+        async with self._uow as uow:
+            group: Optional[GroupReadModel] = await uow.groups_queries.get_group(group_id=group_id)
+
+        if not group:
+            raise GroupNotFoundError
+
+        if group.owner_id != user_id:
+            raise GroupOwnerError
+
+        return group
+
+    async def stream_user_groups(
+            self,
+            user_id: int,
+            projection: Optional[Projection] = None
+    ) -> AsyncIterator[List[GroupReadModel]]:
+
         """
-        Provides a list of groups, belonging to current user.
+        Yields partitions of all groups, belonging to current user, for export. Unit of work is entered only when
+        iteration starts, so that it is kept open while response is streamed.
         """
 
-        groups_service: GroupsService = GroupsService(self._uow)
-        return await groups_service.get_user_groups(user_id=user_id)
+        async with self._uow as uow:
+            async for groups in uow.groups_queries.stream_user_groups(user_id=user_id, projection=projection):
+                yield groups
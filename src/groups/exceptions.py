@@ -3,7 +3,8 @@ from src.core.exceptions import (
     AlreadyExistsError,
     ValidationError,
     NotFoundError,
-    PermissionDeniedError
+    PermissionDeniedError,
+    PreconditionFailedError
 )
 
 
@@ -21,3 +22,11 @@ class GroupNotFoundError(NotFoundError):
 
 class GroupOwnerError(PermissionDeniedError):
     DETAIL = ErrorDetails.GROUP_OWNER_ERROR
+
+
+class GroupVersionConflictError(PreconditionFailedError):
+    DETAIL = ErrorDetails.GROUP_VERSION_CONFLICT
+
+
+class GroupsBatchSizeValidationError(ValidationError):
+    DETAIL = ErrorDetails.GROUPS_BATCH_SIZE_ERROR
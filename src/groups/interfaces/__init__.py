@@ -1,3 +1,4 @@
 from src.groups.interfaces.units_of_work import GroupsUnitOfWork
 from src.groups.interfaces.repositories import GroupsRepository
+from src.groups.interfaces.queries import GroupsQueries
 from src.groups.interfaces.handlers import GroupsEventHandler, GroupsCommandHandler
@@ -0,0 +1,53 @@
+from typing import List, AsyncIterator, Optional
+from abc import ABC, abstractmethod
+
+from src.core.interfaces import AbstractQueries
+from src.core.export import ExportConfig
+from src.core.pagination import PageRequest
+from src.core.projection import Projection
+from src.groups.domain.read_models import GroupReadModel
+
+
+class GroupsQueries(AbstractQueries, ABC):
+    """
+    An interface for read requests related to groups, that is used by groups views.
+    """
+
+    @abstractmethod
+    async def get_user_groups(
+            self,
+            user_id: int,
+            page_request: PageRequest,
+            projection: Optional[Projection] = None
+    ) -> List[GroupReadModel]:
+
+        """
+        Returns user's groups ordered by id, which ids are greater than page_request.after_id, no more than
+        page_request.limit + 1 of them, so that existence of the next page could be known. If projection is provided,
+        only its fields are selected, and members are selected only if they were requested.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_group(self, group_id: int) -> Optional[GroupReadModel]:
+        """
+        Returns group with its members and version, or None, if group does not exist.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_user_groups(
+            self,
+            user_id: int,
+            partition_size: int = ExportConfig.YIELD_PER,
+            projection: Optional[Projection] = None
+    ) -> AsyncIterator[List[GroupReadModel]]:
+
+        """
+        Yields all user's groups with their members ordered by id in partitions, which are fetched from the database
+        one by one.
+        """
+
+        raise NotImplementedError
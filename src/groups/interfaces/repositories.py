@@ -1,7 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 from abc import ABC, abstractmethod
 
 from src.core.interfaces import AbstractRepository, AbstractModel
+from src.groups.constants import GroupLoadProfiles
 from src.groups.domain.models import GroupModel
 
 
@@ -10,14 +11,23 @@ class GroupsRepository(AbstractRepository, ABC):
     An interface for work with groups, that is used by groups unit of work of the groups' module.
     The main goal is that implementations of this interface can be easily replaced in the groups unit of work of
     the groups module using dependency injection without disrupting its functionality.
+
+    Methods, which return groups, accept name of loading profile from GroupLoadProfiles, which defines whether group
+    members are loaded.
     """
 
     @abstractmethod
-    async def get_by_owner_and_name(self, name: str, owner_id: int) -> Optional[GroupModel]:
+    async def get_by_owner_and_name(
+            self,
+            name: str,
+            owner_id: int,
+            profile: str = GroupLoadProfiles.DETAIL
+    ) -> Optional[GroupModel]:
+
         raise NotImplementedError
 
     @abstractmethod
-    async def get_user_groups(self, user_id: int) -> List[GroupModel]:
+    async def get_user_groups(self, user_id: int, profile: str = GroupLoadProfiles.LIST) -> List[GroupModel]:
         raise NotImplementedError
 
     @abstractmethod
@@ -25,7 +35,31 @@ class GroupsRepository(AbstractRepository, ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def get(self, id: int) -> Optional[GroupModel]:
+    async def add_if_not_exists(self, model: AbstractModel) -> Optional[GroupModel]:
+        """
+        Adds group, unless its owner already has group with the same name, in which case returns None.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, id: int, profile: str = GroupLoadProfiles.DETAIL) -> Optional[GroupModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def add_members(self, group_id: int, user_ids: Set[int]) -> Set[int]:
+        """
+        Adds users to group, skipping users, who are already its members, and returns ids of actually added users.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove_members(self, group_id: int, user_ids: Set[int]) -> Set[int]:
+        """
+        Removes users from group, skipping users, who are not its members, and returns ids of actually removed users.
+        """
+
         raise NotImplementedError
 
     @abstractmethod
@@ -33,5 +67,31 @@ class GroupsRepository(AbstractRepository, ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def list(self) -> List[GroupModel]:
+    async def update_by_owner(
+            self,
+            id: int,
+            owner_id: int,
+            model: AbstractModel,
+            expected_versions: Optional[Tuple[int, ...]] = None
+    ) -> Optional[GroupModel]:
+
+        """
+        Updates group and increments its version, only if it belongs to provided owner and, if expected versions are
+        provided, its current version is one of them. Returns None, if group does not exist, belongs to another user
+        or has another version.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_by_owner(self, id: int, owner_id: int) -> bool:
+        """
+        Deletes group, only if it belongs to provided owner. Returns False, if group does not exist or belongs to
+        another user.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list(self, profile: str = GroupLoadProfiles.DETAIL) -> List[GroupModel]:
         raise NotImplementedError
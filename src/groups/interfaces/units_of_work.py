@@ -1,6 +1,7 @@
 from abc import ABC
 
 from src.groups.interfaces.repositories import GroupsRepository
+from src.groups.interfaces.queries import GroupsQueries
 from src.core.interfaces import AbstractUnitOfWork
 
 
@@ -12,3 +13,4 @@ class GroupsUnitOfWork(AbstractUnitOfWork, ABC):
     """
 
     groups: GroupsRepository
+    groups_queries: GroupsQueries
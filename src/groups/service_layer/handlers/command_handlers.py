@@ -9,22 +9,22 @@ from src.groups.domain.commands import (
     AddGroupMembersCommand,
     RemoveGroupMembersCommand
 )
+from src.groups.constants import GroupLoadProfiles
 from src.groups.domain.models import GroupModel, GroupMemberModel
-from src.groups.exceptions import GroupAlreadyExistsError, GroupOwnerError
+from src.groups.exceptions import GroupOwnerError
 from src.groups.service_layer.service import GroupsService
+from src.users.domain.models import UserModel
 
 
 class CreateGroupCommandHandler(GroupsCommandHandler):
 
     async def __call__(self, command: CreateGroupCommand) -> GroupModel:
         """
-        Creates a new group for current user, if user doesn't have group with same name.
+        Creates a new group for current user, if user doesn't have group with same name. Existence of group is checked
+        by unique constraint on insert.
         """
 
         groups_service: GroupsService = GroupsService(uow=self._uow)
-        if await groups_service.check_group_existence(name=command.name, owner_id=command.user.id):
-            raise GroupAlreadyExistsError
-
         group: GroupModel = GroupModel(owner_id=command.user.id, **await command.to_dict(exclude={'user'}))
         return await groups_service.create_group(group=group)
 
@@ -33,48 +33,50 @@ class DeleteGroupCommandHandler(GroupsCommandHandler):
 
     async def __call__(self, command: DeleteGroupCommand) -> None:
         """
-        Deletes group, if group belongs to current user.
+        Deletes group, if group belongs to current user. Ownership is checked by the delete statement itself.
         """
 
         groups_service: GroupsService = GroupsService(uow=self._uow)
-        group: GroupModel = await groups_service.get_group_by_id(id=command.group_id)
-        if not group.owner_id == command.user.id:
-            raise GroupOwnerError
-
-        await groups_service.delete_group(id=command.group_id)
+        await groups_service.delete_group(id=command.group_id, owner_id=command.user.id)
 
 
 class UpdateGroupCommandHandler(GroupsCommandHandler):
 
     async def __call__(self, command: UpdateGroupCommand) -> GroupModel:
         """
-        Updates group info, if group belongs to current user.
+        Updates group info, if group belongs to current user and was not changed since one of expected versions.
+        Ownership and version are checked by the update statement itself.
         """
 
         groups_service: GroupsService = GroupsService(uow=self._uow)
-        group: GroupModel = await groups_service.get_group_by_id(id=command.group_id)
-        if not group.owner_id == command.user.id:
-            raise GroupOwnerError
-
-        # Excluding all relationships to avoid SQLAlchemy errors:
-        group = GroupModel(
-            **await group.to_dict(exclude={'members'}) | await command.to_dict(exclude={'group_id', 'user'})
+        group: GroupModel = GroupModel(
+            id=command.group_id,
+            owner_id=command.user.id,
+            **await command.to_dict(exclude={'group_id', 'user', 'expected_versions'})
         )
 
-        return await groups_service.update_group(id=command.group_id, group=group)
+        return await groups_service.update_group(
+            id=command.group_id,
+            group=group,
+            expected_versions=command.expected_versions
+        )
 
 
 class AddGroupMembersCommandHandler(GroupsCommandHandler):
 
-    async def __call__(self, command: AddGroupMembersCommand) -> GroupModel:
+    async def __call__(self, command: AddGroupMembersCommand) -> Set[GroupMemberModel]:
         """
         Adds group members to provided group, if group belongs to current user, and creates event signaling that
-        operation was successfully executed.
+        operation was successfully executed. Existing members of the group are not loaded, and users, who are already
+        members, are skipped and not notified.
         """
 
         async with self._uow as uow:
             groups_service: GroupsService = GroupsService(uow=uow)
-            group: GroupModel = await groups_service.get_group_by_id(id=command.group_id)
+            group: GroupModel = await groups_service.get_group_by_id(
+                id=command.group_id,
+                profile=GroupLoadProfiles.MEMBERSHIP_CHECK
+            )
             if not group.owner_id == command.user.id:
                 raise GroupOwnerError
 
@@ -85,30 +87,41 @@ class AddGroupMembersCommandHandler(GroupsCommandHandler):
                 ) for group_member in command.group_members
             }
 
-            group = await groups_service.add_group_members(id=group.id, members=group_members)
-            await uow.add_event(
-                GroupMembersAddedToGroupEvent(
-                    group_name=group.name,
-                    group_owner_username=command.user.username,
-                    group_members_emails={group_member.email for group_member in command.group_members},
-                    group_members_usernames={group_member.username for group_member in command.group_members}
-                )
+            added_group_members: Set[GroupMemberModel] = await groups_service.add_group_members(
+                group=group,
+                members=group_members
             )
 
-            return group
+            added_user_ids: Set[int] = {group_member.user_id for group_member in added_group_members}
+            added_users: Set[UserModel] = {user for user in command.group_members if user.id in added_user_ids}
+            if added_users:
+                await uow.add_event(
+                    GroupMembersAddedToGroupEvent(
+                        group_name=group.name,
+                        group_owner_username=command.user.username,
+                        group_members_emails={user.email for user in added_users},
+                        group_members_usernames={user.username for user in added_users}
+                    )
+                )
+
+            return added_group_members
 
 
 class RemoveGroupMembersCommandHandler(GroupsCommandHandler):
 
-    async def __call__(self, command: RemoveGroupMembersCommand) -> GroupModel:
+    async def __call__(self, command: RemoveGroupMembersCommand) -> Set[GroupMemberModel]:
         """
-        Removes group members to provided group, if group belongs to current user, and creates event signaling that
-        operation was successfully executed.
+        Removes group members from provided group, if group belongs to current user, and creates event signaling that
+        operation was successfully executed. Existing members of the group are not loaded, and users, who are not
+        members, are skipped and not notified.
         """
 
         async with self._uow as uow:
             groups_service: GroupsService = GroupsService(uow=uow)
-            group: GroupModel = await groups_service.get_group_by_id(id=command.group_id)
+            group: GroupModel = await groups_service.get_group_by_id(
+                id=command.group_id,
+                profile=GroupLoadProfiles.MEMBERSHIP_CHECK
+            )
             if not group.owner_id == command.user.id:
                 raise GroupOwnerError
 
@@ -119,14 +132,21 @@ class RemoveGroupMembersCommandHandler(GroupsCommandHandler):
                 ) for group_member in command.group_members
             }
 
-            group = await groups_service.remove_group_members(id=group.id, members=group_members)
-            await uow.add_event(
-                GroupMembersRemovedFromGroupEvent(
-                    group_name=group.name,
-                    group_owner_username=command.user.username,
-                    group_members_emails={group_member.email for group_member in command.group_members},
-                    group_members_usernames={group_member.username for group_member in command.group_members}
-                )
+            removed_group_members: Set[GroupMemberModel] = await groups_service.remove_group_members(
+                group=group,
+                members=group_members
             )
 
-            return group
+            removed_user_ids: Set[int] = {group_member.user_id for group_member in removed_group_members}
+            removed_users: Set[UserModel] = {user for user in command.group_members if user.id in removed_user_ids}
+            if removed_users:
+                await uow.add_event(
+                    GroupMembersRemovedFromGroupEvent(
+                        group_name=group.name,
+                        group_owner_username=command.user.username,
+                        group_members_emails={user.email for user in removed_users},
+                        group_members_usernames={user.username for user in removed_users}
+                    )
+                )
+
+            return removed_group_members
@@ -7,6 +7,8 @@ from src.groups.domain.events import (
 
 class SendAddToGroupNotificationsEventHandler(GroupsEventHandler):
 
+    CONCURRENCY_SAFE = True
+
     async def __call__(self, event: GroupMembersAddedToGroupEvent) -> None:
         # TODO should send notifications to added users
         pass
@@ -14,6 +16,8 @@ class SendAddToGroupNotificationsEventHandler(GroupsEventHandler):
 
 class SendRemoveFromGroupNotificationEventHandler(GroupsEventHandler):
 
+    CONCURRENCY_SAFE = True
+
     async def __call__(self, event: GroupMembersAddedToGroupEvent) -> None:
         # TODO should send notifications to added users
         pass
@@ -21,6 +25,8 @@ class SendRemoveFromGroupNotificationEventHandler(GroupsEventHandler):
 
 class SendRegisterMessageToInvitedUsersEventHandler(GroupsEventHandler):
 
+    CONCURRENCY_SAFE = True
+
     async def __call__(self, event: GroupMembersInvitedEvent) -> None:
         # TODO should send notifications for register to inveited users
         pass
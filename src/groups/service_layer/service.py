@@ -1,8 +1,14 @@
-from typing import Optional, List, Set
+from typing import Optional, List, Set, NoReturn, Tuple
 
+from src.groups.constants import GroupLoadProfiles
 from src.groups.domain.models import GroupModel, GroupMemberModel
 from src.groups.interfaces.units_of_work import GroupsUnitOfWork
-from src.groups.exceptions import GroupNotFoundError
+from src.groups.exceptions import (
+    GroupNotFoundError,
+    GroupAlreadyExistsError,
+    GroupOwnerError,
+    GroupVersionConflictError
+)
 
 
 class GroupsService:
@@ -13,31 +19,50 @@ class GroupsService:
     def __init__(self, uow: GroupsUnitOfWork) -> None:
         self._uow: GroupsUnitOfWork = uow
 
-    async def get_group_by_id(self, id: int) -> GroupModel:
+    async def get_group_by_id(self, id: int, profile: str = GroupLoadProfiles.DETAIL) -> GroupModel:
         async with self._uow as uow:
-            group: Optional[GroupModel] = await uow.groups.get(id=id)
+            group: Optional[GroupModel] = await uow.groups.get(id=id, profile=profile)
             if not group:
                 raise GroupNotFoundError
 
             return group
 
     async def create_group(self, group: GroupModel) -> GroupModel:
+        """
+        Creates group by one statement, relying on unique constraint of owner and group name instead of checking group
+        existence beforehand, which is also safe under concurrent requests.
+        """
+
         async with self._uow as uow:
-            group = await uow.groups.add(model=group)
+            created_group: Optional[GroupModel] = await uow.groups.add_if_not_exists(model=group)
+            if not created_group:
+                raise GroupAlreadyExistsError
+
             await uow.commit()
-            return group
+            return created_group
 
     async def check_group_existence(self, owner_id: int, name: str) -> bool:
         async with self._uow as uow:
-            group: Optional[GroupModel] = await uow.groups.get_by_owner_and_name(name=name, owner_id=owner_id)
+            group: Optional[GroupModel] = await uow.groups.get_by_owner_and_name(
+                name=name,
+                owner_id=owner_id,
+                profile=GroupLoadProfiles.MEMBERSHIP_CHECK
+            )
             if group:
                 return True
 
         return False
 
-    async def delete_group(self, id: int) -> None:
+    async def delete_group(self, id: int, owner_id: int) -> None:
+        """
+        Deletes group by one statement, guarded by group owner. Group is probed only if nothing was deleted, to tell
+        whether it does not exist or belongs to another user.
+        """
+
         async with self._uow as uow:
-            await uow.groups.delete(id=id)
+            if not await uow.groups.delete_by_owner(id=id, owner_id=owner_id):
+                await self._raise_not_owned_group_error(id=id)
+
             await uow.commit()
 
     async def get_user_groups(self, user_id: int) -> List[GroupModel]:
@@ -45,33 +70,84 @@ class GroupsService:
             groups: List[GroupModel] = await uow.groups.get_user_groups(user_id=user_id)
             return groups
 
-    async def add_group_members(self, id: int, members: Set[GroupMemberModel]) -> GroupModel:
+    async def add_group_members(self, group: GroupModel, members: Set[GroupMemberModel]) -> Set[GroupMemberModel]:
+        """
+        Adds members to group by one set based statement, without loading existing members of the group. Returns only
+        actually added members, skipping those, who were already members of the group.
+
+        Group should be already loaded by caller, which checks its existence and ownership, so it is not selected again.
+        """
+
         async with self._uow as uow:
-            group: Optional[GroupModel] = await uow.groups.get(id=id)
-            if not group:
-                raise GroupNotFoundError
+            added_user_ids: Set[int] = await uow.groups.add_members(
+                group_id=group.id,
+                user_ids={member.user_id for member in members}
+            )
 
-            group.members.update(members)
             await uow.commit()
-            return group
+            return {GroupMemberModel(group_id=group.id, user_id=user_id) for user_id in added_user_ids}
+
+    async def remove_group_members(
+            self,
+            group: GroupModel,
+            members: Set[GroupMemberModel]
+    ) -> Set[GroupMemberModel]:
+
+        """
+        Removes members from group by one set based statement, without loading existing members of the group. Returns
+        only actually removed members, skipping those, who were not members of the group.
+
+        Group should be already loaded by caller, which checks its existence and ownership, so it is not selected again.
+        """
 
-    async def remove_group_members(self, id: int, members: Set[GroupMemberModel]) -> GroupModel:
         async with self._uow as uow:
-            group: Optional[GroupModel] = await uow.groups.get(id=id)
-            if not group:
-                raise GroupNotFoundError
+            removed_user_ids: Set[int] = await uow.groups.remove_members(
+                group_id=group.id,
+                user_ids={member.user_id for member in members}
+            )
+
+            await uow.commit()
+            return {GroupMemberModel(group_id=group.id, user_id=user_id) for user_id in removed_user_ids}
+
+    async def update_group(
+            self,
+            id: int,
+            group: GroupModel,
+            expected_versions: Optional[Tuple[int, ...]] = None
+    ) -> GroupModel:
 
-            for member in members:
-                group.members.remove(member)
+        """
+        Updates group by one statement, guarded by owner of provided group and, if expected versions are provided, by
+        group version. Group is probed only if nothing was updated, to tell whether it does not exist, belongs to
+        another user or was already changed by another request.
+        """
+
+        async with self._uow as uow:
+            updated_group: Optional[GroupModel] = await uow.groups.update_by_owner(
+                id=id,
+                owner_id=group.owner_id,
+                model=group,
+                expected_versions=expected_versions
+            )
+            if not updated_group:
+                await self._raise_not_updated_group_error(id=id, owner_id=group.owner_id)
 
             await uow.commit()
-            return group
+            return updated_group
 
-    async def update_group(self, id: int, group: GroupModel) -> GroupModel:
+    async def _raise_not_owned_group_error(self, id: int) -> NoReturn:
         async with self._uow as uow:
-            if not await uow.groups.get(id=id):
+            if await uow.groups.get(id=id, profile=GroupLoadProfiles.MEMBERSHIP_CHECK):
+                raise GroupOwnerError
+
+            raise GroupNotFoundError
+
+    async def _raise_not_updated_group_error(self, id: int, owner_id: int) -> NoReturn:
+        async with self._uow as uow:
+            group: Optional[GroupModel] = await uow.groups.get(id=id, profile=GroupLoadProfiles.MEMBERSHIP_CHECK)
+            if not group:
                 raise GroupNotFoundError
+            elif group.owner_id != owner_id:
+                raise GroupOwnerError
 
-            group = await uow.groups.update(id=id, model=group)
-            await uow.commit()
-            return group
+            raise GroupVersionConflictError
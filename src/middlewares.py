@@ -0,0 +1,38 @@
+from http.cookies import SimpleCookie
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from src.config import ReadYourWritesConfig
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pins client to the primary database for a few seconds after each successful write request, by setting a short-lived
+    cookie, so that views, served by a read replica, would not return data, which is older than client's own changes.
+
+    Cookie is used instead of in-process registry, because the next request of the client could be handled by another
+    worker.
+    """
+
+    def __init__(self, app: ASGIApp, seconds: int) -> None:
+        self._app: ASGIApp = app
+        cookie: SimpleCookie = SimpleCookie()
+        cookie[ReadYourWritesConfig.COOKIE_KEY] = '1'
+        cookie[ReadYourWritesConfig.COOKIE_KEY]['max-age'] = seconds
+        cookie[ReadYourWritesConfig.COOKIE_KEY]['path'] = '/'
+        cookie[ReadYourWritesConfig.COOKIE_KEY]['httponly'] = True
+        cookie[ReadYourWritesConfig.COOKIE_KEY]['samesite'] = 'lax'
+        self._cookie_header: str = cookie.output(header='').strip()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or scope['method'] in ReadYourWritesConfig.SAFE_METHODS:
+            await self._app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message['type'] == 'http.response.start' and message['status'] < 400:
+                MutableHeaders(scope=message).append('set-cookie', self._cookie_header)
+
+            await send(message)
+
+        await self._app(scope, receive, send_with_cookie)
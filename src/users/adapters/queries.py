@@ -0,0 +1,66 @@
+from typing import Optional, List, Tuple, AsyncIterator
+from sqlalchemy import select, Select, Result, Row, Column
+from sqlalchemy.ext.asyncio import AsyncResult
+
+from src.core.export import ExportConfig
+from src.core.pagination import PageRequest
+from src.core.projection import Projection
+from src.users.adapters.orm import users_table
+from src.users.domain.read_models import UserReadModel
+from src.users.interfaces.queries import UsersQueries
+from src.core.database.interfaces.queries import SQLAlchemyAbstractQueries
+
+
+# Columns are named as UserReadModel fields, so that rows could be unpacked into read models:
+USER_READ_MODEL_COLUMNS: Tuple[Column, ...] = (
+    users_table.c.id,
+    users_table.c.email,
+    users_table.c.username,
+    users_table.c.email_verified,
+)
+
+
+class SQLAlchemyUsersQueries(SQLAlchemyAbstractQueries, UsersQueries):
+
+    async def get_user_account(self, user_id: int, projection: Optional[Projection] = None) -> Optional[UserReadModel]:
+        statement: Select = (
+            select(*self._project_columns(columns=USER_READ_MODEL_COLUMNS, projection=projection))
+            .where(users_table.c.id == user_id)
+        )
+        row: Optional[Row] = (await self._session.execute(statement)).first()
+        return UserReadModel(**row._mapping) if row else None
+
+    async def get_all_users(
+            self,
+            page_request: PageRequest,
+            projection: Optional[Projection] = None
+    ) -> List[UserReadModel]:
+
+        statement: Select = (
+            select(*self._project_columns(columns=USER_READ_MODEL_COLUMNS, projection=projection))
+            .order_by(users_table.c.id)
+            .limit(page_request.limit + 1)
+        )
+        if page_request.after_id is not None:
+            statement = statement.where(users_table.c.id > page_request.after_id)
+
+        result: Result = await self._session.execute(statement)
+        return [UserReadModel(**row._mapping) for row in result]
+
+    async def get_approximate_users_count(self) -> Optional[int]:
+        return await self._get_approximate_count(table=users_table)
+
+    async def stream_all_users(
+            self,
+            partition_size: int = ExportConfig.YIELD_PER,
+            projection: Optional[Projection] = None
+    ) -> AsyncIterator[List[UserReadModel]]:
+
+        statement: Select = (
+            select(*self._project_columns(columns=USER_READ_MODEL_COLUMNS, projection=projection))
+            .order_by(users_table.c.id)
+            .execution_options(yield_per=partition_size)
+        )
+        result: AsyncResult = await self._session.stream(statement)
+        async for partition in result.partitions():
+            yield [UserReadModel(**row._mapping) for row in partition]
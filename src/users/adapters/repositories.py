@@ -1,5 +1,7 @@
 from typing import List, Optional, Sequence, Any
-from sqlalchemy import insert, select, delete, update, Result, RowMapping, Row
+from sqlalchemy import insert, select, delete, update, case, or_, Result, RowMapping, Row, Select
+
+from src.users.adapters.orm import users_table
 
 from src.users.interfaces.repositories import UsersRepository
 from src.users.domain.models import UserModel
@@ -21,6 +23,28 @@ class SQLAlchemyUsersRepository(SQLAlchemyAbstractRepository, UsersRepository):
         result: Result = await self._session.execute(select(UserModel).filter_by(username=username))
         return result.scalar_one_or_none()
 
+    async def get_by_login(self, login: str) -> Optional[UserModel]:
+        """
+        Resolves email or username by one statement, which uses both unique indexes, and selects only columns of
+        UserModel fields, without timestamps. User is built from the row and is not added to the session, since login
+        does not change it.
+        """
+
+        statement: Select = (
+            select(
+                users_table.c.id,
+                users_table.c.email,
+                users_table.c.password,
+                users_table.c.username,
+                users_table.c.email_verified
+            )
+            .where(or_(users_table.c.email == login, users_table.c.username == login))
+            .order_by(case((users_table.c.email == login, 0), else_=1))
+            .limit(1)
+        )
+        row: Optional[Row] = (await self._session.execute(statement)).first()
+        return UserModel(**row._mapping) if row else None
+
     async def add(self, model: AbstractModel) -> UserModel:
         result: Result = await self._session.execute(
             insert(UserModel).values(**await model.to_dict(exclude={'id'})).returning(UserModel)
@@ -28,6 +52,9 @@ class SQLAlchemyUsersRepository(SQLAlchemyAbstractRepository, UsersRepository):
 
         return result.scalar_one()
 
+    async def add_if_not_exists(self, model: AbstractModel) -> Optional[UserModel]:
+        return await self._insert_if_not_exists(entity=UserModel, values=await model.to_dict(exclude={'id'}))
+
     async def update(self, id: int, model: AbstractModel) -> UserModel:
         result: Result = await self._session.execute(
             update(UserModel).filter_by(id=id).values(**await model.to_dict(exclude={'id'})).returning(UserModel)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class UserReadModel:
+    """
+    Representation of user, which is returned by views. Has no password field, so password is never selected from
+    the database for read requests.
+
+    Fields, which were not requested by projection, are not selected and are left None.
+    """
+
+    id: int
+    email: Optional[str] = None
+    username: Optional[str] = None
+    email_verified: Optional[bool] = None
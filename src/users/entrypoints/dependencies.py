@@ -1,12 +1,17 @@
 from fastapi import Depends
-from typing import List
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from typing import Optional, Union
 
-from src.core.bootstrap import Bootstrap
 from src.core.messagebus import MessageBus
+from src.core.export import create_export_response
+from src.core.pagination import Page, PageRequest
+from src.core.projection import Projection, parse_projection
+from src.dependencies import get_messagebus, get_views_session_factory, get_page_request, get_export_media_type
 from src.users.domain.models import UserModel
+from src.users.domain.read_models import UserReadModel
 from src.security.models import JWTDataModel
 from src.users.entrypoints.schemas import LoginUserScheme, RegisterUserScheme
-from src.users.service_layer.handlers import EVENTS_HANDLERS_FOR_INJECTION, COMMANDS_HANDLERS_FOR_INJECTION
 from src.users.utils import oauth2_scheme
 from src.users.service_layer.units_of_work import SQLAlchemyUsersUnitOfWork
 from src.security.utils import parse_jwt_token
@@ -19,19 +24,11 @@ from src.users.domain.commands import (
 )
 
 
-"""
-Can not use Bootstrap object in dependencies, so its defined in each dependency body.
-"""
+async def register_user(
+        user_data: RegisterUserScheme,
+        messagebus: MessageBus = Depends(get_messagebus)
+) -> UserModel:
 
-
-async def register_user(user_data: RegisterUserScheme) -> UserModel:
-    bootstrap: Bootstrap = Bootstrap(
-        uow=SQLAlchemyUsersUnitOfWork(),
-        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION
-    )
-
-    messagebus: MessageBus = await bootstrap.get_messagebus()
     await messagebus.handle(
         RegisterUserCommand(
             **user_data.model_dump()
@@ -41,14 +38,11 @@ async def register_user(user_data: RegisterUserScheme) -> UserModel:
     return messagebus.command_result
 
 
-async def verify_user_credentials(user_data: LoginUserScheme) -> UserModel:
-    bootstrap: Bootstrap = Bootstrap(
-        uow=SQLAlchemyUsersUnitOfWork(),
-        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION
-    )
+async def verify_user_credentials(
+        user_data: LoginUserScheme,
+        messagebus: MessageBus = Depends(get_messagebus)
+) -> UserModel:
 
-    messagebus: MessageBus = await bootstrap.get_messagebus()
     await messagebus.handle(
         VerifyUserCredentialsCommand(
             **user_data.model_dump()
@@ -58,19 +52,16 @@ async def verify_user_credentials(user_data: LoginUserScheme) -> UserModel:
     return messagebus.command_result
 
 
-async def authenticate_user(token: str = Depends(oauth2_scheme)) -> UserModel:
+async def authenticate_user(
+        token: str = Depends(oauth2_scheme),
+        messagebus: MessageBus = Depends(get_messagebus)
+) -> UserModel:
+
     """
     Authenticates user according to provided JWT token, if token is valid and hadn't expired.
     """
 
     jwt_data: JWTDataModel = await parse_jwt_token(token=token)
-    bootstrap: Bootstrap = Bootstrap(
-        uow=SQLAlchemyUsersUnitOfWork(),
-        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION
-    )
-
-    messagebus: MessageBus = await bootstrap.get_messagebus()
     await messagebus.handle(
         GetUserCommand(
             user_id=jwt_data.user_id,
@@ -80,19 +71,12 @@ async def authenticate_user(token: str = Depends(oauth2_scheme)) -> UserModel:
     return messagebus.command_result
 
 
-async def verify_user_email(token: str) -> UserModel:
+async def verify_user_email(token: str, messagebus: MessageBus = Depends(get_messagebus)) -> UserModel:
     """
     Confirms, that the provided by user email belongs to him according provided JWT token.
     """
 
     jwt_data: JWTDataModel = await parse_jwt_token(token=token)
-    bootstrap: Bootstrap = Bootstrap(
-        uow=SQLAlchemyUsersUnitOfWork(),
-        events_handlers_for_injection=EVENTS_HANDLERS_FOR_INJECTION,
-        commands_handlers_for_injection=COMMANDS_HANDLERS_FOR_INJECTION
-    )
-
-    messagebus: MessageBus = await bootstrap.get_messagebus()
     await messagebus.handle(
         VerifyUserEmailCommand(
             user_id=jwt_data.user_id,
@@ -102,12 +86,50 @@ async def verify_user_email(token: str) -> UserModel:
     return messagebus.command_result
 
 
-async def get_my_account(token: str = Depends(oauth2_scheme)) -> UserModel:
+async def get_users_projection(fields: Optional[str] = None) -> Projection:
+    """
+    Provides fields of users, requested by comma separated "fields" query param, for example "?fields=id,username".
+    """
+
+    return parse_projection(fields=fields, read_model=UserReadModel)
+
+
+async def get_my_account(
+        token: str = Depends(oauth2_scheme),
+        projection: Projection = Depends(get_users_projection),
+        session_factory: async_sessionmaker = Depends(get_views_session_factory)
+) -> UserReadModel:
+
     jwt_data: JWTDataModel = await parse_jwt_token(token=token)
-    users_views: UsersViews = UsersViews(uow=SQLAlchemyUsersUnitOfWork())
-    return await users_views.get_user_account(user_id=jwt_data.user_id)
+    users_views: UsersViews = UsersViews(
+        uow=SQLAlchemyUsersUnitOfWork(session_factory=session_factory, read_only=True)
+    )
+    return await users_views.get_user_account(user_id=jwt_data.user_id, projection=projection)
+
+
+async def get_all_users(
+        page_request: PageRequest = Depends(get_page_request),
+        with_total: bool = False,
+        export_media_type: Optional[str] = Depends(get_export_media_type),
+        projection: Projection = Depends(get_users_projection),
+        session_factory: async_sessionmaker = Depends(get_views_session_factory)
+) -> Union[Page[UserReadModel], StreamingResponse]:
 
+    """
+    Provides one page of users, or, if export was requested by "Accept" header, streams all users, ignoring
+    pagination params.
+    """
+
+    users_views: UsersViews = UsersViews(
+        uow=SQLAlchemyUsersUnitOfWork(session_factory=session_factory, read_only=True)
+    )
+    if export_media_type:
+        return create_export_response(
+            partitions=users_views.stream_all_users(projection=projection),
+            media_type=export_media_type,
+            csv_header=projection.fields,
+            to_csv_row=projection.to_row,
+            to_json=projection.serialize
+        )
 
-async def get_all_users() -> List[UserModel]:
-    users_views: UsersViews = UsersViews(uow=SQLAlchemyUsersUnitOfWork())
-    return await users_views.get_all_users()
+    return await users_views.get_all_users(page_request=page_request, with_total=with_total, projection=projection)
@@ -1,9 +1,12 @@
-from typing import MutableSequence
+from typing import MutableSequence, Union
 from datetime import datetime, timezone, timedelta
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import Response, JSONResponse
+from fastapi.responses import Response, JSONResponse, StreamingResponse
 
 from src.users.domain.models import UserModel
+from src.users.domain.read_models import UserReadModel
+from src.core.pagination import Page, set_pagination_headers
+from src.core.projection import Projection
 from src.users.config import RouterConfig, URLPathsConfig, URLNamesConfig, cookies_config
 from src.security.models import JWTDataModel
 from src.security.utils import create_jwt_token
@@ -13,6 +16,7 @@ from src.users.entrypoints.dependencies import (
     get_my_account as get_my_account_dependency,
     verify_user_email,
     get_all_users as get_all_users_dependency,
+    get_users_projection
 )
 
 
@@ -84,20 +88,43 @@ async def logout():
 @router.get(
     path=URLPathsConfig.ME,
     response_class=JSONResponse,
-    response_model=UserModel,
+    response_model=UserReadModel,
     name=URLNamesConfig.ME,
     status_code=status.HTTP_200_OK
 )
-async def get_my_account(user: UserModel = Depends(get_my_account_dependency)):
+async def get_my_account(
+        user: UserReadModel = Depends(get_my_account_dependency),
+        projection: Projection = Depends(get_users_projection)
+):
+
+    # Not requested fields are excluded by projection, not by response model, which would return them as nulls:
+    if projection.is_partial:
+        return JSONResponse(content=projection.serialize(user))
+
     return user
 
 
 @router.get(
     path=URLPathsConfig.ALL,
     response_class=JSONResponse,
-    response_model=MutableSequence[UserModel],
+    response_model=MutableSequence[UserReadModel],
     name=URLNamesConfig.ALL,
     status_code=status.HTTP_200_OK
 )
-async def get_all_users(users: MutableSequence[UserModel] = Depends(get_all_users_dependency)):
-    return users
+async def get_all_users(
+        response: Response,
+        page: Union[Page[UserReadModel], StreamingResponse] = Depends(get_all_users_dependency),
+        projection: Projection = Depends(get_users_projection)
+):
+
+    if isinstance(page, StreamingResponse):
+        return page
+
+    # Not requested fields are excluded by projection, not by response model, which would return them as nulls:
+    if projection.is_partial:
+        projected_response: JSONResponse = JSONResponse(content=[projection.serialize(user) for user in page.items])
+        set_pagination_headers(response=projected_response, page=page)
+        return projected_response
+
+    set_pagination_headers(response=response, page=page)
+    return page.items
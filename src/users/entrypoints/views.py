@@ -1,8 +1,10 @@
-from typing import List
+from typing import List, Optional, AsyncIterator
 
-from src.users.domain.models import UserModel
+from src.core.pagination import Page, PageRequest, build_page
+from src.core.projection import Projection
+from src.users.domain.read_models import UserReadModel
+from src.users.exceptions import UserNotFoundError
 from src.users.interfaces.units_of_work import UsersUnitOfWork
-from src.users.service_layer.service import UsersService
 
 
 class UsersViews:
@@ -10,23 +12,53 @@ class UsersViews:
     Views related to users, which purpose is to return information upon read requests,
     due to the fact that write requests (represented by commands) are different from read requests.
 
-    # TODO At current moment uses repositories pattern to retrieve data. In future can be changed on raw SQL
-    # TODO for speed-up purpose
+    Uses queries of unit of work instead of repositories, which select only the returned columns and map rows directly
+    to read models, without password.
     """
 
     def __init__(self, uow: UsersUnitOfWork) -> None:
         self._uow: UsersUnitOfWork = uow
 
-    async def get_user_account(self, user_id: int) -> UserModel:
-        users_service: UsersService = UsersService(self._uow)
-        user: UserModel = await users_service.get_user_by_id(id=user_id)
-        await user.protect_password()
+    async def get_user_account(self, user_id: int, projection: Optional[Projection] = None) -> UserReadModel:
+        async with self._uow as uow:
+            user: Optional[UserReadModel] = await uow.users_queries.get_user_account(
+                user_id=user_id,
+                projection=projection
+            )
+
+        if not user:
+            raise UserNotFoundError
+
         return user
 
-    async def get_all_users(self) -> List[UserModel]:
-        users_service: UsersService = UsersService(self._uow)
-        users: List[UserModel] = await users_service.get_all_users()
-        for user in users:
-            await user.protect_password()
+    async def get_all_users(
+            self,
+            page_request: PageRequest,
+            with_total: bool = False,
+            projection: Optional[Projection] = None
+    ) -> Page[UserReadModel]:
+
+        """
+        Provides one page of users. Total count of users is approximate and is provided only if requested.
+        """
+
+        total: Optional[int] = None
+        async with self._uow as uow:
+            users: List[UserReadModel] = await uow.users_queries.get_all_users(
+                page_request=page_request,
+                projection=projection
+            )
+            if with_total:
+                total = await uow.users_queries.get_approximate_users_count()
+
+        return build_page(items=users, page_request=page_request, get_id=lambda user: user.id, total=total)
+
+    async def stream_all_users(self, projection: Optional[Projection] = None) -> AsyncIterator[List[UserReadModel]]:
+        """
+        Yields partitions of all users for export. Unit of work is entered only when iteration starts, so that it is
+        kept open while response is streamed.
+        """
 
-        return users
+        async with self._uow as uow:
+            async for users in uow.users_queries.stream_all_users(projection=projection):
+                yield users
@@ -1,2 +1,3 @@
 from src.users.interfaces.units_of_work import UsersUnitOfWork
 from src.users.interfaces.repositories import UsersRepository
+from src.users.interfaces.queries import UsersQueries
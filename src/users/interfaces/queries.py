@@ -0,0 +1,50 @@
+from typing import Optional, List, AsyncIterator
+from abc import ABC, abstractmethod
+
+from src.core.interfaces import AbstractQueries
+from src.core.export import ExportConfig
+from src.core.pagination import PageRequest
+from src.core.projection import Projection
+from src.users.domain.read_models import UserReadModel
+
+
+class UsersQueries(AbstractQueries, ABC):
+    """
+    An interface for read requests related to users, that is used by users views.
+    """
+
+    @abstractmethod
+    async def get_user_account(self, user_id: int, projection: Optional[Projection] = None) -> Optional[UserReadModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_all_users(
+            self,
+            page_request: PageRequest,
+            projection: Optional[Projection] = None
+    ) -> List[UserReadModel]:
+
+        """
+        Returns users ordered by id, which ids are greater than page_request.after_id, no more than
+        page_request.limit + 1 of them, so that existence of the next page could be known. If projection is provided,
+        only its fields are selected.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_approximate_users_count(self) -> Optional[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def stream_all_users(
+            self,
+            partition_size: int = ExportConfig.YIELD_PER,
+            projection: Optional[Projection] = None
+    ) -> AsyncIterator[List[UserReadModel]]:
+
+        """
+        Yields all users ordered by id in partitions, which are fetched from the database one by one.
+        """
+
+        raise NotImplementedError
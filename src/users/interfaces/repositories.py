@@ -20,10 +20,27 @@ class UsersRepository(AbstractRepository, ABC):
     async def get_by_username(self, username: str) -> Optional[UserModel]:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_login(self, login: str) -> Optional[UserModel]:
+        """
+        Returns user, which email or username is equal to provided login. If login matches email of one user and
+        username of another, user with matching email is returned.
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     async def add(self, model: AbstractModel) -> UserModel:
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_if_not_exists(self, model: AbstractModel) -> Optional[UserModel]:
+        """
+        Adds user, unless user with the same email or username already exists, in which case returns None.
+        """
+
+        raise NotImplementedError
+
     @abstractmethod
     async def get(self, id: int) -> Optional[UserModel]:
         raise NotImplementedError
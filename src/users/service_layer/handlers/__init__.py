@@ -12,9 +12,6 @@ from src.users.domain.commands import (
     VerifyUserCredentialsCommand,
     GetUserCommand,
 )
-from src.users.service_layer.handlers.event_handlers import (
-    SendVerifyEmailMessageEventHandler,
-)
 from src.users.service_layer.handlers.command_handlers import (
     RegisterUserCommandHandler,
     VerifyUserCredentialsCommandHandler,
@@ -24,7 +21,7 @@ from src.users.service_layer.handlers.command_handlers import (
 
 
 EVENTS_HANDLERS_FOR_INJECTION: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]] = {
-    UserRegisteredEvent: [SendVerifyEmailMessageEventHandler],
+    UserRegisteredEvent: [],
 }
 
 COMMANDS_HANDLERS_FOR_INJECTION: Dict[Type[AbstractCommand], Type[AbstractCommandHandler]] = {
@@ -1,3 +1,5 @@
+from src.celery.tasks.users_tasks import send_verify_email_message
+from src.core.outbox.models import OutboxMessageModel
 from src.users.domain.events import UserRegisteredEvent
 from src.users.interfaces.handlers import UsersCommandHandler
 from src.users.domain.commands import (
@@ -9,9 +11,7 @@ from src.users.domain.commands import (
 from src.users.domain.models import UserModel
 from src.users.exceptions import (
     InvalidPasswordError,
-    UserAlreadyExistsError,
-    EmailIsNotVerifiedError,
-    UserNotFoundError
+    EmailIsNotVerifiedError
 )
 from src.users.service_layer.service import UsersService
 from src.users.utils import hash_password, verify_password
@@ -22,18 +22,30 @@ class RegisterUserCommandHandler(UsersCommandHandler):
     async def __call__(self, command: RegisterUserCommand) -> UserModel:
         """
         Registers a new user, if user with provided credentials doesn't exist, and creates event signaling that
-        operation was successfully executed.
+        operation was successfully executed. Existence of user is checked by unique constraints on insert.
+
+        Verify email message is saved to outbox in the same transaction, as the new user, and is published to Celery
+        by outbox relay, so that message is sent if and only if the user was registered.
         """
 
         async with self._uow as uow:
             users_service: UsersService = UsersService(uow=self._uow)
-            if await users_service.check_user_existence(email=command.email, username=command.username):
-                raise UserAlreadyExistsError
-
             user: UserModel = UserModel(**await command.to_dict())
             user.password = await hash_password(user.password)
 
             user = await users_service.register_user(user=user)
+            await uow.add_outbox_message(
+                OutboxMessageModel(
+                    task=send_verify_email_message.name,
+                    kwargs={
+                        'user_id': user.id,
+                        'username': user.username,
+                        'email': user.email
+                    }
+                )
+            )
+
+            await uow.commit()
             await user.protect_password()
             await uow.add_event(
                 UserRegisteredEvent(
@@ -50,18 +62,12 @@ class VerifyUserCredentialsCommandHandler(UsersCommandHandler):
 
     async def __call__(self, command: VerifyUserCredentialsCommand) -> UserModel:
         """
-        Checks, if provided by user credentials are valid.
+        Checks, if provided by user credentials are valid. User can provide either email, or username as login, which
+        are resolved by one database query.
         """
 
         users_service: UsersService = UsersService(uow=self._uow)
-
-        user: UserModel
-        if await users_service.check_user_existence(email=command.username):
-            user = await users_service.get_user_by_email(email=command.username)
-        elif await users_service.check_user_existence(username=command.username):
-            user = await users_service.get_user_by_username(username=command.username)
-        else:
-            raise UserNotFoundError
+        user: UserModel = await users_service.get_user_by_login(login=command.username)
 
         if not user.email_verified:
             raise EmailIsNotVerifiedError
@@ -1,7 +1,7 @@
 from typing import Optional, List
 
 from src.users.constants import ErrorDetails
-from src.users.exceptions import UserNotFoundError
+from src.users.exceptions import UserNotFoundError, UserAlreadyExistsError
 from src.users.domain.models import UserModel
 from src.users.interfaces.units_of_work import UsersUnitOfWork
 
@@ -15,10 +15,18 @@ class UsersService:
         self._uow: UsersUnitOfWork = uow
 
     async def register_user(self, user: UserModel) -> UserModel:
+        """
+        Registers user by one statement, relying on unique constraints of email and username instead of checking
+        their existence beforehand, which is also safe under concurrent registrations.
+        """
+
         async with self._uow as uow:
-            user = await uow.users.add(model=user)
+            registered_user: Optional[UserModel] = await uow.users.add_if_not_exists(model=user)
+            if not registered_user:
+                raise UserAlreadyExistsError
+
             await uow.commit()
-            return user
+            return registered_user
 
     async def check_user_existence(
             self,
@@ -65,6 +73,14 @@ class UsersService:
 
             return user
 
+    async def get_user_by_login(self, login: str) -> UserModel:
+        async with self._uow as uow:
+            user: Optional[UserModel] = await uow.users.get_by_login(login=login)
+            if not user:
+                raise UserNotFoundError
+
+            return user
+
     async def get_user_by_id(self, id: int) -> UserModel:
         async with self._uow as uow:
             user: Optional[UserModel] = await uow.users.get(id=id)
@@ -3,6 +3,8 @@ from typing import Self
 from src.users.interfaces.repositories import UsersRepository
 from src.users.interfaces.units_of_work import UsersUnitOfWork
 from src.users.adapters.repositories import SQLAlchemyUsersRepository
+from src.users.interfaces.queries import UsersQueries
+from src.users.adapters.queries import SQLAlchemyUsersQueries
 from src.core.database.interfaces.units_of_work import SQLAlchemyAbstractUnitOfWork
 
 
@@ -11,4 +13,5 @@ class SQLAlchemyUsersUnitOfWork(SQLAlchemyAbstractUnitOfWork, UsersUnitOfWork):
     async def __aenter__(self) -> Self:
         uow = await super().__aenter__()
         self.users: UsersRepository = SQLAlchemyUsersRepository(session=self._session)
+        self.users_queries: UsersQueries = SQLAlchemyUsersQueries(session=self._session)
         return uow
@@ -0,0 +1,91 @@
+import json
+import os
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Sequence
+from sqlalchemy import select, func, Row
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.bulk_import.importer import BulkImporter
+from src.bulk_import.sources import write_checkpoint
+from src.core.database.connection import DATABASE_URL
+from src.groups.adapters.orm import groups_table, group_members_table
+from src.users.adapters.orm import users_table
+from src.users.utils import verify_password
+
+
+def write_users_csv(path: Path, count: int) -> None:
+    lines: List[str] = ['email,username,password,email_verified']
+    lines.extend(f'user_{index}@test.com,user_{index},password_{index},true' for index in range(count))
+    path.write_text('\n'.join(lines) + '\n')
+
+
+@pytest.mark.anyio
+async def test_bulk_importer_imports_users_with_hashed_passwords(map_models_to_orm: None, tmp_path: Path) -> None:
+    source: Path = tmp_path / 'users.csv'
+    write_users_csv(path=source, count=5)
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        importer: BulkImporter = BulkImporter(
+            entity='users',
+            source=str(source),
+            engine=engine,
+            executor=executor,
+            workers=2,
+            batch_size=2
+        )
+        assert await importer.run() == 5
+
+    async with engine.connect() as conn:
+        users: Sequence[Row] = (
+            await conn.execute(select(users_table).order_by(users_table.c.id))
+        ).all()
+
+    await engine.dispose()
+    assert [user.username for user in users] == [f'user_{index}' for index in range(5)]
+    assert all(user.email_verified for user in users)
+    assert await verify_password(plain_password='password_4', hashed_password=users[4].password)
+    assert not os.path.exists(str(source) + '.checkpoint')
+
+
+@pytest.mark.anyio
+async def test_bulk_importer_resumes_from_checkpoint_and_skips_existing_rows(
+        map_models_to_orm: None,
+        tmp_path: Path
+) -> None:
+
+    source: Path = tmp_path / 'users.csv'
+    write_users_csv(path=source, count=4)
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    await BulkImporter(entity='users', source=str(source), engine=engine).run()
+
+    # Import was interrupted after the first batch, which was committed, but was not checkpointed:
+    write_users_csv(path=source, count=6)
+    checkpoint: str = str(tmp_path / 'users.checkpoint')
+    write_checkpoint(path=checkpoint, source=str(source), entity='users', imported=2)
+    assert await BulkImporter(entity='users', source=str(source), engine=engine, checkpoint=checkpoint).run() == 4
+
+    async with engine.connect() as conn:
+        assert await conn.scalar(select(func.count()).select_from(users_table)) == 6
+
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_bulk_importer_imports_groups_and_members_from_ndjson(create_test_user: None, tmp_path: Path) -> None:
+    groups_source: Path = tmp_path / 'groups.ndjson'
+    groups_source.write_text('\n'.join(json.dumps({'owner_id': 1, 'name': f'group_{index}'}) for index in range(3)))
+    members_source: Path = tmp_path / 'members.ndjson'
+    members_source.write_text('\n'.join(json.dumps({'group_id': index, 'user_id': 1}) for index in range(1, 4)))
+
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    assert await BulkImporter(entity='groups', source=str(groups_source), engine=engine).run() == 3
+    assert await BulkImporter(entity='members', source=str(members_source), engine=engine).run() == 3
+
+    async with engine.connect() as conn:
+        assert await conn.scalar(select(func.count()).select_from(groups_table)) == 3
+        assert await conn.scalar(select(func.count()).select_from(group_members_table)) == 3
+        assert list(await conn.scalars(select(groups_table.c.member_count).order_by(groups_table.c.id))) == [1, 1, 1]
+
+    await engine.dispose()
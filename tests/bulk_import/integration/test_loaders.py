@@ -0,0 +1,49 @@
+import pytest
+from datetime import datetime, timezone
+from typing import List, Dict, Any
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.bulk_import.loaders import PostgresCopyLoader
+from src.core.database.metadata import metadata
+from src.users.adapters.orm import users_table
+from tests.utils import get_postgres_test_url, postgres_is_reachable
+
+
+def create_users_rows(start: int, count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            'email': f'user_{index}@test.com',
+            'username': f'user_{index}',
+            'password': f'password_{index}',
+            'email_verified': False,
+            'created_at': datetime.now(tz=timezone.utc)
+        }
+        for index in range(start, start + count)
+    ]
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(not postgres_is_reachable(), reason='PostgreSQL server is not reachable')
+async def test_postgres_copy_loader_assigns_ids_only_by_final_insert(map_models_to_orm: None) -> None:
+    engine: AsyncEngine = create_async_engine(get_postgres_test_url())
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+
+    try:
+        loader: PostgresCopyLoader = PostgresCopyLoader()
+        for start in (0, 3):
+            async with engine.begin() as conn:
+                await loader.load(connection=conn, table=users_table, rows=create_users_rows(start=start, count=3))
+
+        # Staging table has no id default, so sequence values are not used up by staged rows:
+        async with engine.connect() as conn:
+            ids: List[int] = list((await conn.execute(select(users_table.c.id).order_by(users_table.c.id))).scalars())
+
+        assert ids == [1, 2, 3, 4, 5, 6]
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+
+        await engine.dispose()
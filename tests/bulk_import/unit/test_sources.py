@@ -0,0 +1,44 @@
+import io
+import pytest
+from pathlib import Path
+from typing import List, Dict, Any
+
+from src.bulk_import.config import BulkImportConfig
+from src.bulk_import.sources import detect_format, read_records, read_batches, read_checkpoint, write_checkpoint
+
+
+@pytest.mark.parametrize(
+    'path, source_format',
+    [
+        ('users.csv', BulkImportConfig.CSV_FORMAT),
+        ('users.ndjson', BulkImportConfig.NDJSON_FORMAT),
+        ('users.JSONL', BulkImportConfig.NDJSON_FORMAT),
+    ]
+)
+def test_detect_format(path: str, source_format: str) -> None:
+    assert detect_format(path=path) == source_format
+
+
+def test_read_records_from_csv_and_ndjson() -> None:
+    expected_records: List[Dict[str, Any]] = [{'group_id': '1', 'user_id': '2'}, {'group_id': '1', 'user_id': '3'}]
+    csv_source: io.StringIO = io.StringIO('group_id,user_id\n1,2\n1,3\n')
+    assert list(read_records(source=csv_source, source_format=BulkImportConfig.CSV_FORMAT)) == expected_records
+
+    ndjson_source: io.StringIO = io.StringIO('{"group_id": "1", "user_id": "2"}\n\n{"group_id": "1", "user_id": "3"}\n')
+    assert list(read_records(source=ndjson_source, source_format=BulkImportConfig.NDJSON_FORMAT)) == expected_records
+
+
+def test_read_batches_skips_imported_records() -> None:
+    records: List[Dict[str, Any]] = [{'id': index} for index in range(7)]
+    batches: List[List[Dict[str, Any]]] = list(read_batches(records=iter(records), batch_size=2, skip=2))
+    assert batches == [records[2:4], records[4:6], records[6:]]
+
+
+def test_checkpoint_is_bound_to_source_and_entity(tmp_path: Path) -> None:
+    checkpoint: str = str(tmp_path / 'users.csv.checkpoint')
+    assert read_checkpoint(path=checkpoint, source='users.csv', entity='users') == 0
+
+    write_checkpoint(path=checkpoint, source='users.csv', entity='users', imported=10)
+    assert read_checkpoint(path=checkpoint, source='users.csv', entity='users') == 10
+    assert read_checkpoint(path=checkpoint, source='users.csv', entity='groups') == 0
+    assert read_checkpoint(path=checkpoint, source='other.csv', entity='users') == 0
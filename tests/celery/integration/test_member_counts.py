@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import insert, update, select
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker
+from typing import Dict
+
+from src.celery.member_counts import MemberCountsReconciler
+from src.core.database.connection import DATABASE_URL
+from src.groups.adapters.orm import groups_table, group_members_table
+from src.users.adapters.orm import users_table
+
+
+@pytest.mark.anyio
+async def test_member_counts_reconciler_repairs_drifted_groups_in_batches(map_models_to_orm: None) -> None:
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(users_table),
+            [
+                {'email': f'user_{index}@test.com', 'username': f'user_{index}', 'password': 'password'}
+                for index in range(3)
+            ]
+        )
+        await conn.execute(insert(groups_table), [{'owner_id': 1, 'name': f'group_{index}'} for index in range(5)])
+        await conn.execute(
+            insert(group_members_table),
+            [{'group_id': group_id, 'user_id': user_id} for group_id in (1, 4) for user_id in (1, 2, 3)]
+        )
+
+        # Group 2 has drifted count, while group 4 has the actual one:
+        await conn.execute(update(groups_table).where(groups_table.c.id.in_([2, 4])).values(member_count=3))
+
+    reconciler: MemberCountsReconciler = MemberCountsReconciler(
+        session_factory=async_sessionmaker(bind=engine),
+        batch_size=2
+    )
+    assert await reconciler.reconcile() == 2
+
+    async with engine.connect() as conn:
+        member_counts: Dict[int, int] = {
+            row.id: row.member_count
+            for row in await conn.execute(select(groups_table.c.id, groups_table.c.member_count))
+        }
+
+    assert member_counts == {1: 3, 2: 0, 3: 0, 4: 3, 5: 0}
+    assert await reconciler.reconcile() == 0
+    await engine.dispose()
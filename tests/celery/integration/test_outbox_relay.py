@@ -0,0 +1,74 @@
+import pytest
+from celery import Celery
+from sqlalchemy import insert, select, CursorResult, Row
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+from typing import Sequence, List, Dict, Any
+
+from src.celery.outbox_relay import OutboxRelay
+from src.celery.tasks.users_tasks import send_verify_email_message
+from src.core.database.connection import DATABASE_URL
+from src.core.outbox.orm import outbox_table
+from tests.config import FakeUserConfig
+
+
+async def create_outbox_messages(count: int) -> None:
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(outbox_table),
+            [
+                {
+                    'task': send_verify_email_message.name,
+                    'kwargs': {'user_id': i, 'username': FakeUserConfig.USERNAME, 'email': FakeUserConfig.EMAIL}
+                }
+                for i in range(1, count + 1)
+            ]
+        )
+
+
+def consume_published_tasks(celery_app: Celery) -> List[Dict[str, Any]]:
+    with celery_app.connection_for_read() as connection:
+        queue = connection.SimpleQueue(celery_app.conf.task_default_queue)
+        published_tasks: List[Dict[str, Any]] = []
+        while queue.qsize():
+            message = queue.get(block=False)
+            published_tasks.append({'task': message.headers['task'], 'kwargs': message.payload[1]})
+            message.ack()
+
+        queue.close()
+        return published_tasks
+
+
+@pytest.mark.anyio
+async def test_outbox_relay_publishes_and_deletes_messages(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection,
+        celery_app: Celery
+) -> None:
+
+    await create_outbox_messages(count=3)
+    relay: OutboxRelay = OutboxRelay(celery=celery_app)
+    assert await relay.relay() == 3
+
+    published_tasks: List[Dict[str, Any]] = consume_published_tasks(celery_app=celery_app)
+    assert [task['task'] for task in published_tasks] == [send_verify_email_message.name] * 3
+    assert [task['kwargs']['user_id'] for task in published_tasks] == [1, 2, 3]
+
+    cursor: CursorResult = await async_connection.execute(select(outbox_table))
+    result: Sequence[Row] = cursor.all()
+    assert not result
+
+
+@pytest.mark.anyio
+async def test_outbox_relay_publishes_messages_in_batches(
+        map_models_to_orm: None,
+        celery_app: Celery
+) -> None:
+
+    await create_outbox_messages(count=5)
+    relay: OutboxRelay = OutboxRelay(celery=celery_app, batch_size=2)
+    assert await relay.relay() == 2
+    assert await relay.relay() == 2
+    assert await relay.relay() == 1
+    assert await relay.relay() == 0
+    assert len(consume_published_tasks(celery_app=celery_app)) == 5
@@ -25,3 +25,10 @@ class FakeUserConfig(BaseTestConfig):
 class FakeGroupConfig(BaseTestConfig):
     NAME: str = 'test_group_name'
     OWNER_ID: int = 1
+
+
+@dataclass
+class LargeTablesConfig(BaseTestConfig):
+    USERS_COUNT: int = 1000
+    GROUPS_PER_USER: int = 10
+    MEMBERS_PER_GROUP: int = 3
@@ -2,12 +2,14 @@ import pytest
 import os
 from celery import Celery
 from httpx import AsyncClient, Cookies, Response
-from sqlalchemy import insert
+from sqlalchemy import insert, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncConnection
 from sqlalchemy.exc import ArgumentError, IntegrityError
 from typing import AsyncGenerator
 
 from src.app import app
+from src.bootstrap import create_messagebus_factory
+from src.core.messagebus import MessageBus
 from src.users.config import RouterConfig, URLPathsConfig, cookies_config
 from src.users.domain.models import UserModel
 from src.core.database.connection import DATABASE_URL
@@ -18,7 +20,13 @@ from src.users.utils import hash_password
 from src.celery.celery_app import celery
 from src.groups.domain.models import GroupModel
 from tests.config import FakeUserConfig, FakeGroupConfig
-from tests.utils import get_base_url, drop_test_db
+from tests.utils import (
+    get_base_url,
+    drop_test_db,
+    get_postgres_test_url,
+    postgres_is_reachable,
+    insert_large_tables_rows
+)
 
 
 @pytest.fixture(scope='session')
@@ -61,12 +69,23 @@ async def map_models_to_orm(create_test_db: None) -> None:
 async def async_client(map_models_to_orm: None) -> AsyncGenerator[AsyncClient, None]:
     """
     Creates test app client for end-to-end tests to make requests to endpoints with.
+    Lifespan events are not triggered by test client, so messagebus factory is created here.
     """
 
+    app.state.messagebus_factory = create_messagebus_factory()
     async with AsyncClient(app=app, base_url=get_base_url()) as async_client:
         yield async_client
 
 
+@pytest.fixture
+async def messagebus(map_models_to_orm: None) -> MessageBus:
+    """
+    Creates messagebus the same way, as it is provided to dependencies during request handling.
+    """
+
+    return await create_messagebus_factory().get_messagebus()
+
+
 @pytest.fixture
 async def create_test_user(map_models_to_orm: None) -> None:
     """
@@ -131,3 +150,67 @@ async def create_test_group(create_test_user: None) -> None:
             await conn.commit()
         except IntegrityError:
             await conn.rollback()
+
+
+@pytest.fixture
+async def seed_large_tables(map_models_to_orm: None) -> None:
+    """
+    Seeds users, groups and group members tables with enough rows, for sequential scans to be more expensive than
+    index scans, and updates planner statistics, so that query plans are the same as on production-sized tables.
+    """
+
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as conn:
+        await insert_large_tables_rows(connection=conn)
+        await conn.execute(text('ANALYZE'))
+
+    await engine.dispose()
+
+
+@pytest.fixture(
+    params=[
+        'sqlite',
+        pytest.param(
+            'postgresql',
+            marks=pytest.mark.skipif(not postgres_is_reachable(), reason='PostgreSQL is not reachable')
+        )
+    ]
+)
+async def large_tables_engine(
+        request: pytest.FixtureRequest,
+        map_models_to_orm: None
+) -> AsyncGenerator[AsyncEngine, None]:
+
+    """
+    Provides engine of the database with seeded large tables. Query plans are checked on SQLite, which is used by
+    tests, and, if it is reachable, on PostgreSQL, which is used in production and has its own planner and indexes
+    options, such as INCLUDE columns.
+
+    PostgreSQL tables are vacuumed after seeding, so that visibility map allows index-only scans, as on long-living
+    production tables.
+    """
+
+    is_postgresql: bool = request.param == 'postgresql'
+    engine: AsyncEngine = create_async_engine(get_postgres_test_url() if is_postgresql else DATABASE_URL)
+    async with engine.begin() as conn:
+        if is_postgresql:
+            await conn.run_sync(metadata.drop_all)
+            await conn.run_sync(metadata.create_all)
+
+        await insert_large_tables_rows(connection=conn)
+        if not is_postgresql:
+            await conn.execute(text('ANALYZE'))
+
+    if is_postgresql:
+        async with engine.connect() as conn:
+            await conn.execution_options(isolation_level='AUTOCOMMIT')
+            await conn.execute(text('VACUUM ANALYZE'))
+
+    try:
+        yield engine
+    finally:
+        if is_postgresql:
+            async with engine.begin() as conn:
+                await conn.run_sync(metadata.drop_all)
+
+        await engine.dispose()
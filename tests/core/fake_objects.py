@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from typing import Any
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Self
 
 from src.core.interfaces import (
     AbstractModel,
@@ -31,6 +33,16 @@ class FakeEvent(AbstractEvent):
     field2: int = 123
 
 
+@dataclass(frozen=True)
+class FakeEventWithSet(AbstractEvent):
+    """
+    Event with set field to test events serialization.
+    """
+
+    field1: str = 'test'
+    field2: Set[str] = field(default_factory=lambda: {'test1', 'test2'})
+
+
 @dataclass(frozen=True)
 class FakeCommand(AbstractCommand):
     """
@@ -41,6 +53,13 @@ class FakeCommand(AbstractCommand):
     field2: int = 123
 
 
+@dataclass(frozen=True)
+class FakeFailingCommand(AbstractCommand):
+    """
+    Command, which is handled by FakeFailingCommandHandler.
+    """
+
+
 class FakeEventHandler(AbstractEventHandler):
 
     def __init__(self, uow: AbstractUnitOfWork, field1: str, field2: int, create_recursion_event: bool = False) -> None:
@@ -63,6 +82,24 @@ class FakeEventHandler(AbstractEventHandler):
         return hash(self) == hash(other)
 
 
+class FakeSlowEventHandler(AbstractEventHandler):
+    """
+    Concurrency safe event handler, which is used to test concurrent events handling by messagebus.
+    """
+
+    CONCURRENCY_SAFE = True
+
+    def __init__(self, uow: AbstractUnitOfWork, delay: float) -> None:
+        self.uow = uow
+        self.delay: float = delay
+
+        self.called: bool = False
+
+    async def __call__(self, event: AbstractEvent) -> None:
+        await asyncio.sleep(self.delay)
+        self.called = True
+
+
 class FakeCommandHandler(AbstractCommandHandler):
 
     def __init__(self, uow: AbstractUnitOfWork, field1: str, field2: int) -> None:
@@ -83,14 +120,187 @@ class FakeCommandHandler(AbstractCommandHandler):
         return hash(self) == hash(other)
 
 
+class FakeFailingCommandHandler(AbstractCommandHandler):
+
+    def __init__(self, uow: AbstractUnitOfWork) -> None:
+        self.uow = uow
+
+    async def __call__(self, command: AbstractCommand) -> None:
+        await self.uow.add_event(FakeEvent())
+        raise ValueError
+
+
 class FakeCoreUnitOfWork(AbstractUnitOfWork):
+    """
+    Reentrant unit of work, which is committed only by the outermost scope, or outside of any scope.
+    """
 
     def __init__(self) -> None:
         super().__init__()
         self.committed: bool = False
+        self._depth: int = 0
+
+    async def __aenter__(self) -> Self:
+        self._depth += 1
+        return await super().__aenter__()
+
+    async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
+        self._depth -= 1
+        if not self._depth:
+            await super().__aexit__(*args, **kwargs)
+
+    @property
+    def is_reentrant(self) -> bool:
+        return True
 
     async def commit(self) -> None:
-        self.committed = True
+        if self._depth <= 1:
+            self.committed = True
 
     async def rollback(self) -> None:
         pass
+
+
+class FakeFailingEventHandler(AbstractEventHandler):
+    """
+    Event handler, which fails provided number of times, after which handles events successfully.
+    """
+
+    def __init__(self, uow: AbstractUnitOfWork, failures: int = 1) -> None:
+        self.uow = uow
+        self.failures: int = failures
+
+        self.called: bool = False
+
+    async def __call__(self, event: AbstractEvent) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ValueError
+
+        self.called = True
+
+
+class FakeRedisPipeline:
+
+    def __init__(self, redis: 'FakeRedis') -> None:
+        self._redis: FakeRedis = redis
+        self._commands: List[Callable[[], Any]] = []
+
+    async def __aenter__(self) -> 'FakeRedisPipeline':
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self._commands.clear()
+
+    def xadd(self, name: str, fields: Dict[str, str], **kwargs: Any) -> None:
+        self._commands.append(lambda: self._redis.add_entry(name=name, fields=fields))
+
+    def xpending_range(self, **kwargs: Any) -> None:
+        self._commands.append(lambda: self._redis.get_pending_range(**kwargs))
+
+    def xack(self, name: str, groupname: str, *ids: str) -> None:
+        self._commands.append(lambda: self._redis.acknowledge(*ids))
+
+    async def execute(self) -> List[Any]:
+        self._redis.round_trips += 1
+        return [command() for command in self._commands]
+
+
+class FakeRedis:
+    """
+    In-memory implementation of Redis Streams commands, which are used by events transport. Supports only a single
+    consumer group. Entries of the events stream are kept in entries, and of other streams in streams by their names.
+    """
+
+    def __init__(self, stream: str = 'events') -> None:
+        self.streams: Dict[str, List[Tuple[str, Dict[str, str]]]] = {stream: []}
+        self.entries: List[Tuple[str, Dict[str, str]]] = self.streams[stream]
+        self.pending: Dict[str, Tuple[str, float]] = {}
+        self.deliveries: Dict[str, int] = {}
+        self.round_trips: int = 0
+        self._last_delivered_index: int = 0
+
+    def add_entry(self, name: str, fields: Dict[str, str]) -> str:
+        entries: List[Tuple[str, Dict[str, str]]] = self.streams.setdefault(name, [])
+        entry_id: str = f'{len(entries) + 1}-0'
+        entries.append((entry_id, fields))
+        return entry_id
+
+    def get_pending_range(self, name: str, groupname: str, min: str, max: str, count: int) -> List[Dict[str, Any]]:
+        pending_range: List[Dict[str, Any]] = []
+        for entry_id, (consumername, delivered_at) in sorted(self.pending.items()):
+            if min <= entry_id <= max and len(pending_range) < count:
+                pending_range.append({
+                    'message_id': entry_id,
+                    'consumer': consumername,
+                    'time_since_delivered': int((time.monotonic() - delivered_at) * 1000),
+                    'times_delivered': self.deliveries[entry_id]
+                })
+
+        return pending_range
+
+    def acknowledge(self, *ids: str) -> int:
+        for entry_id in ids:
+            self.pending.pop(entry_id, None)
+            self.deliveries.pop(entry_id, None)
+
+        return len(ids)
+
+    def pipeline(self, transaction: bool = True) -> FakeRedisPipeline:
+        return FakeRedisPipeline(redis=self)
+
+    async def xadd(self, name: str, fields: Dict[str, str], **kwargs: Any) -> str:
+        self.round_trips += 1
+        return self.add_entry(name=name, fields=fields)
+
+    async def xgroup_create(self, **kwargs: Any) -> None:
+        self.round_trips += 1
+
+    async def xreadgroup(
+            self,
+            groupname: str,
+            consumername: str,
+            streams: Dict[str, str],
+            count: int,
+            block: Optional[int] = None
+    ) -> List[Any]:
+
+        self.round_trips += 1
+        entries: List[Tuple[str, Dict[str, str]]] = self.entries[self._last_delivered_index:][:count]
+        self._last_delivered_index += len(entries)
+        for entry_id, _ in entries:
+            self.pending[entry_id] = (consumername, time.monotonic())
+            self.deliveries[entry_id] = 1
+
+        if not entries:
+            return []
+
+        return [[next(iter(streams)), entries]]
+
+    async def xautoclaim(
+            self,
+            name: str,
+            groupname: str,
+            consumername: str,
+            min_idle_time: int,
+            start_id: str = '0-0',
+            count: Optional[int] = None
+    ) -> List[Any]:
+
+        self.round_trips += 1
+        claimed: List[Tuple[str, Dict[str, str]]] = []
+        for entry_id, fields in self.entries:
+            if entry_id not in self.pending or len(claimed) == count:
+                continue
+
+            _, delivered_at = self.pending[entry_id]
+            if (time.monotonic() - delivered_at) * 1000 >= min_idle_time:
+                self.pending[entry_id] = (consumername, time.monotonic())
+                self.deliveries[entry_id] += 1
+                claimed.append((entry_id, fields))
+
+        return ['0-0', claimed, []]
+
+    async def xack(self, name: str, groupname: str, *ids: str) -> int:
+        self.round_trips += 1
+        return self.acknowledge(*ids)
@@ -9,7 +9,14 @@ from src.core.interfaces import (
     AbstractUnitOfWork
 )
 from src.core.messagebus import MessageBus
-from src.core.bootstrap import Bootstrap
+from src.core.bootstrap import (
+    Bootstrap,
+    LazyHandlersMapping,
+    MessageBusFactory,
+    get_injection_plan,
+    merge_events_handlers_for_injection,
+    merge_commands_handlers_for_injection
+)
 from tests.core.fake_objects import (
     FakeEvent,
     FakeCommand,
@@ -20,7 +27,7 @@ from tests.core.fake_objects import (
 
 
 @pytest.mark.anyio
-async def test_bootstrap_inject_dependencies_success() -> None:
+async def test_bootstrap_build_handler_success() -> None:
     uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
     dependencies: Dict[str, Any] = await FakeEvent().to_dict()
     events_handlers_for_injection: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]] = {
@@ -34,7 +41,7 @@ async def test_bootstrap_inject_dependencies_success() -> None:
         dependencies=dependencies
     )
 
-    injected_handler: Union[AbstractEventHandler | AbstractCommandHandler] = await bootstrap._inject_dependencies(
+    injected_handler: Union[AbstractEventHandler | AbstractCommandHandler] = bootstrap._build_handler(
         handler=FakeEventHandler
     )
 
@@ -43,8 +50,7 @@ async def test_bootstrap_inject_dependencies_success() -> None:
     assert injected_handler == expected_handler
 
 
-@pytest.mark.anyio
-async def test_bootstrap_inject_dependencies_fail_not_all_dependencies_provided() -> None:
+def test_bootstrap_build_handler_fail_not_all_dependencies_provided() -> None:
     uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
     events_handlers_for_injection: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]] = {
         FakeEvent: [FakeEventHandler]
@@ -57,7 +63,7 @@ async def test_bootstrap_inject_dependencies_fail_not_all_dependencies_provided(
     )
 
     with pytest.raises(TypeError):
-        await bootstrap._inject_dependencies(handler=FakeEventHandler)
+        bootstrap._build_handler(handler=FakeEventHandler)
 
 
 @pytest.mark.anyio
@@ -87,3 +93,73 @@ async def test_bootstrap_get_messagebus_success() -> None:
     assert messagebus._event_handlers == {
         FakeEvent: [FakeEventHandler(uow=uow, field1='test', field2=123)]
     }
+
+
+@pytest.mark.anyio
+async def test_bootstrap_get_messagebus_builds_handlers_lazily() -> None:
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    dependencies: Dict[str, Any] = await FakeEvent().to_dict()
+    command_handlers_for_injection: Dict[Type[AbstractCommand], Type[AbstractCommandHandler]] = {
+        FakeCommand: FakeCommandHandler
+    }
+
+    bootstrap: Bootstrap = Bootstrap(
+        uow=uow,
+        events_handlers_for_injection={FakeEvent: [FakeEventHandler]},
+        commands_handlers_for_injection=command_handlers_for_injection,
+        dependencies=dependencies
+    )
+
+    messagebus: MessageBus = await bootstrap.get_messagebus()
+    assert isinstance(messagebus._command_handlers, LazyHandlersMapping)
+    assert isinstance(messagebus._event_handlers, LazyHandlersMapping)
+    assert not messagebus._command_handlers._handlers
+    assert not messagebus._event_handlers._handlers
+
+    await messagebus.handle(message=FakeCommand())
+    assert messagebus._command_handlers[FakeCommand].called
+    assert messagebus._event_handlers[FakeEvent][0].called
+
+    # Handlers are built only once for messagebus lifetime:
+    assert messagebus._command_handlers[FakeCommand] is messagebus._command_handlers[FakeCommand]
+
+
+def test_get_injection_plan_is_compiled_once() -> None:
+    get_injection_plan.cache_clear()
+    assert get_injection_plan(FakeEventHandler) == ('uow', 'field1', 'field2', 'create_recursion_event')
+    assert get_injection_plan(FakeEventHandler) is get_injection_plan(FakeEventHandler)
+    assert get_injection_plan.cache_info().misses == 1
+
+
+@pytest.mark.anyio
+async def test_messagebus_factory_binds_fresh_unit_of_work_for_each_messagebus() -> None:
+    messagebus_factory: MessageBusFactory = MessageBusFactory(
+        uow_factory=FakeCoreUnitOfWork,
+        events_handlers_for_injection={FakeEvent: [FakeEventHandler]},
+        commands_handlers_for_injection={FakeCommand: FakeCommandHandler},
+        dependencies=await FakeEvent().to_dict()
+    )
+
+    first_messagebus: MessageBus = await messagebus_factory.get_messagebus()
+    second_messagebus: MessageBus = await messagebus_factory.get_messagebus()
+    assert isinstance(first_messagebus._uow, FakeCoreUnitOfWork)
+    assert first_messagebus._uow is not second_messagebus._uow
+
+
+def test_merge_events_handlers_for_injection_success() -> None:
+    merged_events_handlers: Dict[Type[AbstractEvent], List[Type[AbstractEventHandler]]] = (
+        merge_events_handlers_for_injection(
+            {FakeEvent: [FakeEventHandler]},
+            {FakeEvent: [FakeEventHandler]}
+        )
+    )
+
+    assert merged_events_handlers == {FakeEvent: [FakeEventHandler, FakeEventHandler]}
+
+
+def test_merge_commands_handlers_for_injection_fail_command_already_has_handler() -> None:
+    with pytest.raises(AssertionError):
+        merge_commands_handlers_for_injection(
+            {FakeCommand: FakeCommandHandler},
+            {FakeCommand: FakeCommandHandler}
+        )
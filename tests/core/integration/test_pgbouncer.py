@@ -0,0 +1,56 @@
+import asyncio
+import os
+import socket
+import pytest
+from sqlalchemy import text, URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.core.database.config import DatabaseConfig, database_config
+from src.core.database.pool import get_pool_options
+
+
+PGBOUNCER_HOST: str = os.environ.get('PGBOUNCER_HOST', 'localhost')
+PGBOUNCER_PORT: int = int(os.environ.get('PGBOUNCER_PORT', '6432'))
+
+
+def pgbouncer_is_reachable() -> bool:
+    try:
+        with socket.create_connection((PGBOUNCER_HOST, PGBOUNCER_PORT), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(not pgbouncer_is_reachable(), reason='PgBouncer is not reachable')
+async def test_pgbouncer_profile_runs_prepared_statements_in_transaction_pooling_mode() -> None:
+    """
+    Several client connections run the same statement in many short transactions, so that their statements are
+    prepared on different server connections, which fails with asyncpg's default statements cache and names.
+    """
+
+    config: DatabaseConfig = database_config.model_copy(
+        update={'DATABASE_DIALECT': 'postgresql', 'DATABASE_DRIVER': 'asyncpg', 'DATABASE_PGBOUNCER': True}
+    )
+    engine: AsyncEngine = create_async_engine(
+        URL.create(
+            drivername='postgresql+asyncpg',
+            username=os.environ.get('PGBOUNCER_USER', 'postgresql'),
+            password=os.environ.get('PGBOUNCER_PASSWORD', 'postgresql'),
+            host=PGBOUNCER_HOST,
+            port=PGBOUNCER_PORT,
+            database=os.environ.get('PGBOUNCER_DATABASE', 'benefit_bistro')
+        ),
+        **get_pool_options(config=config)
+    )
+
+    async def run_transactions() -> None:
+        async with engine.connect() as conn:
+            for value in range(10):
+                assert await conn.scalar(text('SELECT CAST(:value AS INTEGER)'), {'value': value}) == value
+                await conn.commit()
+
+    try:
+        await asyncio.gather(*(run_transactions() for _ in range(20)))
+    finally:
+        await engine.dispose()
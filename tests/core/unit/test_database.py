@@ -1,11 +1,26 @@
 import pytest
-from typing import Sequence, Optional
+from datetime import datetime, timezone
+from typing import Sequence, Optional, Dict, Any
 from sqlalchemy import insert, select, CursorResult, Row
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
 
+from src.core.database.config import DatabaseConfig, database_config
+from src.core.database.connection import DATABASE_URL
+from src.core.database.pool import (
+    TimedAsyncAdaptedQueuePool,
+    get_pool_limits,
+    get_pool_options,
+    register_pool_metrics,
+    get_prepared_statement_name
+)
+from src.core.exceptions import UnitOfWorkRollbackOnlyError, UnitOfWorkReadOnlyError
+from src.core.metrics import MetricsRegistry
 from src.users.domain.models import UserModel
 from src.core.database.interfaces.units_of_work import SQLAlchemyAbstractUnitOfWork
+from src.core.outbox.models import OutboxMessageModel
+from src.core.outbox.orm import outbox_table
 from tests.config import FakeUserConfig
 
 
@@ -41,3 +56,210 @@ async def test_sqlalchemy_abstract_unit_of_work_not_saves_incorrect_model_and_ro
     cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(email=FakeUserConfig.EMAIL))
     result: Sequence[Row] = cursor.all()
     assert not result
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_saves_outbox_messages_in_the_same_transaction(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    started_at: datetime = datetime.now(tz=timezone.utc)
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork()
+    async with uow:
+        new_user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True))
+        await uow._session.execute(insert(UserModel).values(**await new_user.to_dict()))
+        await uow.add_outbox_message(OutboxMessageModel(task='test_task', kwargs={'email': FakeUserConfig.EMAIL}))
+        await uow.commit()
+
+    cursor: CursorResult = await async_connection.execute(select(outbox_table))
+    result: Sequence[Row] = cursor.all()
+    assert len(result) == 1
+    assert result[0].task == 'test_task'
+    assert result[0].kwargs == {'email': FakeUserConfig.EMAIL}
+
+    # Message is created at the time of its transaction, not at the time of module import. SQLite drops time zone:
+    assert result[0].created_at.replace(tzinfo=timezone.utc) >= started_at
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_discards_outbox_messages_on_rollback(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork()
+    async with uow:
+        await uow.add_outbox_message(OutboxMessageModel(task='test_task'))
+        await uow.rollback()
+        await uow.commit()
+
+    cursor: CursorResult = await async_connection.execute(select(outbox_table))
+    result: Sequence[Row] = cursor.all()
+    assert not result
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_nested_scopes_share_session_and_commit_on_outermost_exit(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork()
+    assert uow.is_reentrant
+    async with uow:
+        session: AsyncSession = uow._session
+        async with uow:
+            assert uow._session is session
+            assert uow.is_nested
+            new_user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True))
+            await uow._session.execute(insert(UserModel).values(**await new_user.to_dict()))
+            await uow.commit()
+
+        assert uow._session is session
+        assert not uow.is_nested
+
+    cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(email=FakeUserConfig.EMAIL))
+    result: Optional[Row] = cursor.first()
+    assert result
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_rollbacks_whole_transaction_if_nested_scope_fails(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork()
+    with pytest.raises(ValueError):
+        async with uow:
+            async with uow:
+                new_user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True))
+                await uow._session.execute(insert(UserModel).values(**await new_user.to_dict()))
+                await uow.commit()
+
+            async with uow:
+                raise ValueError
+
+    cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(email=FakeUserConfig.EMAIL))
+    result: Sequence[Row] = cursor.all()
+    assert not result
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_fails_to_commit_rollback_only_transaction(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork()
+    with pytest.raises(UnitOfWorkRollbackOnlyError):
+        async with uow:
+            new_user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True))
+            await uow._session.execute(insert(UserModel).values(**await new_user.to_dict()))
+            async with uow:
+                await uow.rollback()
+
+            await uow.commit()
+
+    cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(email=FakeUserConfig.EMAIL))
+    result: Sequence[Row] = cursor.all()
+    assert not result
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_abstract_unit_of_work_fails_to_commit_read_only_transaction(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    uow: SQLAlchemyAbstractUnitOfWork = SQLAlchemyAbstractUnitOfWork(read_only=True)
+    assert uow.is_read_only
+    with pytest.raises(UnitOfWorkReadOnlyError):
+        async with uow:
+            new_user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True))
+            await uow._session.execute(insert(UserModel).values(**await new_user.to_dict()))
+            await uow.commit()
+
+    cursor: CursorResult = await async_connection.execute(select(UserModel).filter_by(email=FakeUserConfig.EMAIL))
+    result: Sequence[Row] = cursor.all()
+    assert not result
+
+
+def test_get_pool_limits_divides_connections_budget_between_workers() -> None:
+    config: DatabaseConfig = database_config.model_copy(
+        update={'DATABASE_POOL_SIZE': 5, 'DATABASE_MAX_OVERFLOW': 10, 'DATABASE_CONNECTIONS_BUDGET': None}
+    )
+    assert get_pool_limits(config=config) == (5, 10)
+
+    config = config.model_copy(update={'DATABASE_CONNECTIONS_BUDGET': 40, 'WORKERS': 4})
+    assert get_pool_limits(config=config) == (5, 5)
+
+    config = config.model_copy(update={'DATABASE_CONNECTIONS_BUDGET': 12, 'WORKERS': 4})
+    assert get_pool_limits(config=config) == (3, 0)
+
+
+def test_get_pool_options_applies_pool_settings_only_to_server_dialects() -> None:
+    config: DatabaseConfig = database_config.model_copy(update={'DATABASE_DIALECT': 'sqlite'})
+    assert get_pool_options(config=config) == {}
+
+    config = config.model_copy(
+        update={'DATABASE_DIALECT': 'postgresql', 'DATABASE_DRIVER': 'asyncpg', 'DATABASE_STATEMENT_CACHE_SIZE': 50}
+    )
+    pool_options: Dict[str, Any] = get_pool_options(config=config)
+    assert pool_options['poolclass'] is TimedAsyncAdaptedQueuePool
+    assert pool_options['connect_args'] == {'statement_cache_size': 50}
+
+
+def test_get_pool_options_disables_pool_and_prepared_statements_cache_for_pgbouncer() -> None:
+    config: DatabaseConfig = database_config.model_copy(
+        update={'DATABASE_DIALECT': 'postgresql', 'DATABASE_DRIVER': 'asyncpg', 'DATABASE_PGBOUNCER': True}
+    )
+    pool_options: Dict[str, Any] = get_pool_options(config=config)
+    assert pool_options['poolclass'] is NullPool
+    assert 'pool_size' not in pool_options
+    assert pool_options['connect_args']['statement_cache_size'] == 0
+    assert pool_options['connect_args']['prepared_statement_cache_size'] == 0
+    assert pool_options['connect_args']['prepared_statement_name_func'] is get_prepared_statement_name
+    assert get_prepared_statement_name() != get_prepared_statement_name()
+
+
+@pytest.mark.anyio
+async def test_timed_pool_reports_connections_and_checkout_wait_time(map_models_to_orm: None) -> None:
+    engine: AsyncEngine = create_async_engine(DATABASE_URL, poolclass=TimedAsyncAdaptedQueuePool, pool_size=2)
+    registry: MetricsRegistry = MetricsRegistry()
+    register_pool_metrics(engine=engine, registry=registry)
+
+    async with engine.connect() as conn:
+        await conn.execute(select(1))
+        rendered_metrics: str = registry.render()
+        assert 'database_pool_connections{role="primary",state="checked_out"} 1' in rendered_metrics
+        assert 'database_pool_connections{role="primary",state="overflow"} 0' in rendered_metrics
+
+    assert 'database_pool_connections{role="primary",state="checked_out"} 0' in registry.render()
+    assert 'database_pool_checkout_wait_seconds_count{role="primary"} 1' in registry.render()
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_timed_pool_reports_checkout_wait_time_by_engine_role(map_models_to_orm: None) -> None:
+    primary_engine: AsyncEngine = create_async_engine(DATABASE_URL, poolclass=TimedAsyncAdaptedQueuePool)
+    replica_engine: AsyncEngine = create_async_engine(DATABASE_URL, poolclass=TimedAsyncAdaptedQueuePool)
+    registry: MetricsRegistry = MetricsRegistry()
+    register_pool_metrics(engine=primary_engine, registry=registry)
+    register_pool_metrics(engine=replica_engine, registry=registry, role='replica')
+
+    async with replica_engine.connect() as conn:
+        await conn.execute(select(1))
+
+    # Role is kept by the pool, which replaces the disposed one:
+    await replica_engine.dispose()
+    async with replica_engine.connect() as conn:
+        await conn.execute(select(1))
+
+    rendered_metrics: str = registry.render()
+    assert 'database_pool_checkout_wait_seconds_count{role="replica"} 2' in rendered_metrics
+    assert 'database_pool_checkout_wait_seconds_count{role="primary"}' not in rendered_metrics
+    assert 'database_pool_connections{role="replica",state="checked_in"} 1' in rendered_metrics
+    await primary_engine.dispose()
+    await replica_engine.dispose()
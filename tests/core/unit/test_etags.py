@@ -0,0 +1,25 @@
+import pytest
+from typing import Optional, Tuple
+
+from src.core.etags import format_etag, parse_if_match
+
+
+def test_format_etag() -> None:
+    assert format_etag(version=3) == '"3"'
+
+
+@pytest.mark.parametrize(
+    'if_match, versions',
+    [
+        (None, None),
+        ('', None),
+        ('*', None),
+        ('"3"', (3, )),
+        ('"1", "2"', (1, 2)),
+        ('W/"3"', ()),
+        ('"abc", 3, "-1"', ()),
+        ('W/"1", "2"', (2, )),
+    ]
+)
+def test_parse_if_match(if_match: Optional[str], versions: Optional[Tuple[int, ...]]) -> None:
+    assert parse_if_match(if_match=if_match) == versions
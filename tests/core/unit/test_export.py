@@ -0,0 +1,48 @@
+import pytest
+from dataclasses import dataclass, astuple
+from typing import Optional, List, AsyncIterator, Sequence
+
+from src.core.export import ExportConfig, parse_export_media_type, serialize_ndjson, serialize_csv
+
+
+@dataclass(frozen=True)
+class FakeReadModel:
+    id: int
+    name: str
+
+
+async def get_partitions() -> AsyncIterator[Sequence[FakeReadModel]]:
+    yield [FakeReadModel(id=1, name='first'), FakeReadModel(id=2, name='second, with comma')]
+    yield [FakeReadModel(id=3, name='third')]
+
+
+@pytest.mark.parametrize(
+    'accept, media_type',
+    [
+        (None, None),
+        ('application/json', None),
+        ('*/*', None),
+        ('application/x-ndjson', ExportConfig.NDJSON_MEDIA_TYPE),
+        ('text/html, text/csv;q=0.9', ExportConfig.CSV_MEDIA_TYPE),
+        ('application/json, application/x-ndjson', ExportConfig.NDJSON_MEDIA_TYPE),
+    ]
+)
+def test_parse_export_media_type(accept: Optional[str], media_type: Optional[str]) -> None:
+    assert parse_export_media_type(accept=accept) == media_type
+
+
+@pytest.mark.anyio
+async def test_serialize_ndjson_yields_one_chunk_per_partition() -> None:
+    chunks: List[str] = [chunk async for chunk in serialize_ndjson(partitions=get_partitions())]
+    assert chunks == [
+        '{"id": 1, "name": "first"}\n{"id": 2, "name": "second, with comma"}\n',
+        '{"id": 3, "name": "third"}\n'
+    ]
+
+
+@pytest.mark.anyio
+async def test_serialize_csv_yields_header_and_one_chunk_per_partition() -> None:
+    chunks: List[str] = [
+        chunk async for chunk in serialize_csv(partitions=get_partitions(), header=('id', 'name'), to_row=astuple)
+    ]
+    assert chunks == ['id,name\r\n', '1,first\r\n2,"second, with comma"\r\n', '3,third\r\n']
@@ -1,20 +1,29 @@
 import pytest
-from typing import Dict, List, Type, no_type_check
+import time
+from typing import Dict, List, Type, Any, Callable, Awaitable, no_type_check
 
-from src.core.exceptions import MessageBusMessageError
+from src.core.exceptions import MessageBusMessageError, UnitOfWorkNotReentrantError
 from src.core.interfaces import (
     AbstractEvent,
     AbstractCommand,
     AbstractCommandHandler,
     AbstractEventHandler,
-    AbstractUnitOfWork
+    AbstractUnitOfWork,
+    AbstractMessageBusMiddleware
 )
-from src.core.messagebus import MessageBus
+from src.core.interfaces.messages import Message
+from src.core.metrics import MetricsRegistry
+from src.core.middlewares import MessageBusMetricsMiddleware, register_deferred_events_metrics
+from src.core.config import messagebus_config
+from src.core.messagebus import MessageBus, DeferredEventsDispatcher, DeferredEventsMetrics
 from tests.core.fake_objects import (
     FakeEvent,
     FakeCommand,
+    FakeFailingCommand,
     FakeCommandHandler,
+    FakeFailingCommandHandler,
     FakeEventHandler,
+    FakeSlowEventHandler,
     FakeCoreUnitOfWork
 )
 
@@ -115,3 +124,361 @@ async def test_messagebus_handle_fail_incorrect_message_type() -> None:
     messagebus: MessageBus = MessageBus(uow=FakeCoreUnitOfWork(), event_handlers={}, command_handlers={})
     with pytest.raises(MessageBusMessageError):
         await messagebus.handle('SomeMessage')
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_event_concurrently_success() -> None:
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    delay: float = 0.2
+    fake_event_handlers: List[FakeSlowEventHandler] = [FakeSlowEventHandler(uow=uow, delay=delay) for _ in range(3)]
+    event_handlers: Dict[Type[AbstractEvent], List[AbstractEventHandler]] = {FakeEvent: [*fake_event_handlers]}
+
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers=event_handlers,
+        command_handlers={},
+        concurrent_events=True
+    )
+
+    started_at: float = time.perf_counter()
+    await messagebus._handle_event(event=FakeEvent())
+    assert time.perf_counter() - started_at < delay * len(fake_event_handlers)
+    assert all(fake_event_handler.called for fake_event_handler in fake_event_handlers)
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_event_concurrently_respects_concurrency_limit() -> None:
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    delay: float = 0.1
+    fake_event_handlers: List[FakeSlowEventHandler] = [FakeSlowEventHandler(uow=uow, delay=delay) for _ in range(2)]
+    event_handlers: Dict[Type[AbstractEvent], List[AbstractEventHandler]] = {FakeEvent: [*fake_event_handlers]}
+
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers=event_handlers,
+        command_handlers={},
+        concurrent_events=True,
+        max_concurrent_handlers=1
+    )
+
+    started_at: float = time.perf_counter()
+    await messagebus._handle_event(event=FakeEvent())
+    assert time.perf_counter() - started_at >= delay * len(fake_event_handlers)
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_event_concurrently_fail_handler_timeout() -> None:
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fast_event_handler: FakeSlowEventHandler = FakeSlowEventHandler(uow=uow, delay=0)
+    slow_event_handler: FakeSlowEventHandler = FakeSlowEventHandler(uow=uow, delay=1)
+    event_handlers: Dict[Type[AbstractEvent], List[AbstractEventHandler]] = {
+        FakeEvent: [slow_event_handler, fast_event_handler]
+    }
+
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers=event_handlers,
+        command_handlers={},
+        concurrent_events=True,
+        handler_timeout=0.1
+    )
+
+    with pytest.raises(TimeoutError):
+        await messagebus._handle_event(event=FakeEvent())
+
+    assert fast_event_handler.called
+    assert not slow_event_handler.called
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_event_concurrent_mode_runs_not_concurrency_safe_handlers_sequentially() -> None:
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeEventHandler = FakeEventHandler(uow=uow, field1='test_value', field2=123)
+    event_handlers: Dict[Type[AbstractEvent], List[AbstractEventHandler]] = {FakeEvent: [fake_event_handler]}
+
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers=event_handlers,
+        command_handlers={},
+        concurrent_events=True,
+        handler_timeout=0
+    )
+
+    # Zero timeout would fail handler, if it was run concurrently:
+    await messagebus._handle_event(event=FakeEvent())
+    assert fake_event_handler.called
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_command_defers_events_to_dispatcher() -> None:
+    events_uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeEventHandler = FakeEventHandler(uow=events_uow, field1='test_value', field2=123)
+
+    async def messagebus_factory() -> MessageBus:
+        return MessageBus(uow=events_uow, event_handlers={FakeEvent: [fake_event_handler]}, command_handlers={})
+
+    events_dispatcher: DeferredEventsDispatcher = DeferredEventsDispatcher(messagebus_factory=messagebus_factory)
+    await events_dispatcher.start()
+
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_command_handler: FakeCommandHandler = FakeCommandHandler(uow=uow, field1='test_value', field2=123)
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={},
+        command_handlers={FakeCommand: fake_command_handler},
+        events_dispatcher=events_dispatcher
+    )
+
+    await messagebus.handle(message=FakeCommand())
+    assert fake_command_handler.called
+    assert not fake_event_handler.called
+    assert events_dispatcher.metrics.backlog_size == 1
+
+    await events_dispatcher.stop()
+    assert fake_event_handler.called
+    assert events_dispatcher.metrics == DeferredEventsMetrics(
+        backlog_size=0,
+        backlog_max_size=messagebus_config.MESSAGEBUS_DEFERRED_EVENTS_BACKLOG,
+        submitted=1,
+        rejected=0,
+        processed=1,
+        failed=0
+    )
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_command_handles_events_inline_if_dispatcher_rejects_them() -> None:
+    async def messagebus_factory() -> MessageBus:
+        raise NotImplementedError
+
+    events_dispatcher: DeferredEventsDispatcher = DeferredEventsDispatcher(
+        messagebus_factory=messagebus_factory,
+        max_backlog=1
+    )
+
+    await events_dispatcher.start()
+    assert await events_dispatcher.submit(events=[FakeEvent()])
+
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeEventHandler = FakeEventHandler(uow=uow, field1='test_value', field2=123)
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={FakeEvent: [fake_event_handler]},
+        command_handlers={FakeCommand: FakeCommandHandler(uow=uow, field1='test_value', field2=123)},
+        events_dispatcher=events_dispatcher
+    )
+
+    # Backlog is full, because worker had no chance to take events from it yet:
+    await messagebus.handle(message=FakeCommand())
+    assert fake_event_handler.called
+    assert events_dispatcher.metrics.rejected == 1
+
+    await events_dispatcher.stop()
+    assert events_dispatcher.metrics.failed == 1
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_many_does_not_dispatch_events_of_failed_batch() -> None:
+    async def messagebus_factory() -> MessageBus:
+        raise NotImplementedError
+
+    events_dispatcher: DeferredEventsDispatcher = DeferredEventsDispatcher(messagebus_factory=messagebus_factory)
+    await events_dispatcher.start()
+
+    uow: FakeCoreUnitOfWork = FakeCoreUnitOfWork()
+    fake_command_handler: FakeCommandHandler = FakeCommandHandler(uow=uow, field1='test_value', field2=123)
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={},
+        command_handlers={FakeCommand: fake_command_handler, FakeFailingCommand: FakeFailingCommandHandler(uow=uow)},
+        events_dispatcher=events_dispatcher
+    )
+
+    # The first command raises event, but the batch is rolled back by the second one:
+    with pytest.raises(ValueError):
+        await messagebus.handle_many(commands=[FakeCommand(), FakeFailingCommand()])
+
+    assert fake_command_handler.called
+    assert not uow.committed
+    assert events_dispatcher.metrics.submitted == 0
+
+    # Events of the failed batch are not submitted with events of the next one:
+    await messagebus.handle_many(commands=[FakeCommand()])
+    assert events_dispatcher.metrics.submitted == 1
+    assert events_dispatcher.metrics.backlog_size == 1
+    await events_dispatcher.stop()
+
+
+@pytest.mark.anyio
+async def test_deferred_events_dispatcher_rejects_events_if_not_running() -> None:
+    async def messagebus_factory() -> MessageBus:
+        raise NotImplementedError
+
+    events_dispatcher: DeferredEventsDispatcher = DeferredEventsDispatcher(messagebus_factory=messagebus_factory)
+    assert not await events_dispatcher.submit(events=[FakeEvent()])
+    assert events_dispatcher.metrics.rejected == 1
+
+
+@pytest.mark.anyio
+async def test_deferred_events_dispatcher_metrics_expose_totals_as_counters() -> None:
+    async def messagebus_factory() -> MessageBus:
+        raise NotImplementedError
+
+    registry: MetricsRegistry = MetricsRegistry()
+    events_dispatcher: DeferredEventsDispatcher = DeferredEventsDispatcher(messagebus_factory=messagebus_factory)
+    register_deferred_events_metrics(events_dispatcher=events_dispatcher, registry=registry)
+    assert not await events_dispatcher.submit(events=[FakeEvent()])
+
+    rendered_metrics: str = registry.render()
+    assert '# TYPE messagebus_deferred_events_batches_total counter' in rendered_metrics
+    assert 'messagebus_deferred_events_batches_total{outcome="rejected"} 1' in rendered_metrics
+    assert 'messagebus_deferred_events_batches_total{outcome="submitted"} 0' in rendered_metrics
+    assert '# TYPE messagebus_deferred_events_backlog gauge' in rendered_metrics
+    assert 'messagebus_deferred_events_backlog{state="size"} 0' in rendered_metrics
+
+    # Totals are not counted twice by subsequent renderings:
+    assert not await events_dispatcher.submit(events=[FakeEvent()])
+    registry.render()
+    assert 'messagebus_deferred_events_batches_total{outcome="rejected"} 2' in registry.render()
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_many_returns_commands_results_in_order() -> None:
+    uow: FakeCoreUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeEventHandler = FakeEventHandler(uow=uow, field1='test_value', field2=123)
+    fake_command_handler: FakeCommandHandler = FakeCommandHandler(uow=uow, field1='test_value', field2=123)
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={FakeEvent: [fake_event_handler]},
+        command_handlers={FakeCommand: fake_command_handler}
+    )
+
+    results: List[Any] = await messagebus.handle_many(commands=[FakeCommand(), FakeCommand()])
+    assert results == [None, None]
+    assert fake_command_handler.called
+    assert fake_event_handler.called
+    assert uow.committed
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_many_discards_events_of_failed_batch() -> None:
+    uow: FakeCoreUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeEventHandler = FakeEventHandler(uow=uow, field1='test_value', field2=123)
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={FakeEvent: [fake_event_handler]},
+        command_handlers={
+            FakeCommand: FakeCommandHandler(uow=uow, field1='test_value', field2=123),
+            FakeFailingCommand: FakeFailingCommandHandler(uow=uow)
+        }
+    )
+
+    # Events are not handled inline before the batch is committed, so none of them is handled after rollback:
+    with pytest.raises(ValueError):
+        await messagebus.handle_many(commands=[FakeCommand(), FakeFailingCommand()])
+
+    assert not fake_event_handler.called
+    assert messagebus.queue_size == 0
+    assert not list(uow.get_events())
+
+
+class FakeNotReentrantUnitOfWork(FakeCoreUnitOfWork):
+
+    @property
+    def is_reentrant(self) -> bool:
+        return False
+
+
+@pytest.mark.anyio
+async def test_messagebus_handle_many_rejects_batch_of_not_reentrant_unit_of_work() -> None:
+    uow: FakeCoreUnitOfWork = FakeNotReentrantUnitOfWork()
+    fake_command_handler: FakeCommandHandler = FakeCommandHandler(uow=uow, field1='test_value', field2=123)
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={},
+        command_handlers={FakeCommand: fake_command_handler}
+    )
+
+    # Nested scopes of handlers would commit on their own, so no command of the batch is handled:
+    with pytest.raises(UnitOfWorkNotReentrantError):
+        await messagebus.handle_many(commands=[FakeCommand(), FakeCommand()])
+
+    assert not fake_command_handler.called
+    assert not uow.committed
+
+
+class FakeRecordingMiddleware(AbstractMessageBusMiddleware):
+
+    def __init__(self, name: str, records: List[str]) -> None:
+        self.name: str = name
+        self.records: List[str] = records
+
+    async def __call__(
+            self,
+            messagebus: MessageBus,
+            message: Message,
+            call_next: Callable[[Message], Awaitable[int]]
+    ) -> int:
+
+        self.records.append(f'{self.name}_before_{type(message).__name__}')
+        produced_events: int = await call_next(message)
+        self.records.append(f'{self.name}_after_{type(message).__name__}_{produced_events}')
+        return produced_events
+
+
+@pytest.mark.anyio
+async def test_messagebus_middlewares_wrap_each_message_in_order() -> None:
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    records: List[str] = []
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={FakeEvent: [FakeEventHandler(uow=uow, field1='test_value', field2=123)]},
+        command_handlers={FakeCommand: FakeCommandHandler(uow=uow, field1='test_value', field2=123)},
+        middlewares=[
+            FakeRecordingMiddleware(name='outer', records=records),
+            FakeRecordingMiddleware(name='inner', records=records)
+        ]
+    )
+
+    await messagebus.handle(message=FakeCommand())
+    assert records == [
+        'outer_before_FakeCommand',
+        'inner_before_FakeCommand',
+        'inner_after_FakeCommand_1',
+        'outer_after_FakeCommand_1',
+        'outer_before_FakeEvent',
+        'inner_before_FakeEvent',
+        'inner_after_FakeEvent_0',
+        'outer_after_FakeEvent_0',
+    ]
+
+
+@pytest.mark.anyio
+async def test_messagebus_metrics_middleware_records_metrics() -> None:
+    registry: MetricsRegistry = MetricsRegistry()
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={FakeEvent: [FakeEventHandler(uow=uow, field1='test_value', field2=123)]},
+        command_handlers={FakeCommand: FakeCommandHandler(uow=uow, field1='test_value', field2=123)},
+        middlewares=[MessageBusMetricsMiddleware(registry=registry)]
+    )
+
+    await messagebus.handle(message=FakeCommand())
+    with pytest.raises(KeyError):
+        await MessageBus(
+            uow=uow,
+            event_handlers={},
+            command_handlers={},
+            middlewares=[MessageBusMetricsMiddleware(registry=registry)]
+        ).handle(message=FakeCommand())
+
+    rendered_metrics: str = registry.render()
+    assert 'messagebus_message_duration_seconds_count{kind="command",message_type="FakeCommand"} 2' in rendered_metrics
+    assert 'messagebus_message_duration_seconds_count{kind="event",message_type="FakeEvent"} 1' in rendered_metrics
+    assert 'messagebus_produced_events_total{kind="command",message_type="FakeCommand"} 1' in rendered_metrics
+    assert (
+        'messagebus_message_errors_total{kind="command",message_type="FakeCommand",error="KeyError"} 1'
+        in rendered_metrics
+    )
+    assert 'messagebus_queue_depth_count{kind="command"} 2' in rendered_metrics
@@ -0,0 +1,56 @@
+import pytest
+
+from src.core.metrics import MetricsRegistry, Counter, Gauge, Histogram
+
+
+def test_counter_renders_values_per_labels() -> None:
+    registry: MetricsRegistry = MetricsRegistry()
+    counter: Counter = registry.counter(name='test_total', documentation='Test counter.', labels=('kind', ))
+    counter.inc(kind='first')
+    counter.inc(2, kind='first')
+    counter.inc(kind='sec"ond')
+
+    assert counter.get(kind='first') == 3
+    assert registry.render() == (
+        '# HELP test_total Test counter.\n'
+        '# TYPE test_total counter\n'
+        'test_total{kind="first"} 3\n'
+        'test_total{kind="sec\\"ond"} 1\n'
+    )
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    registry: MetricsRegistry = MetricsRegistry()
+    histogram: Histogram = registry.histogram(name='test_seconds', documentation='Test histogram.', buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.1)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert histogram.get().count == 4
+    assert registry.render() == (
+        '# HELP test_seconds Test histogram.\n'
+        '# TYPE test_seconds histogram\n'
+        'test_seconds_bucket{le="0.1"} 2\n'
+        'test_seconds_bucket{le="1"} 3\n'
+        'test_seconds_bucket{le="+Inf"} 4\n'
+        'test_seconds_sum 5.65\n'
+        'test_seconds_count 4\n'
+    )
+
+
+def test_metrics_registry_returns_existing_metric() -> None:
+    registry: MetricsRegistry = MetricsRegistry()
+    counter: Counter = registry.counter(name='test_total', documentation='Test counter.')
+    assert registry.counter(name='test_total', documentation='Test counter.') is counter
+
+    with pytest.raises(AssertionError):
+        registry.gauge(name='test_total', documentation='Test gauge.')
+
+
+def test_metrics_registry_calls_collectors_before_rendering() -> None:
+    registry: MetricsRegistry = MetricsRegistry()
+    gauge: Gauge = registry.gauge(name='test_gauge', documentation='Test gauge.')
+    registry.set_collector(name='test', collector=lambda: gauge.set(10))
+
+    assert 'test_gauge 10' in registry.render()
@@ -0,0 +1,27 @@
+import pytest
+from typing import List
+
+from src.core.exceptions import InvalidCursorError
+from src.core.pagination import Page, PageRequest, build_page, encode_cursor, decode_cursor
+
+
+def test_cursor_is_decoded_to_encoded_id() -> None:
+    assert decode_cursor(cursor=encode_cursor(after_id=12345)) == 12345
+
+
+@pytest.mark.parametrize('cursor', ['', 'not a cursor', encode_cursor(after_id=1)[:-2], 'eyJpZCI6ICIxIn0', 'bnVsbA'])
+def test_decode_cursor_fails_on_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor=cursor)
+
+
+def test_build_page_provides_next_cursor_only_if_there_are_more_items() -> None:
+    items: List[int] = [1, 2, 3]
+    page: Page[int] = build_page(items=items, page_request=PageRequest(limit=2), get_id=lambda item: item)
+    assert page.items == [1, 2]
+    assert page.next_cursor and decode_cursor(cursor=page.next_cursor) == 2
+
+    page = build_page(items=items, page_request=PageRequest(limit=3), get_id=lambda item: item, total=3)
+    assert page.items == items
+    assert page.next_cursor is None
+    assert page.total == 3
@@ -0,0 +1,41 @@
+import pytest
+from dataclasses import dataclass, field
+from typing import Optional, List
+
+from src.core.exceptions import InvalidFieldsError
+from src.core.projection import Projection, parse_projection
+
+
+@dataclass(frozen=True)
+class FakeReadModel:
+    id: int
+    name: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+
+
+def test_parse_projection_without_fields_returns_all_fields() -> None:
+    assert parse_projection(fields=None, read_model=FakeReadModel) == Projection(fields=('id', 'name', 'tags'))
+
+
+def test_parse_projection_keeps_read_model_fields_order() -> None:
+    projection: Projection = parse_projection(fields=' name, id ,', read_model=FakeReadModel)
+    assert projection == Projection(fields=('id', 'name'), is_partial=True)
+    assert projection.includes('name')
+    assert not projection.includes('tags')
+
+
+def test_parse_projection_with_all_fields_is_not_partial() -> None:
+    assert not parse_projection(fields='tags,name,id', read_model=FakeReadModel).is_partial
+
+
+@pytest.mark.parametrize('fields', [',', 'id,password', 'unknown'])
+def test_parse_projection_fail_invalid_fields(fields: str) -> None:
+    with pytest.raises(InvalidFieldsError):
+        parse_projection(fields=fields, read_model=FakeReadModel)
+
+
+def test_projection_serialize_and_to_row_contain_only_requested_fields() -> None:
+    projection: Projection = Projection(fields=('name', 'tags'), is_partial=True)
+    item: FakeReadModel = FakeReadModel(id=1, name='name', tags=['tag'])
+    assert projection.serialize(item) == {'name': 'name', 'tags': ['tag']}
+    assert projection.to_row(item) == ('name', ['tag'])
@@ -0,0 +1,209 @@
+import pytest
+from redis.exceptions import ConnectionError
+from typing import Dict, List, Any
+
+from src.core.exceptions import EventSerializationError
+from src.core.interfaces import AbstractEvent, AbstractUnitOfWork
+from src.core.messagebus import MessageBus
+from src.core.redis.streams import EventsSerializer, RedisStreamsEventsDispatcher, RedisStreamsEventsConsumer
+from tests.core.fake_objects import (
+    FakeEvent,
+    FakeEventWithSet,
+    FakeCommand,
+    FakeCommandHandler,
+    FakeEventHandler,
+    FakeFailingEventHandler,
+    FakeCoreUnitOfWork,
+    FakeRedis
+)
+
+
+class FakeUnavailableRedis(FakeRedis):
+
+    async def xadd(self, name: str, fields: Dict[str, str], **kwargs: Any) -> str:
+        raise ConnectionError
+
+    def add_entry(self, name: str, fields: Dict[str, str]) -> str:
+        raise ConnectionError
+
+
+def create_consumer(
+        redis: FakeRedis,
+        messagebus: MessageBus,
+        claim_idle_ms: int = 0,
+        max_deliveries: int = 5
+) -> RedisStreamsEventsConsumer:
+
+    async def messagebus_factory() -> MessageBus:
+        return messagebus
+
+    return RedisStreamsEventsConsumer(
+        redis=redis,  # type: ignore[arg-type]
+        serializer=EventsSerializer(events_types=[FakeEvent, FakeEventWithSet]),
+        messagebus_factory=messagebus_factory,
+        consumer='test_consumer',
+        batch_size=10,
+        claim_idle_ms=claim_idle_ms,
+        max_deliveries=max_deliveries,
+        dead_letters_stream='events_dead_letters'
+    )
+
+
+@pytest.mark.anyio
+async def test_events_serializer_serializes_and_deserializes_event_with_set() -> None:
+    serializer: EventsSerializer = EventsSerializer(events_types=[FakeEvent, FakeEventWithSet])
+    event: FakeEventWithSet = FakeEventWithSet()
+    fields: Dict[str, str] = serializer.serialize(event=event)
+    assert fields['type'] == FakeEventWithSet.__name__
+    assert serializer.deserialize(fields=fields) == event
+
+
+@pytest.mark.anyio
+async def test_events_serializer_fails_on_not_registered_event() -> None:
+    serializer: EventsSerializer = EventsSerializer(events_types=[FakeEventWithSet])
+    with pytest.raises(EventSerializationError):
+        serializer.serialize(event=FakeEvent())
+
+    with pytest.raises(EventSerializationError):
+        serializer.deserialize(fields={'type': FakeEvent.__name__, 'data': '{}'})
+
+
+@pytest.mark.anyio
+async def test_redis_streams_events_dispatcher_publishes_command_events_in_one_round_trip() -> None:
+    redis: FakeRedis = FakeRedis()
+    events_dispatcher: RedisStreamsEventsDispatcher = RedisStreamsEventsDispatcher(
+        redis=redis,  # type: ignore[arg-type]
+        serializer=EventsSerializer(events_types=[FakeEvent])
+    )
+
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeEventHandler = FakeEventHandler(uow=uow, field1='test_value', field2=123)
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={FakeEvent: [fake_event_handler]},
+        command_handlers={FakeCommand: FakeCommandHandler(uow=uow, field1='test_value', field2=123)},
+        events_dispatcher=events_dispatcher
+    )
+
+    await messagebus.handle(message=FakeCommand())
+    assert not fake_event_handler.called
+    assert len(redis.entries) == 1
+    assert redis.round_trips == 1
+
+    events: List[AbstractEvent] = [FakeEvent(), FakeEvent(field1='test_value')]
+    assert await events_dispatcher.submit(events=events)
+    assert len(redis.entries) == 3
+    assert redis.round_trips == 2
+
+
+@pytest.mark.anyio
+async def test_messagebus_handles_events_inline_if_redis_is_unavailable() -> None:
+    events_dispatcher: RedisStreamsEventsDispatcher = RedisStreamsEventsDispatcher(
+        redis=FakeUnavailableRedis(),  # type: ignore[arg-type]
+        serializer=EventsSerializer(events_types=[FakeEvent])
+    )
+
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeEventHandler = FakeEventHandler(uow=uow, field1='test_value', field2=123)
+    messagebus: MessageBus = MessageBus(
+        uow=uow,
+        event_handlers={FakeEvent: [fake_event_handler]},
+        command_handlers={FakeCommand: FakeCommandHandler(uow=uow, field1='test_value', field2=123)},
+        events_dispatcher=events_dispatcher
+    )
+
+    await messagebus.handle(message=FakeCommand())
+    assert fake_event_handler.called
+
+
+@pytest.mark.anyio
+async def test_redis_streams_events_consumer_handles_and_acknowledges_batch() -> None:
+    redis: FakeRedis = FakeRedis()
+    serializer: EventsSerializer = EventsSerializer(events_types=[FakeEvent])
+    for _ in range(3):
+        redis.add_entry(name='events', fields=serializer.serialize(event=FakeEvent()))
+
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeEventHandler = FakeEventHandler(uow=uow, field1='test_value', field2=123)
+    messagebus: MessageBus = MessageBus(uow=uow, event_handlers={FakeEvent: [fake_event_handler]}, command_handlers={})
+    consumer: RedisStreamsEventsConsumer = create_consumer(redis=redis, messagebus=messagebus)
+
+    await consumer.create_group()
+    assert await consumer.consume() == 3
+    assert fake_event_handler.called
+    assert not redis.pending
+    assert await consumer.consume() == 0
+
+
+@pytest.mark.anyio
+async def test_redis_streams_events_consumer_reclaims_failed_events() -> None:
+    redis: FakeRedis = FakeRedis()
+    serializer: EventsSerializer = EventsSerializer(events_types=[FakeEvent])
+    redis.add_entry(name='events', fields=serializer.serialize(event=FakeEvent()))
+
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeFailingEventHandler = FakeFailingEventHandler(uow=uow, failures=1)
+    messagebus: MessageBus = MessageBus(uow=uow, event_handlers={FakeEvent: [fake_event_handler]}, command_handlers={})
+    consumer: RedisStreamsEventsConsumer = create_consumer(redis=redis, messagebus=messagebus)
+
+    assert await consumer.consume() == 0
+    assert len(redis.pending) == 1
+
+    assert await consumer.consume() == 1
+    assert fake_event_handler.called
+    assert not redis.pending
+
+
+@pytest.mark.anyio
+async def test_redis_streams_events_consumer_moves_events_over_max_deliveries_to_dead_letters() -> None:
+    redis: FakeRedis = FakeRedis()
+    serializer: EventsSerializer = EventsSerializer(events_types=[FakeEvent])
+    fields: Dict[str, str] = serializer.serialize(event=FakeEvent())
+    redis.add_entry(name='events', fields=fields)
+
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeFailingEventHandler = FakeFailingEventHandler(uow=uow, failures=10)
+    messagebus: MessageBus = MessageBus(uow=uow, event_handlers={FakeEvent: [fake_event_handler]}, command_handlers={})
+    consumer: RedisStreamsEventsConsumer = create_consumer(redis=redis, messagebus=messagebus, max_deliveries=2)
+
+    assert await consumer.consume() == 0
+    assert await consumer.consume() == 0
+    assert redis.deliveries['1-0'] == 2
+    assert not redis.streams.get('events_dead_letters')
+
+    assert await consumer.consume() == 0
+    assert fake_event_handler.failures == 8
+    assert not redis.pending
+    assert redis.streams['events_dead_letters'] == [
+        ('1-0', {**fields, 'message_id': '1-0', 'times_delivered': '3'})
+    ]
+
+
+@pytest.mark.anyio
+async def test_redis_streams_events_consumer_does_not_reclaim_events_before_idle_time() -> None:
+    redis: FakeRedis = FakeRedis()
+    serializer: EventsSerializer = EventsSerializer(events_types=[FakeEvent])
+    redis.add_entry(name='events', fields=serializer.serialize(event=FakeEvent()))
+
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    fake_event_handler: FakeFailingEventHandler = FakeFailingEventHandler(uow=uow, failures=1)
+    messagebus: MessageBus = MessageBus(uow=uow, event_handlers={FakeEvent: [fake_event_handler]}, command_handlers={})
+    consumer: RedisStreamsEventsConsumer = create_consumer(redis=redis, messagebus=messagebus, claim_idle_ms=60_000)
+
+    assert await consumer.consume() == 0
+    assert await consumer.consume() == 0
+    assert not fake_event_handler.called
+    assert len(redis.pending) == 1
+
+
+@pytest.mark.anyio
+async def test_redis_streams_events_consumer_acknowledges_not_deserializable_events() -> None:
+    redis: FakeRedis = FakeRedis()
+    redis.add_entry(name='events', fields={'type': 'UnknownEvent', 'data': '{}'})
+
+    uow: AbstractUnitOfWork = FakeCoreUnitOfWork()
+    messagebus: MessageBus = MessageBus(uow=uow, event_handlers={}, command_handlers={})
+    consumer: RedisStreamsEventsConsumer = create_consumer(redis=redis, messagebus=messagebus)
+
+    assert await consumer.consume() == 1
+    assert not redis.pending
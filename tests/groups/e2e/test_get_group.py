@@ -0,0 +1,133 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient, Cookies
+from typing import Dict, Any
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.app import app
+from src.dependencies import get_views_session_factory
+from src.core.etags import ETagConfig, format_etag
+from src.core.utils import get_substring_before_chars, get_substring_after_chars
+from src.groups.config import RouterConfig, URLPathsConfig
+from src.groups.constants import ErrorDetails
+from tests.utils import get_error_message_from_response
+from tests.config import FakeGroupConfig
+
+
+@pytest.mark.anyio
+async def test_get_group_success(
+        async_client: AsyncClient,
+        create_test_group: None,
+        cookies: Cookies
+) -> None:
+
+    get_group_url_prefix: str = get_substring_before_chars(
+        chars='{',
+        string=URLPathsConfig.GET_GROUP
+    )
+
+    get_group_url_postfix: str = get_substring_after_chars(
+        chars='}',
+        string=URLPathsConfig.GET_GROUP
+    )
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + get_group_url_prefix + '1' + get_group_url_postfix,
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    group_data: Dict[str, Any] = response.json()
+    assert group_data['name'] == FakeGroupConfig.NAME
+    assert group_data['members'] == []
+    assert response.headers[ETagConfig.ETAG_HEADER] == format_etag(version=1)
+
+    # Entity tag of the read group is accepted by its update:
+    update_group_url_prefix: str = get_substring_before_chars(
+        chars='{',
+        string=URLPathsConfig.UPDATE_GROUP
+    )
+
+    update_group_url_postfix: str = get_substring_after_chars(
+        chars='}',
+        string=URLPathsConfig.UPDATE_GROUP
+    )
+
+    response = await async_client.put(
+        url=RouterConfig.PREFIX + update_group_url_prefix + '1' + update_group_url_postfix,
+        json={'name': 'SomeNewName'},
+        headers={'If-Match': response.headers[ETagConfig.ETAG_HEADER]},
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers[ETagConfig.ETAG_HEADER] == format_etag(version=2)
+
+
+@pytest.mark.anyio
+async def test_get_group_fail_group_does_not_exist(
+        async_client: AsyncClient,
+        cookies: Cookies
+) -> None:
+
+    get_group_url_prefix: str = get_substring_before_chars(
+        chars='{',
+        string=URLPathsConfig.GET_GROUP
+    )
+
+    get_group_url_postfix: str = get_substring_after_chars(
+        chars='}',
+        string=URLPathsConfig.GET_GROUP
+    )
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + get_group_url_prefix + '1' + get_group_url_postfix,
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert get_error_message_from_response(response=response) == ErrorDetails.GROUP_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_get_group_after_update_returns_current_version_from_primary(
+        async_client: AsyncClient,
+        create_test_group: None,
+        cookies: Cookies
+) -> None:
+
+    get_group_url_prefix: str = get_substring_before_chars(
+        chars='{',
+        string=URLPathsConfig.GET_GROUP
+    )
+
+    get_group_url_postfix: str = get_substring_after_chars(
+        chars='}',
+        string=URLPathsConfig.GET_GROUP
+    )
+
+    # Group is updated by the same path, by which it is read:
+    group_url: str = RouterConfig.PREFIX + get_group_url_prefix + '1' + get_group_url_postfix
+
+    async def get_lagging_replica_session_factory() -> async_sessionmaker:
+        raise AssertionError('Entity tag must not be read from the replica, which could lag behind the update')
+
+    app.dependency_overrides[get_views_session_factory] = get_lagging_replica_session_factory
+    try:
+        response: Response = await async_client.put(url=group_url, json={'name': 'SomeNewName'}, cookies=cookies)
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await async_client.get(url=group_url, cookies=cookies)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['name'] == 'SomeNewName'
+        assert response.headers[ETagConfig.ETAG_HEADER] == format_etag(version=2)
+
+        response = await async_client.put(
+            url=group_url,
+            json={'name': 'AnotherNewName'},
+            headers={'If-Match': response.headers[ETagConfig.ETAG_HEADER]},
+            cookies=cookies
+        )
+        assert response.status_code == status.HTTP_200_OK
+    finally:
+        app.dependency_overrides.pop(get_views_session_factory)
@@ -1,8 +1,10 @@
+import json
 import pytest
 from fastapi import status
 from typing import List, Dict, Any
 from httpx import Response, AsyncClient, Cookies
 
+from src.core.export import ExportConfig
 from src.groups.config import RouterConfig, URLPathsConfig
 from src.groups.domain.models import GroupModel
 from tests.config import FakeGroupConfig
@@ -42,3 +44,63 @@ async def test_get_my_groups_fail(
 
     response: Response = await async_client.get(url=RouterConfig.PREFIX + URLPathsConfig.MY_GROUPS)
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.anyio
+async def test_get_my_groups_streams_export(
+        async_client: AsyncClient,
+        create_test_group: None,
+        cookies: Cookies
+) -> None:
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.MY_GROUPS,
+        headers={'Accept': ExportConfig.NDJSON_MEDIA_TYPE},
+        cookies=cookies
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {
+            'id': 1,
+            'name': FakeGroupConfig.NAME,
+            'owner_id': FakeGroupConfig.OWNER_ID,
+            'member_count': 0,
+            'version': 1,
+            'members': []
+        }
+    ]
+
+    response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.MY_GROUPS,
+        headers={'Accept': ExportConfig.CSV_MEDIA_TYPE},
+        cookies=cookies
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text.splitlines() == [
+        'id,name,owner_id,member_count,version,members',
+        f'1,{FakeGroupConfig.NAME},1,0,1,'
+    ]
+
+
+@pytest.mark.anyio
+async def test_get_my_groups_with_fields(
+        async_client: AsyncClient,
+        create_test_group: None,
+        cookies: Cookies
+) -> None:
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.MY_GROUPS,
+        params={'fields': 'name'},
+        cookies=cookies
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{'name': FakeGroupConfig.NAME}]
+
+    response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.MY_GROUPS,
+        params={'fields': 'id,members'},
+        cookies=cookies
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{'id': 1, 'members': []}]
@@ -0,0 +1,113 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient, Cookies
+from typing import List, Dict, Any
+
+from src.groups.config import RouterConfig, URLPathsConfig, GroupValidationConfig
+from src.groups.constants import ErrorDetails
+from tests.utils import get_error_message_from_response
+from tests.config import FakeGroupConfig
+
+
+@pytest.mark.anyio
+async def test_groups_batch_success(
+        async_client: AsyncClient,
+        create_test_group: None,
+        cookies: Cookies
+) -> None:
+
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.BATCH,
+        json=[
+            {'operation': 'create', 'name': 'FirstNewGroup'},
+            {'operation': 'update', 'group_id': 1, 'name': 'SomeNewName'},
+            {'operation': 'create', 'name': 'SecondNewGroup'},
+            {'operation': 'delete', 'group_id': 2},
+        ],
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    results: List[Dict[str, Any]] = response.json()
+    assert len(results) == 4
+    assert results[0]['name'] == 'FirstNewGroup'
+    assert results[1]['name'] == 'SomeNewName'
+    assert results[2]['name'] == 'SecondNewGroup'
+    assert results[3] is None
+
+    response = await async_client.get(url=RouterConfig.PREFIX + URLPathsConfig.MY_GROUPS, cookies=cookies)
+    assert {group['name'] for group in response.json()} == {'SomeNewName', 'SecondNewGroup'}
+
+
+@pytest.mark.anyio
+async def test_groups_batch_fail_group_does_not_exist(
+        async_client: AsyncClient,
+        create_test_group: None,
+        cookies: Cookies
+) -> None:
+
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.BATCH,
+        json=[{'operation': 'delete', 'group_id': 100}],
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert get_error_message_from_response(response=response) == ErrorDetails.GROUP_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_groups_batch_fail_rollbacks_all_operations(
+        async_client: AsyncClient,
+        create_test_group: None,
+        cookies: Cookies
+) -> None:
+
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.BATCH,
+        json=[
+            {'operation': 'create', 'name': 'NewGroup'},
+            {'operation': 'update', 'group_id': 1, 'name': 'SomeNewName'},
+            {'operation': 'delete', 'group_id': 100},
+        ],
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await async_client.get(url=RouterConfig.PREFIX + URLPathsConfig.MY_GROUPS, cookies=cookies)
+    assert [group['name'] for group in response.json()] == [FakeGroupConfig.NAME]
+
+
+@pytest.mark.anyio
+async def test_groups_batch_fail_too_many_operations(
+        async_client: AsyncClient,
+        create_test_user: None,
+        cookies: Cookies
+) -> None:
+
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.BATCH,
+        json=[
+            {'operation': 'create', 'name': f'{FakeGroupConfig.NAME}{i}'}
+            for i in range(GroupValidationConfig.BATCH_MAX_SIZE + 1)
+        ],
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert get_error_message_from_response(response=response) == ErrorDetails.GROUPS_BATCH_SIZE_ERROR
+
+
+@pytest.mark.anyio
+async def test_groups_batch_fail_user_unauthorized(
+        async_client: AsyncClient,
+        create_test_user: None
+) -> None:
+
+    response: Response = await async_client.post(
+        url=RouterConfig.PREFIX + URLPathsConfig.BATCH,
+        json=[{'operation': 'delete', 'group_id': 1}]
+    )
+
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
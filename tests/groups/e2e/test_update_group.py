@@ -3,6 +3,7 @@ from fastapi import status
 from httpx import Response, AsyncClient, Cookies
 from typing import Dict, Any
 
+from src.core.etags import ETagConfig, format_etag
 from src.core.utils import get_substring_before_chars, get_substring_after_chars
 from src.groups.config import RouterConfig, URLPathsConfig
 from src.groups.constants import ErrorDetails
@@ -38,6 +39,57 @@ async def test_update_group_success(
     assert response.status_code == status.HTTP_200_OK
     group_data: Dict[str, Any] = response.json()
     assert group_data['name'] == new_group_data.NAME
+    assert response.headers[ETagConfig.ETAG_HEADER] == format_etag(version=group_data['version'])
+
+
+@pytest.mark.anyio
+async def test_update_group_if_match(
+        async_client: AsyncClient,
+        create_test_group: None,
+        cookies: Cookies
+) -> None:
+
+    update_group_url_prefix: str = get_substring_before_chars(
+        chars='{',
+        string=URLPathsConfig.UPDATE_GROUP
+    )
+
+    update_group_url_postfix: str = get_substring_after_chars(
+        chars='}',
+        string=URLPathsConfig.UPDATE_GROUP
+    )
+
+    # Both devices read the first version of the group, after which the first one updates it:
+    response: Response = await async_client.put(
+        url=RouterConfig.PREFIX + update_group_url_prefix + '1' + update_group_url_postfix,
+        json={'name': 'FirstDeviceName'},
+        headers={'If-Match': format_etag(version=1)},
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers[ETagConfig.ETAG_HEADER] == format_etag(version=2)
+
+    response = await async_client.put(
+        url=RouterConfig.PREFIX + update_group_url_prefix + '1' + update_group_url_postfix,
+        json={'name': 'SecondDeviceName'},
+        headers={'If-Match': format_etag(version=1)},
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert get_error_message_from_response(response=response) == ErrorDetails.GROUP_VERSION_CONFLICT
+
+    # The second device gets the current version of the group and retries:
+    response = await async_client.put(
+        url=RouterConfig.PREFIX + update_group_url_prefix + '1' + update_group_url_postfix,
+        json={'name': 'SecondDeviceName'},
+        headers={'If-Match': format_etag(version=2)},
+        cookies=cookies
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['name'] == 'SecondDeviceName'
 
 
 @pytest.mark.anyio
@@ -1,8 +1,13 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, AsyncIterator, Set, Tuple
 
 from src.groups.interfaces.units_of_work import GroupsUnitOfWork
 from src.groups.interfaces.repositories import GroupsRepository
-from src.groups.domain.models import GroupModel
+from src.groups.interfaces.queries import GroupsQueries
+from src.groups.constants import GroupLoadProfiles
+from src.groups.domain.models import GroupModel, GroupMemberModel
+from src.groups.domain.read_models import GroupReadModel, GroupMemberReadModel
+from src.core.pagination import PageRequest
+from src.core.projection import Projection
 from src.core.interfaces import AbstractModel
 
 
@@ -11,15 +16,41 @@ class FakeGroupsRepository(GroupsRepository):
     def __init__(self, groups: Optional[Dict[int, GroupModel]] = None) -> None:
         self.groups: Dict[int, GroupModel] = groups if groups else {}
 
-    async def get(self, id: int) -> Optional[GroupModel]:
+    async def get(self, id: int, profile: str = GroupLoadProfiles.DETAIL) -> Optional[GroupModel]:
         return self.groups.get(id)
 
-    async def get_user_groups(self, user_id: int) -> List[GroupModel]:
+    async def add_members(self, group_id: int, user_ids: Set[int]) -> Set[int]:
+        members: Set[GroupMemberModel] = self.groups[group_id].members
+        added_user_ids: Set[int] = {
+            user_id for user_id in user_ids if GroupMemberModel(group_id=group_id, user_id=user_id) not in members
+        }
+
+        members.update(GroupMemberModel(group_id=group_id, user_id=user_id) for user_id in added_user_ids)
+        self.groups[group_id].member_count += len(added_user_ids)
+        return added_user_ids
+
+    async def remove_members(self, group_id: int, user_ids: Set[int]) -> Set[int]:
+        members: Set[GroupMemberModel] = self.groups[group_id].members
+        removed_user_ids: Set[int] = {
+            user_id for user_id in user_ids if GroupMemberModel(group_id=group_id, user_id=user_id) in members
+        }
+
+        members.difference_update(GroupMemberModel(group_id=group_id, user_id=user_id) for user_id in removed_user_ids)
+        self.groups[group_id].member_count -= len(removed_user_ids)
+        return removed_user_ids
+
+    async def get_user_groups(self, user_id: int, profile: str = GroupLoadProfiles.LIST) -> List[GroupModel]:
         return [group for group in self.groups.values() if group.owner_id == user_id]
 
-    async def get_by_owner_and_name(self, name: str, owner_id: int) -> Optional[GroupModel]:
+    async def get_by_owner_and_name(
+            self,
+            name: str,
+            owner_id: int,
+            profile: str = GroupLoadProfiles.DETAIL
+    ) -> Optional[GroupModel]:
+
         for group in self.groups.values():
-            if group.id == owner_id and group.name == name:
+            if group.owner_id == owner_id and group.name == name:
                 return group
 
         return None
@@ -29,26 +60,117 @@ class FakeGroupsRepository(GroupsRepository):
         self.groups[group.id] = group
         return group
 
+    async def add_if_not_exists(self, model: AbstractModel) -> Optional[GroupModel]:
+        group: GroupModel = GroupModel(**await model.to_dict())
+        if await self.get_by_owner_and_name(name=group.name, owner_id=group.owner_id):
+            return None
+
+        return await self.add(model=group)
+
     async def update(self, id: int, model: AbstractModel) -> GroupModel:
         group: GroupModel = GroupModel(**await model.to_dict())
         if id in self.groups:
+            group.version = self.groups[id].version + 1
             self.groups[id] = group
 
         return group
 
+    async def update_by_owner(
+            self,
+            id: int,
+            owner_id: int,
+            model: AbstractModel,
+            expected_versions: Optional[Tuple[int, ...]] = None
+    ) -> Optional[GroupModel]:
+
+        group: Optional[GroupModel] = self.groups.get(id)
+        if not group or group.owner_id != owner_id:
+            return None
+
+        if expected_versions is not None and group.version not in expected_versions:
+            return None
+
+        return await self.update(id=id, model=model)
+
+    async def delete_by_owner(self, id: int, owner_id: int) -> bool:
+        group: Optional[GroupModel] = self.groups.get(id)
+        if not group or group.owner_id != owner_id:
+            return False
+
+        await self.delete(id=id)
+        return True
+
     async def delete(self, id: int) -> None:
         if id in self.groups:
             del self.groups[id]
 
-    async def list(self) -> List[GroupModel]:
+    async def list(self, profile: str = GroupLoadProfiles.DETAIL) -> List[GroupModel]:
         return list(self.groups.values())
 
 
+class FakeGroupsQueries(GroupsQueries):
+
+    def __init__(self, groups_repository: GroupsRepository) -> None:
+        self._groups_repository: GroupsRepository = groups_repository
+
+    async def get_user_groups(
+            self,
+            user_id: int,
+            page_request: PageRequest,
+            projection: Optional[Projection] = None
+    ) -> List[GroupReadModel]:
+
+        groups: List[GroupModel] = sorted(
+            await self._groups_repository.get_user_groups(user_id=user_id),
+            key=lambda group: group.id
+        )
+        return [
+            GroupReadModel(
+                id=group.id,
+                name=group.name,
+                owner_id=group.owner_id,
+                member_count=group.member_count,
+                members=[GroupMemberReadModel(group_id=m.group_id, user_id=m.user_id) for m in group.members]
+            )
+            for group in groups
+            if page_request.after_id is None or group.id > page_request.after_id
+        ][:page_request.limit + 1]
+
+    async def get_group(self, group_id: int) -> Optional[GroupReadModel]:
+        group: Optional[GroupModel] = await self._groups_repository.get(id=group_id)
+        if not group:
+            return None
+
+        return GroupReadModel(
+            id=group.id,
+            name=group.name,
+            owner_id=group.owner_id,
+            member_count=group.member_count,
+            version=group.version,
+            members=[GroupMemberReadModel(group_id=m.group_id, user_id=m.user_id) for m in group.members]
+        )
+
+    async def stream_user_groups(
+            self,
+            user_id: int,
+            partition_size: int = 1000,
+            projection: Optional[Projection] = None
+    ) -> AsyncIterator[List[GroupReadModel]]:
+
+        groups: List[GroupReadModel] = await self.get_user_groups(
+            user_id=user_id,
+            page_request=PageRequest(limit=len(await self._groups_repository.list()))
+        )
+        for index in range(0, len(groups), partition_size):
+            yield groups[index:index + partition_size]
+
+
 class FakeGroupsUnitOfWork(GroupsUnitOfWork):
 
     def __init__(self, groups_repository: GroupsRepository) -> None:
         super().__init__()
         self.groups: GroupsRepository = groups_repository
+        self.groups_queries: GroupsQueries = FakeGroupsQueries(groups_repository=groups_repository)
         self.committed: bool = False
 
     async def commit(self) -> None:
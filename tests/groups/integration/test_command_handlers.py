@@ -1,5 +1,5 @@
 import pytest
-from typing import List
+from typing import List, Set
 
 from src.core.interfaces import AbstractEvent
 from src.groups.domain.commands import (
@@ -16,7 +16,8 @@ from src.groups.domain.events import (
 from src.groups.domain.models import GroupModel, GroupMemberModel
 from src.groups.exceptions import (
     GroupOwnerError,
-    GroupAlreadyExistsError
+    GroupAlreadyExistsError,
+    GroupNotFoundError
 )
 from src.groups.interfaces import GroupsRepository, GroupsUnitOfWork
 from src.groups.service_layer.handlers.command_handlers import (
@@ -141,7 +142,7 @@ async def test_add_group_members_command_handler_success() -> None:
     groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
     handler: AddGroupMembersCommandHandler = AddGroupMembersCommandHandler(uow=groups_unit_of_work)
     user: UserModel = UserModel(id=user_id, **FakeUserConfig().to_dict(to_lower=True))
-    group: GroupModel = await handler(
+    added_group_members: Set[GroupMemberModel] = await handler(
         command=AddGroupMembersCommand(
             group_id=group_id,
             user=user,
@@ -150,13 +151,38 @@ async def test_add_group_members_command_handler_success() -> None:
     )
 
     assert len(groups_repository.groups[group_id].members) == 1
-    assert group.members == {GroupMemberModel(group_id=group_id, user_id=user_id)}
+    assert added_group_members == {GroupMemberModel(group_id=group_id, user_id=user_id)}
 
     events: List[AbstractEvent] = list(groups_unit_of_work.get_events())
     assert len(events) == 1
     assert isinstance(events[0], GroupMembersAddedToGroupEvent)
 
 
+@pytest.mark.anyio
+async def test_add_group_members_command_handler_skips_existing_members() -> None:
+    user_id: int = 1
+    group_id: int = 1
+
+    groups_repository: GroupsRepository = create_fake_groups_repository_instance(with_group=True)
+    assert isinstance(groups_repository, FakeGroupsRepository)
+    groups_repository.groups[group_id].members.add(GroupMemberModel(group_id=group_id, user_id=user_id))
+
+    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
+    handler: AddGroupMembersCommandHandler = AddGroupMembersCommandHandler(uow=groups_unit_of_work)
+    user: UserModel = UserModel(id=user_id, **FakeUserConfig().to_dict(to_lower=True))
+    added_group_members: Set[GroupMemberModel] = await handler(
+        command=AddGroupMembersCommand(
+            group_id=group_id,
+            user=user,
+            group_members={user}
+        )
+    )
+
+    assert not added_group_members
+    assert len(groups_repository.groups[group_id].members) == 1
+    assert not list(groups_unit_of_work.get_events())
+
+
 @pytest.mark.anyio
 async def test_add_group_members_command_handler_fail_group_does_not_belong_to_user() -> None:
     groups_repository: GroupsRepository = create_fake_groups_repository_instance(with_group=True)
@@ -173,6 +199,22 @@ async def test_add_group_members_command_handler_fail_group_does_not_belong_to_u
         )
 
 
+@pytest.mark.anyio
+async def test_add_group_members_command_handler_fail_group_not_found() -> None:
+    groups_repository: GroupsRepository = create_fake_groups_repository_instance()
+    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
+    handler: AddGroupMembersCommandHandler = AddGroupMembersCommandHandler(uow=groups_unit_of_work)
+    user: UserModel = UserModel(id=1, **FakeUserConfig().to_dict(to_lower=True))
+    with pytest.raises(GroupNotFoundError):
+        await handler(
+            command=AddGroupMembersCommand(
+                group_id=1,
+                user=user,
+                group_members={user}
+            )
+        )
+
+
 @pytest.mark.anyio
 async def test_remove_group_members_command_handler_success() -> None:
     user_id: int = 1
@@ -187,7 +229,7 @@ async def test_remove_group_members_command_handler_success() -> None:
     groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
     handler: RemoveGroupMembersCommandHandler = RemoveGroupMembersCommandHandler(uow=groups_unit_of_work)
     user: UserModel = UserModel(id=user_id, **FakeUserConfig().to_dict(to_lower=True))
-    group: GroupModel = await handler(
+    removed_group_members: Set[GroupMemberModel] = await handler(
         command=RemoveGroupMembersCommand(
             group_id=group_id,
             user=user,
@@ -196,7 +238,7 @@ async def test_remove_group_members_command_handler_success() -> None:
     )
 
     assert len(groups_repository.groups[group_id].members) == 0
-    assert not group.members
+    assert removed_group_members == {GroupMemberModel(group_id=group_id, user_id=user_id)}
 
     events: List[AbstractEvent] = list(groups_unit_of_work.get_events())
     assert len(events) == 1
@@ -217,3 +259,19 @@ async def test_remove_group_members_command_handler_fail_group_does_not_belong_t
                 group_members={user}
             )
         )
+
+
+@pytest.mark.anyio
+async def test_remove_group_members_command_handler_fail_group_not_found() -> None:
+    groups_repository: GroupsRepository = create_fake_groups_repository_instance()
+    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
+    handler: RemoveGroupMembersCommandHandler = RemoveGroupMembersCommandHandler(uow=groups_unit_of_work)
+    user: UserModel = UserModel(id=1, **FakeUserConfig().to_dict(to_lower=True))
+    with pytest.raises(GroupNotFoundError):
+        await handler(
+            command=RemoveGroupMembersCommand(
+                group_id=1,
+                user=user,
+                group_members={user}
+            )
+        )
@@ -1,15 +1,28 @@
 import pytest
-from typing import Sequence, Optional, List
-from sqlalchemy import select, CursorResult, Row
+from fastapi.responses import StreamingResponse
+from typing import Sequence, Optional, Union, List
+from sqlalchemy import select, insert, CursorResult, Row
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from src.core.database.connection import engine, replica_session_factory
+from src.core.messagebus import MessageBus
+from src.core.pagination import Page, PageRequest
+from src.core.projection import Projection
 from src.users.entrypoints.dependencies import register_user
 from src.users.entrypoints.schemas import RegisterUserScheme
-from src.groups.exceptions import GroupAlreadyExistsError, GroupNotFoundError, GroupOwnerError
-from src.groups.domain.models import GroupModel
+from src.groups.exceptions import (
+    GroupAlreadyExistsError,
+    GroupNotFoundError,
+    GroupOwnerError,
+    GroupVersionConflictError
+)
+from src.groups.adapters.orm import group_members_table
+from src.groups.domain.models import GroupModel, GroupMemberModel
+from src.groups.domain.read_models import GroupReadModel
 from src.users.domain.models import UserModel
 from src.groups.entypoints.schemas import CreateOrUpdateGroupScheme
 from tests.config import FakeUserConfig, FakeGroupConfig
+from tests.utils import capture_statements
 from src.groups.entypoints.dependencies import (
     create_group,
     delete_group,
@@ -19,10 +32,10 @@ from src.groups.entypoints.dependencies import (
 
 
 @pytest.mark.anyio
-async def test_create_group_success(create_test_user: None) -> None:
+async def test_create_group_success(create_test_user: None, messagebus: MessageBus) -> None:
     group_data: CreateOrUpdateGroupScheme = CreateOrUpdateGroupScheme(**FakeGroupConfig().to_dict(to_lower=True))
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
-    group: GroupModel = await create_group(group_data=group_data, user=user)
+    group: GroupModel = await create_group(group_data=group_data, user=user, messagebus=messagebus)
 
     assert group.id == 1
     assert group.name == FakeGroupConfig.NAME
@@ -30,22 +43,49 @@ async def test_create_group_success(create_test_user: None) -> None:
 
 
 @pytest.mark.anyio
-async def test_create_group_fail_group_already_exists(create_test_group: None) -> None:
+async def test_create_group_fail_group_already_exists(create_test_group: None, messagebus: MessageBus) -> None:
     group_data: CreateOrUpdateGroupScheme = CreateOrUpdateGroupScheme(**FakeGroupConfig().to_dict(to_lower=True))
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
     with pytest.raises(GroupAlreadyExistsError):
-        await create_group(group_data=group_data, user=user)
+        await create_group(group_data=group_data, user=user, messagebus=messagebus)
 
 
 @pytest.mark.anyio
-async def test_delete_group_success(create_test_group: None, async_connection: AsyncConnection) -> None:
+@pytest.mark.parametrize('group_exists', [False, True])
+async def test_create_group_executes_one_insert_statement(
+        group_exists: bool,
+        create_test_group: None,
+        messagebus: MessageBus
+) -> None:
+
+    group_data: CreateOrUpdateGroupScheme = CreateOrUpdateGroupScheme(
+        name=FakeGroupConfig.NAME if group_exists else 'new_group_name'
+    )
+    user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
+    with capture_statements(engine=engine) as statements:
+        try:
+            await create_group(group_data=group_data, user=user, messagebus=messagebus)
+        except GroupAlreadyExistsError:
+            assert group_exists
+
+    assert len(statements) == 1
+    assert statements[0][0].startswith('INSERT INTO groups')
+
+
+@pytest.mark.anyio
+async def test_delete_group_success(
+        create_test_group: None,
+        async_connection: AsyncConnection,
+        messagebus: MessageBus
+) -> None:
+
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
 
     cursor: CursorResult = await async_connection.execute(select(GroupModel))
     result: Sequence[Row] = cursor.all()
     assert len(result) == 1
 
-    await delete_group(group_id=1, user=user)
+    await delete_group(group_id=1, user=user, messagebus=messagebus)
 
     cursor = await async_connection.execute(select(GroupModel))
     result = cursor.all()
@@ -55,82 +95,208 @@ async def test_delete_group_success(create_test_group: None, async_connection: A
 @pytest.mark.anyio
 async def test_delete_group_fail_group_does_not_belong_to_current_user(
         create_test_group: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        messagebus: MessageBus
 ) -> None:
 
     second_user_config: FakeUserConfig = FakeUserConfig()
     second_user_config.EMAIL = 'secondUserEmail@gmail.com'
     second_user_config.USERNAME = 'secondUser'
     user_data: RegisterUserScheme = RegisterUserScheme(**second_user_config.to_dict(to_lower=True))
-    user: UserModel = await register_user(user_data=user_data)
+    user: UserModel = await register_user(user_data=user_data, messagebus=messagebus)
 
     user_cursor: CursorResult = await async_connection.execute(select(GroupModel))
     user_result: Optional[Row] = user_cursor.first()
     assert user_result
 
     with pytest.raises(GroupOwnerError):
-        await delete_group(group_id=1, user=user)
+        await delete_group(group_id=1, user=user, messagebus=messagebus)
 
 
 @pytest.mark.anyio
 async def test_delete_group_fail_group_does_not_exist(
         create_test_user: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        messagebus: MessageBus
 ) -> None:
 
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
     with pytest.raises(GroupNotFoundError):
-        await delete_group(group_id=1, user=user)
+        await delete_group(group_id=1, user=user, messagebus=messagebus)
 
 
 @pytest.mark.anyio
 async def test_get_current_user_groups_success_without_existing_groups(create_test_user: None) -> None:
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
-    user_groups: List[GroupModel] = await get_current_user_groups(user=user)
+    page: Union[Page[GroupReadModel], StreamingResponse] = await get_current_user_groups(
+        user=user,
+        page_request=PageRequest(),
+        export_media_type=None,
+        projection=Projection(fields=('id', 'name', 'owner_id', 'members')),
+        session_factory=replica_session_factory
+    )
+    assert isinstance(page, Page)
 
-    assert len(user_groups) == 0
+    assert len(page.items) == 0
 
 
 @pytest.mark.anyio
 async def test_get_current_user_groups_success_with_existing_groups(create_test_group: None) -> None:
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
-    user_groups: List[GroupModel] = await get_current_user_groups(user=user)
-
-    assert len(user_groups) == 1
-    group: GroupModel = user_groups[0]
+    page: Union[Page[GroupReadModel], StreamingResponse] = await get_current_user_groups(
+        user=user,
+        page_request=PageRequest(),
+        export_media_type=None,
+        projection=Projection(fields=('id', 'name', 'owner_id', 'members')),
+        session_factory=replica_session_factory
+    )
+    assert isinstance(page, Page)
+
+    assert len(page.items) == 1
+    group: GroupReadModel = page.items[0]
     assert group.name == FakeGroupConfig.NAME
     assert group.owner_id == user.id
 
 
 @pytest.mark.anyio
-async def test_update_group_success(create_test_group: None) -> None:
+async def test_update_group_success(create_test_group: None, messagebus: MessageBus) -> None:
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
     new_group_name: str = 'SomeNewName'
     group_data: CreateOrUpdateGroupScheme = CreateOrUpdateGroupScheme(name=new_group_name)
-    group = await update_group(group_id=1, user=user, group_data=group_data)
+    group = await update_group(
+        group_id=1,
+        user=user,
+        group_data=group_data,
+        messagebus=messagebus,
+        expected_versions=None
+    )
 
     assert group.name == new_group_name
 
 
+@pytest.mark.anyio
+async def test_update_group_returns_group_with_members(
+        create_test_group: None,
+        async_connection: AsyncConnection,
+        messagebus: MessageBus
+) -> None:
+
+    await async_connection.execute(insert(group_members_table).values(group_id=1, user_id=1))
+    await async_connection.commit()
+
+    user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
+    group_data: CreateOrUpdateGroupScheme = CreateOrUpdateGroupScheme(name='SomeNewName')
+    group: GroupModel = await update_group(
+        group_id=1,
+        user=user,
+        group_data=group_data,
+        messagebus=messagebus,
+        expected_versions=None
+    )
+    assert group.members == {GroupMemberModel(group_id=1, user_id=1)}
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    'owner_id, expected_update_statements, expected_delete_statements',
+    [
+        # Members of updated group are selected for response:
+        (FakeGroupConfig.OWNER_ID, ['UPDATE', 'SELECT'], ['DELETE']),
+
+        # Group is probed to tell, that it belongs to another user:
+        (FakeGroupConfig.OWNER_ID + 1, ['UPDATE', 'SELECT'], ['DELETE', 'SELECT'])
+    ]
+)
+async def test_update_and_delete_group_are_guarded_by_owner(
+        owner_id: int,
+        expected_update_statements: List[str],
+        expected_delete_statements: List[str],
+        create_test_group: None,
+        messagebus: MessageBus
+) -> None:
+
+    user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=owner_id)
+    group_data: CreateOrUpdateGroupScheme = CreateOrUpdateGroupScheme(name='SomeNewName')
+    with capture_statements(engine=engine) as statements:
+        try:
+            await update_group(
+                group_id=1,
+                user=user,
+                group_data=group_data,
+                messagebus=messagebus,
+                expected_versions=None
+            )
+        except GroupOwnerError:
+            assert owner_id != FakeGroupConfig.OWNER_ID
+
+    assert [statement.split()[0] for statement, _ in statements] == expected_update_statements
+
+    with capture_statements(engine=engine) as statements:
+        try:
+            await delete_group(group_id=1, user=user, messagebus=messagebus)
+        except GroupOwnerError:
+            assert owner_id != FakeGroupConfig.OWNER_ID
+
+    assert [statement.split()[0] for statement, _ in statements] == expected_delete_statements
+
+
 @pytest.mark.anyio
 async def test_update_group_fail_group_does_not_exist(
         create_test_user: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        messagebus: MessageBus
 ) -> None:
 
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
     group_data: CreateOrUpdateGroupScheme = CreateOrUpdateGroupScheme(name='SomeNewName')
     with pytest.raises(GroupNotFoundError):
-        await update_group(group_id=1, user=user, group_data=group_data)
+        await update_group(group_id=1, user=user, group_data=group_data, messagebus=messagebus, expected_versions=None)
 
 
 @pytest.mark.anyio
 async def test_update_group_fail_group_does_not_belong_to_user(
         create_test_group: None,
-        async_connection: AsyncConnection
+        async_connection: AsyncConnection,
+        messagebus: MessageBus
 ) -> None:
 
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=2)
     group_data: CreateOrUpdateGroupScheme = CreateOrUpdateGroupScheme(name='SomeNewName')
     with pytest.raises(GroupOwnerError):
-        await update_group(group_id=1, user=user, group_data=group_data)
+        await update_group(group_id=1, user=user, group_data=group_data, messagebus=messagebus, expected_versions=None)
+
+
+@pytest.mark.anyio
+async def test_update_group_increments_version_of_expected_one(create_test_group: None, messagebus: MessageBus) -> None:
+    user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
+    group: GroupModel = await update_group(
+        group_id=1,
+        user=user,
+        group_data=CreateOrUpdateGroupScheme(name='SomeNewName'),
+        messagebus=messagebus,
+        expected_versions=(1, )
+    )
+
+    assert group.version == 2
+
+
+@pytest.mark.anyio
+async def test_update_group_fail_version_conflict(create_test_group: None, messagebus: MessageBus) -> None:
+    user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True), id=1)
+    await update_group(
+        group_id=1,
+        user=user,
+        group_data=CreateOrUpdateGroupScheme(name='SomeNewName'),
+        messagebus=messagebus,
+        expected_versions=(1, )
+    )
+
+    # Another device still expects the version, which was just changed, so its update is rejected:
+    with pytest.raises(GroupVersionConflictError):
+        await update_group(
+            group_id=1,
+            user=user,
+            group_data=CreateOrUpdateGroupScheme(name='OtherName'),
+            messagebus=messagebus,
+            expected_versions=(1, )
+        )
@@ -0,0 +1,145 @@
+import json
+import pytest
+from typing import List, Any, Set
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from src.core.pagination import PageRequest
+from src.core.projection import Projection
+from src.groups.adapters.queries import SQLAlchemyGroupsQueries
+from src.groups.adapters.repositories import SQLAlchemyGroupsRepository
+from src.groups.constants import GroupLoadProfiles
+from src.groups.domain.models import GroupModel, GroupMemberModel
+from src.groups.domain.commands import AddGroupMembersCommand, RemoveGroupMembersCommand
+from src.groups.service_layer.handlers.command_handlers import (
+    AddGroupMembersCommandHandler,
+    RemoveGroupMembersCommandHandler
+)
+from src.groups.service_layer.units_of_work import SQLAlchemyGroupsUnitOfWork
+from src.users.domain.models import UserModel
+from tests.utils import capture_statements, assert_statements_use_indexes, get_plan_nodes, postgres_is_reachable
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_repository_queries_do_not_scan_tables(large_tables_engine: AsyncEngine) -> None:
+    engine: AsyncEngine = large_tables_engine
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine)
+    with capture_statements(engine=engine) as statements:
+        async with session_factory() as session:
+            repository: SQLAlchemyGroupsRepository = SQLAlchemyGroupsRepository(session=session)
+            await repository.get(id=1, profile=GroupLoadProfiles.DETAIL)
+            await repository.get(id=1, profile=GroupLoadProfiles.MEMBERSHIP_CHECK)
+            await repository.get_by_owner_and_name(name='group_0', owner_id=1)
+            await repository.get_user_groups(user_id=1)
+            await repository.update(id=1, model=GroupModel(id=1, name='new_name', owner_id=1))
+            await repository.update_by_owner(id=2, owner_id=1, model=GroupModel(name='other_name', owner_id=1))
+            await repository.delete_by_owner(id=2, owner_id=1)
+            await repository.delete(id=1)
+            await session.rollback()
+
+    await assert_statements_use_indexes(engine=engine, statements=statements)
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_queries_do_not_scan_tables(large_tables_engine: AsyncEngine) -> None:
+    engine: AsyncEngine = large_tables_engine
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine)
+    with capture_statements(engine=engine) as statements:
+        async with session_factory() as session:
+            queries: SQLAlchemyGroupsQueries = SQLAlchemyGroupsQueries(session=session)
+            await queries.get_user_groups(user_id=1, page_request=PageRequest())
+            await queries.get_user_groups(user_id=1, page_request=PageRequest(after_id=1))
+            async for _ in queries.stream_user_groups(user_id=1):
+                pass
+
+            async for _ in queries.stream_user_groups(user_id=1, projection=Projection(fields=('id',))):
+                pass
+
+    await assert_statements_use_indexes(engine=engine, statements=statements)
+
+
+@pytest.mark.anyio
+async def test_groups_members_are_changed_without_loading_them(large_tables_engine: AsyncEngine) -> None:
+    engine: AsyncEngine = large_tables_engine
+    uow: SQLAlchemyGroupsUnitOfWork = SQLAlchemyGroupsUnitOfWork(session_factory=async_sessionmaker(bind=engine))
+    users: Set[UserModel] = {
+        UserModel(id=user_id, email=f'user_{user_id}@test.com', password='password', username=f'user_{user_id}')
+        for user_id in range(1, 101)
+    }
+
+    owner: UserModel = UserModel(id=1, email='user_1@test.com', password='password', username='user_1')
+    with capture_statements(engine=engine) as statements:
+        added_members: Set[GroupMemberModel] = await AddGroupMembersCommandHandler(uow=uow)(
+            AddGroupMembersCommand(group_id=1, user=owner, group_members=users)
+        )
+        removed_members: Set[GroupMemberModel] = await RemoveGroupMembersCommandHandler(uow=uow)(
+            RemoveGroupMembersCommand(group_id=1, user=owner, group_members=users)
+        )
+
+    # Members, which were seeded, are skipped on adding, but are removed:
+    assert len(added_members) < len(users)
+    assert removed_members == {GroupMemberModel(group_id=1, user_id=user.id) for user in users}
+
+    # Group is selected only once per command, to check its owner:
+    groups_statements: List[str] = [statement for statement, _ in statements if statement.startswith('SELECT groups')]
+    assert len(groups_statements) == 2
+
+    changing_statements: List[str] = [statement for statement, _ in statements if 'group_members' in statement]
+    assert len(changing_statements) == 2
+    assert changing_statements[0].startswith('INSERT INTO group_members')
+    assert changing_statements[1].startswith('DELETE FROM group_members')
+
+    await assert_statements_use_indexes(engine=engine, statements=statements)
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_queries_list_member_counts_without_reading_members(
+        large_tables_engine: AsyncEngine
+) -> None:
+
+    engine: AsyncEngine = large_tables_engine
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine)
+    projection: Projection = Projection(fields=('id', 'name', 'member_count'), is_partial=True)
+    with capture_statements(engine=engine) as statements:
+        async with session_factory() as session:
+            queries: SQLAlchemyGroupsQueries = SQLAlchemyGroupsQueries(session=session)
+            await queries.get_user_groups(user_id=1, page_request=PageRequest(), projection=projection)
+            async for _ in queries.stream_user_groups(user_id=1, projection=projection):
+                pass
+
+    assert len(statements) == 2
+    assert not [statement for statement, _ in statements if 'group_members' in statement]
+    await assert_statements_use_indexes(engine=engine, statements=statements)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('large_tables_engine', ['postgresql'], indirect=True)
+@pytest.mark.skipif(not postgres_is_reachable(), reason='PostgreSQL is not reachable')
+async def test_sqlalchemy_groups_queries_list_groups_by_index_only_scan_on_postgresql(
+        large_tables_engine: AsyncEngine
+) -> None:
+
+    """
+    Names of groups are included into owner's index, so that listing of groups without members does not read the
+    groups table.
+    """
+
+    engine: AsyncEngine = large_tables_engine
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine)
+    projection: Projection = Projection(fields=('id', 'name'), is_partial=True)
+    with capture_statements(engine=engine) as statements:
+        async with session_factory() as session:
+            queries: SQLAlchemyGroupsQueries = SQLAlchemyGroupsQueries(session=session)
+            await queries.get_user_groups(user_id=1, page_request=PageRequest(), projection=projection)
+
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    async with engine.connect() as conn:
+        plan: Any = (await conn.exec_driver_sql('EXPLAIN (FORMAT JSON) ' + statement, parameters)).scalar_one()
+
+    plan = json.loads(plan) if isinstance(plan, str) else plan
+    index_nodes_types: List[str] = [
+        node['Node Type']
+        for node in get_plan_nodes(node=plan[0]['Plan'])
+        if node.get('Index Name') == 'ix_groups_owner_id_id'
+    ]
+    assert index_nodes_types == ['Index Only Scan']
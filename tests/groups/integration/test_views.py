@@ -1,9 +1,10 @@
 import pytest
-from typing import List
 
-from src.groups.domain.models import GroupModel
+from src.core.pagination import Page, PageRequest
+from src.groups.domain.read_models import GroupReadModel
 from src.groups.interfaces import GroupsRepository, GroupsUnitOfWork
 from src.groups.entypoints.views import GroupsViews
+from src.groups.exceptions import GroupNotFoundError, GroupOwnerError
 from tests.config import FakeGroupConfig
 from tests.groups.fake_objects import FakeGroupsUnitOfWork
 from tests.groups.utils import create_fake_groups_repository_instance
@@ -13,9 +14,12 @@ from tests.groups.utils import create_fake_groups_repository_instance
 async def test_groups_views_get_user_groups_with_existing_groups() -> None:
     groups_repository: GroupsRepository = create_fake_groups_repository_instance(with_group=True)
     groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
-    groups: List[GroupModel] = await GroupsViews(uow=groups_unit_of_work).get_user_groups(user_id=1)
-    assert len(groups) == 1
-    group: GroupModel = groups[0]
+    page: Page[GroupReadModel] = await GroupsViews(uow=groups_unit_of_work).get_user_groups(
+        user_id=1,
+        page_request=PageRequest()
+    )
+    assert len(page.items) == 1
+    group: GroupReadModel = page.items[0]
     assert group.name == FakeGroupConfig.NAME
     assert group.owner_id == FakeGroupConfig.OWNER_ID
 
@@ -24,5 +28,36 @@ async def test_groups_views_get_user_groups_with_existing_groups() -> None:
 async def test_groups_views_get_user_groups_without_existing_groups() -> None:
     groups_repository: GroupsRepository = create_fake_groups_repository_instance()
     groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
-    groups: List[GroupModel] = await GroupsViews(uow=groups_unit_of_work).get_user_groups(user_id=1)
-    assert len(groups) == 0
+    page: Page[GroupReadModel] = await GroupsViews(uow=groups_unit_of_work).get_user_groups(
+        user_id=1,
+        page_request=PageRequest()
+    )
+    assert len(page.items) == 0
+
+
+@pytest.mark.anyio
+async def test_groups_views_get_user_group_with_existing_group() -> None:
+    groups_repository: GroupsRepository = create_fake_groups_repository_instance(with_group=True)
+    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
+    group: GroupReadModel = await GroupsViews(uow=groups_unit_of_work).get_user_group(
+        group_id=1,
+        user_id=FakeGroupConfig.OWNER_ID
+    )
+    assert group.name == FakeGroupConfig.NAME
+    assert group.version == 1
+
+
+@pytest.mark.anyio
+async def test_groups_views_get_user_group_fail_group_does_not_exist() -> None:
+    groups_repository: GroupsRepository = create_fake_groups_repository_instance()
+    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
+    with pytest.raises(GroupNotFoundError):
+        await GroupsViews(uow=groups_unit_of_work).get_user_group(group_id=1, user_id=FakeGroupConfig.OWNER_ID)
+
+
+@pytest.mark.anyio
+async def test_groups_views_get_user_group_fail_group_belongs_to_another_user() -> None:
+    groups_repository: GroupsRepository = create_fake_groups_repository_instance(with_group=True)
+    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
+    with pytest.raises(GroupOwnerError):
+        await GroupsViews(uow=groups_unit_of_work).get_user_group(group_id=1, user_id=FakeGroupConfig.OWNER_ID + 1)
@@ -0,0 +1,152 @@
+import pytest
+from typing import List, Optional
+from sqlalchemy import insert, update
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from src.core.pagination import PageRequest
+from src.core.projection import Projection
+from src.groups.adapters.orm import group_members_table, groups_table
+from src.groups.adapters.queries import SQLAlchemyGroupsQueries
+from src.groups.domain.read_models import GroupReadModel, GroupMemberReadModel
+from tests.config import FakeGroupConfig
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_queries_get_user_groups_with_members(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(insert(group_members_table).values(group_id=1, user_id=FakeGroupConfig.OWNER_ID))
+    await async_connection.execute(update(groups_table).filter_by(id=1).values(member_count=1))
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    groups: List[GroupReadModel] = await SQLAlchemyGroupsQueries(session=session).get_user_groups(
+        user_id=FakeGroupConfig.OWNER_ID,
+        page_request=PageRequest()
+    )
+
+    assert groups == [
+        GroupReadModel(
+            id=1,
+            name=FakeGroupConfig.NAME,
+            owner_id=FakeGroupConfig.OWNER_ID,
+            member_count=1,
+            version=1,
+            members=[GroupMemberReadModel(group_id=1, user_id=FakeGroupConfig.OWNER_ID)]
+        )
+    ]
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_queries_get_user_groups_without_existing_groups(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    groups: List[GroupReadModel] = await SQLAlchemyGroupsQueries(session=session).get_user_groups(
+        user_id=1,
+        page_request=PageRequest()
+    )
+    assert groups == []
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_queries_get_user_groups_after_cursor(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(insert(groups_table).values(name='second_group', owner_id=FakeGroupConfig.OWNER_ID))
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    groups: List[GroupReadModel] = await SQLAlchemyGroupsQueries(session=session).get_user_groups(
+        user_id=FakeGroupConfig.OWNER_ID,
+        page_request=PageRequest(limit=1)
+    )
+    assert [group.id for group in groups] == [1, 2]
+
+    groups = await SQLAlchemyGroupsQueries(session=session).get_user_groups(
+        user_id=FakeGroupConfig.OWNER_ID,
+        page_request=PageRequest(limit=1, after_id=1)
+    )
+    assert [group.name for group in groups] == ['second_group']
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_queries_stream_user_groups_keeps_members_split_between_partitions(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(insert(groups_table).values(name='second_group', owner_id=FakeGroupConfig.OWNER_ID))
+    await async_connection.execute(
+        insert(group_members_table),
+        [{'group_id': 1, 'user_id': 1}, {'group_id': 1, 'user_id': 2}, {'group_id': 2, 'user_id': 1}]
+    )
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    groups: List[GroupReadModel] = [
+        group
+        async for partition in SQLAlchemyGroupsQueries(session=session).stream_user_groups(
+            user_id=FakeGroupConfig.OWNER_ID,
+            partition_size=1
+        )
+        for group in partition
+    ]
+
+    assert [group.id for group in groups] == [1, 2]
+    assert [member.user_id for member in groups[0].members] == [1, 2]
+    assert [member.user_id for member in groups[1].members] == [1]
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_queries_skip_members_if_not_projected(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(insert(group_members_table).values(group_id=1, user_id=FakeGroupConfig.OWNER_ID))
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    queries: SQLAlchemyGroupsQueries = SQLAlchemyGroupsQueries(session=session)
+    projection: Projection = Projection(fields=('name',), is_partial=True)
+    groups: List[GroupReadModel] = await queries.get_user_groups(
+        user_id=FakeGroupConfig.OWNER_ID,
+        page_request=PageRequest(),
+        projection=projection
+    )
+    assert groups == [GroupReadModel(id=1, name=FakeGroupConfig.NAME)]
+
+    streamed_groups: List[GroupReadModel] = [
+        group
+        async for partition in queries.stream_user_groups(user_id=FakeGroupConfig.OWNER_ID, projection=projection)
+        for group in partition
+    ]
+    assert streamed_groups == groups
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_queries_get_group_with_members(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(insert(group_members_table).values(group_id=1, user_id=FakeGroupConfig.OWNER_ID))
+    await async_connection.execute(update(groups_table).filter_by(id=1).values(member_count=1, version=3))
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    queries: SQLAlchemyGroupsQueries = SQLAlchemyGroupsQueries(session=session)
+
+    group: Optional[GroupReadModel] = await queries.get_group(group_id=1)
+    assert group == GroupReadModel(
+        id=1,
+        name=FakeGroupConfig.NAME,
+        owner_id=FakeGroupConfig.OWNER_ID,
+        member_count=1,
+        version=3,
+        members=[GroupMemberReadModel(group_id=1, user_id=FakeGroupConfig.OWNER_ID)]
+    )
+    assert await queries.get_group(group_id=2) is None
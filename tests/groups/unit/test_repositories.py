@@ -1,11 +1,14 @@
 import pytest
-from typing import Optional, List, Sequence
-from sqlalchemy import select, CursorResult, Row
-from sqlalchemy.exc import NoResultFound
+from typing import Optional, List, Sequence, Set
+from sqlalchemy import select, insert, CursorResult, Row
+from sqlalchemy.exc import NoResultFound, InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
 
-from src.groups.domain.models import GroupModel
+from src.groups.constants import GroupLoadProfiles
+from src.groups.domain.models import GroupModel, GroupMemberModel
+from src.groups.adapters.orm import groups_table, group_members_table
 from src.groups.adapters.repositories import SQLAlchemyGroupsRepository
+from src.users.adapters.orm import users_table
 from tests.config import FakeGroupConfig
 
 
@@ -278,3 +281,165 @@ async def test_sqlalchemy_groups_repository_update_non_existing_group(
     group: GroupModel = GroupModel(**FakeGroupConfig().to_dict(to_lower=True))
     with pytest.raises(NoResultFound):
         await SQLAlchemyGroupsRepository(session=session).update(id=1, model=group)
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_repository_add_if_not_exists(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    repository: SQLAlchemyGroupsRepository = SQLAlchemyGroupsRepository(session=session)
+    group: GroupModel = GroupModel(**FakeGroupConfig().to_dict(to_lower=True))
+    assert await repository.add_if_not_exists(model=group) is None
+
+    group.name = 'another_group_name'
+    created_group: Optional[GroupModel] = await repository.add_if_not_exists(model=group)
+    assert created_group is not None
+    assert created_group.id == 2
+    assert created_group.members == set()
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_repository_get_with_load_profiles(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(insert(group_members_table).values(group_id=1, user_id=1))
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+
+    group: Optional[GroupModel] = await SQLAlchemyGroupsRepository(session=async_session_factory()).get(
+        id=1,
+        profile=GroupLoadProfiles.DETAIL
+    )
+    assert group is not None
+    assert group.members == {GroupMemberModel(group_id=1, user_id=1)}
+
+    group = await SQLAlchemyGroupsRepository(session=async_session_factory()).get(
+        id=1,
+        profile=GroupLoadProfiles.LIST
+    )
+    assert group is not None
+    assert group.members == set()
+
+    group = await SQLAlchemyGroupsRepository(session=async_session_factory()).get(
+        id=1,
+        profile=GroupLoadProfiles.MEMBERSHIP_CHECK
+    )
+    assert group is not None
+    assert group.owner_id == FakeGroupConfig.OWNER_ID
+    with pytest.raises(InvalidRequestError):
+        assert group.members
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_repository_get_user_groups_without_members(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(insert(group_members_table).values(group_id=1, user_id=1))
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    groups: List[GroupModel] = await SQLAlchemyGroupsRepository(session=session).get_user_groups(
+        user_id=FakeGroupConfig.OWNER_ID
+    )
+
+    assert len(groups) == 1
+    assert groups[0].members == set()
+
+    # Groups are returned as they are tracked by the session, without being copied:
+    assert groups[0] in session
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_repository_add_and_remove_members(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        insert(users_table),
+        [{'email': f'user_{index}@test.com', 'username': f'user_{index}', 'password': 'password'} for index in range(4)]
+    )
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    repository: SQLAlchemyGroupsRepository = SQLAlchemyGroupsRepository(session=session)
+    assert await repository.add_members(group_id=1, user_ids={1, 2, 3}) == {1, 2, 3}
+    assert await repository.add_members(group_id=1, user_ids={2, 3, 4}) == {4}
+    assert await repository.remove_members(group_id=1, user_ids={1, 4, 5}) == {1, 4}
+
+    cursor: CursorResult = await async_connection.execute(
+        select(group_members_table.c.user_id).filter_by(group_id=1)
+    )
+    user_ids: Set[int] = set(cursor.scalars().all())
+    assert user_ids == {2, 3}
+
+    # Member count is changed only by actually added and removed members:
+    assert await async_connection.scalar(select(groups_table.c.member_count).filter_by(id=1)) == 2
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_repository_update_and_delete_by_owner(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    repository: SQLAlchemyGroupsRepository = SQLAlchemyGroupsRepository(session=session)
+    group: GroupModel = GroupModel(name='SomeNewName', owner_id=FakeGroupConfig.OWNER_ID)
+
+    assert await repository.update_by_owner(id=1, owner_id=FakeGroupConfig.OWNER_ID + 1, model=group) is None
+    assert await repository.delete_by_owner(id=1, owner_id=FakeGroupConfig.OWNER_ID + 1) is False
+    assert await repository.update_by_owner(id=2, owner_id=FakeGroupConfig.OWNER_ID, model=group) is None
+
+    updated_group: Optional[GroupModel] = await repository.update_by_owner(
+        id=1,
+        owner_id=FakeGroupConfig.OWNER_ID,
+        model=group
+    )
+    assert updated_group is not None
+    assert updated_group.name == 'SomeNewName'
+
+    assert await repository.delete_by_owner(id=1, owner_id=FakeGroupConfig.OWNER_ID) is True
+    assert await repository.get(id=1) is None
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_groups_repository_update_by_owner_with_expected_versions(
+        create_test_group: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    repository: SQLAlchemyGroupsRepository = SQLAlchemyGroupsRepository(session=session)
+    group: GroupModel = GroupModel(name='SomeNewName', owner_id=FakeGroupConfig.OWNER_ID)
+
+    # Empty expected versions match no version at all:
+    for expected_versions in ((2, ), ()):
+        assert await repository.update_by_owner(
+            id=1,
+            owner_id=FakeGroupConfig.OWNER_ID,
+            model=group,
+            expected_versions=expected_versions
+        ) is None
+
+    updated_group: Optional[GroupModel] = await repository.update_by_owner(
+        id=1,
+        owner_id=FakeGroupConfig.OWNER_ID,
+        model=group,
+        expected_versions=(1, 3)
+    )
+    assert updated_group is not None
+    assert updated_group.version == 2
+
+    # Without expected versions group is updated unconditionally, but its version is still incremented:
+    updated_group = await repository.update_by_owner(id=1, owner_id=FakeGroupConfig.OWNER_ID, model=group)
+    assert updated_group is not None
+    assert updated_group.version == 3
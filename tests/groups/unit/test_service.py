@@ -1,7 +1,7 @@
 import pytest
-from typing import List
+from typing import List, Set
 
-from src.groups.exceptions import GroupNotFoundError
+from src.groups.exceptions import GroupNotFoundError, GroupOwnerError
 from src.groups.interfaces.repositories import GroupsRepository
 from src.groups.interfaces.units_of_work import GroupsUnitOfWork
 from src.groups.domain.models import GroupModel, GroupMemberModel
@@ -30,10 +30,30 @@ async def test_groups_service_delete_group_success() -> None:
     groups_service: GroupsService = GroupsService(uow=groups_unit_of_work)
 
     assert len(await groups_repository.list()) == 1
-    await groups_service.delete_group(id=1)
+    await groups_service.delete_group(id=1, owner_id=FakeGroupConfig.OWNER_ID)
     assert len(await groups_repository.list()) == 0
 
 
+@pytest.mark.anyio
+async def test_groups_service_delete_group_fail_group_not_found() -> None:
+    groups_repository: GroupsRepository = create_fake_groups_repository_instance()
+    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
+    groups_service: GroupsService = GroupsService(uow=groups_unit_of_work)
+    with pytest.raises(GroupNotFoundError):
+        await groups_service.delete_group(id=1, owner_id=FakeGroupConfig.OWNER_ID)
+
+
+@pytest.mark.anyio
+async def test_groups_service_delete_group_fail_group_does_not_belong_to_owner() -> None:
+    groups_repository: GroupsRepository = create_fake_groups_repository_instance(with_group=True)
+    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
+    groups_service: GroupsService = GroupsService(uow=groups_unit_of_work)
+    with pytest.raises(GroupOwnerError):
+        await groups_service.delete_group(id=1, owner_id=FakeGroupConfig.OWNER_ID + 1)
+
+    assert len(await groups_repository.list()) == 1
+
+
 @pytest.mark.anyio
 async def test_groups_service_get_user_groups_success_without_groups() -> None:
     groups_repository: GroupsRepository = create_fake_groups_repository_instance()
@@ -140,6 +160,19 @@ async def test_groups_service_update_group_fail_group_not_found() -> None:
         await groups_service.update_group(id=1, group=group)
 
 
+@pytest.mark.anyio
+async def test_groups_service_update_group_fail_group_does_not_belong_to_owner() -> None:
+    groups_repository: GroupsRepository = create_fake_groups_repository_instance(with_group=True)
+    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
+    groups_service: GroupsService = GroupsService(uow=groups_unit_of_work)
+    group: GroupModel = GroupModel(name='SomeNewName', owner_id=FakeGroupConfig.OWNER_ID + 1)
+
+    with pytest.raises(GroupOwnerError):
+        await groups_service.update_group(id=1, group=group)
+
+    assert (await groups_repository.list())[0].name == FakeGroupConfig.NAME
+
+
 @pytest.mark.anyio
 async def test_groups_service_add_group_members_success() -> None:
     group_id: int = 1
@@ -153,19 +186,18 @@ async def test_groups_service_add_group_members_success() -> None:
     groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
     groups_service: GroupsService = GroupsService(uow=groups_unit_of_work)
     group_member: GroupMemberModel = GroupMemberModel(group_id=group_id, user_id=user_id)
-    group: GroupModel = await groups_service.add_group_members(id=group_id, members={group_member})
+    group: GroupModel = groups_repository.groups[group_id]
+    added_group_members: Set[GroupMemberModel] = await groups_service.add_group_members(
+        group=group,
+        members={group_member}
+    )
 
     assert len(groups_repository.groups[group_id].members) == 1
-    assert group.members == {group_member}
+    assert added_group_members == {group_member}
 
-
-@pytest.mark.anyio
-async def test_groups_service_add_group_members_fail_group_not_found() -> None:
-    groups_repository: GroupsRepository = create_fake_groups_repository_instance()
-    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
-    groups_service: GroupsService = GroupsService(uow=groups_unit_of_work)
-    with pytest.raises(GroupNotFoundError):
-        await groups_service.add_group_members(id=1, members=set())
+    # Already existing member is skipped:
+    assert await groups_service.add_group_members(group=group, members={group_member}) == set()
+    assert len(groups_repository.groups[group_id].members) == 1
 
 
 @pytest.mark.anyio
@@ -182,28 +214,24 @@ async def test_groups_service_remove_group_members_success() -> None:
 
     groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
     groups_service: GroupsService = GroupsService(uow=groups_unit_of_work)
-    group: GroupModel = await groups_service.remove_group_members(id=group_id, members={group_member})
+    removed_group_members: Set[GroupMemberModel] = await groups_service.remove_group_members(
+        group=groups_repository.groups[group_id],
+        members={group_member}
+    )
 
     assert len(groups_repository.groups[group_id].members) == 0
-    assert not group.members
-
-
-@pytest.mark.anyio
-async def test_groups_service_remove_group_members_fail_group_not_found() -> None:
-    groups_repository: GroupsRepository = create_fake_groups_repository_instance()
-    groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
-    groups_service: GroupsService = GroupsService(uow=groups_unit_of_work)
-    with pytest.raises(GroupNotFoundError):
-        await groups_service.remove_group_members(id=1, members=set())
+    assert removed_group_members == {group_member}
 
 
 @pytest.mark.anyio
-async def test_groups_service_remove_group_members_fail_no_member_in_group_members() -> None:
+async def test_groups_service_remove_group_members_skips_not_members() -> None:
     group_id: int = 1
 
     groups_repository: GroupsRepository = create_fake_groups_repository_instance(with_group=True)
     groups_unit_of_work: GroupsUnitOfWork = FakeGroupsUnitOfWork(groups_repository=groups_repository)
     groups_service: GroupsService = GroupsService(uow=groups_unit_of_work)
     group_member: GroupMemberModel = GroupMemberModel(group_id=group_id, user_id=1)
-    with pytest.raises(KeyError):
-        await groups_service.remove_group_members(id=group_id, members={group_member})
+    assert await groups_service.remove_group_members(
+        group=await groups_service.get_group_by_id(id=group_id),
+        members={group_member}
+    ) == set()
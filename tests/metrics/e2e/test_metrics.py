@@ -0,0 +1,30 @@
+import pytest
+from fastapi import status
+from httpx import Response, AsyncClient, Cookies
+
+from src.config import URLPathsConfig
+from src.groups.config import RouterConfig as GroupsRouterConfig, URLPathsConfig as GroupsURLPathsConfig
+from tests.config import FakeGroupConfig
+
+
+@pytest.mark.anyio
+async def test_metrics_exposes_messagebus_metrics(
+        async_client: AsyncClient,
+        create_test_user: None,
+        cookies: Cookies
+) -> None:
+
+    await async_client.post(
+        url=GroupsRouterConfig.PREFIX + GroupsURLPathsConfig.CREATE_GROUP,
+        json=FakeGroupConfig().to_dict(to_lower=True),
+        cookies=cookies
+    )
+
+    response: Response = await async_client.get(url=URLPathsConfig.METRICS)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'].startswith('text/plain')
+    assert '# TYPE messagebus_message_duration_seconds histogram' in response.text
+    assert (
+        'messagebus_message_duration_seconds_count{kind="command",message_type="CreateGroupCommand"}'
+        in response.text
+    )
@@ -0,0 +1,53 @@
+import pytest
+from fastapi import FastAPI, Depends, status
+from fastapi.exceptions import HTTPException
+from httpx import Response, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config import ReadYourWritesConfig
+from src.core.database.connection import session_factory
+from src.dependencies import get_views_session_factory
+from src.middlewares import ReadYourWritesMiddleware
+from tests.utils import get_base_url
+
+
+def create_test_app() -> FastAPI:
+    test_app: FastAPI = FastAPI()
+    test_app.add_middleware(ReadYourWritesMiddleware, seconds=5)
+
+    @test_app.post('/write')
+    async def write() -> None:
+        pass
+
+    @test_app.post('/fail')
+    async def fail() -> None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST)
+
+    @test_app.get('/read')
+    async def read(views_session_factory: async_sessionmaker = Depends(get_views_session_factory)) -> bool:
+        return views_session_factory is session_factory
+
+    return test_app
+
+
+@pytest.mark.anyio
+async def test_read_your_writes_middleware_pins_client_to_primary_after_successful_write() -> None:
+    async with AsyncClient(app=create_test_app(), base_url=get_base_url()) as async_client:
+        response: Response = await async_client.get(url='/read')
+        assert ReadYourWritesConfig.COOKIE_KEY not in response.cookies
+
+        response = await async_client.post(url='/write')
+        assert response.status_code == status.HTTP_200_OK
+        assert ReadYourWritesConfig.COOKIE_KEY in response.cookies
+        assert 'Max-Age=5' in response.headers['set-cookie']
+
+        response = await async_client.get(url='/read')
+        assert response.json() is True
+
+
+@pytest.mark.anyio
+async def test_read_your_writes_middleware_not_pins_client_after_failed_write() -> None:
+    async with AsyncClient(app=create_test_app(), base_url=get_base_url()) as async_client:
+        response: Response = await async_client.post(url='/fail')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert ReadYourWritesConfig.COOKIE_KEY not in response.cookies
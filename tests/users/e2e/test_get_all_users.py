@@ -1,10 +1,19 @@
+import json
 import pytest
 from fastapi import status
 from httpx import Response, AsyncClient
 from typing import Dict, Any, List
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
+from src.core.constants import ErrorDetails
+from src.core.database.connection import DATABASE_URL
+from src.core.export import ExportConfig
+from src.core.pagination import PaginationConfig
+from src.users.adapters.orm import users_table
 from src.users.config import RouterConfig, URLPathsConfig
 from tests.config import FakeUserConfig
+from tests.utils import get_error_message_from_response
 
 
 @pytest.mark.anyio
@@ -22,7 +31,7 @@ async def test_get_all_users_with_existing_user(
     assert user['id'] == 1
     assert user['email'] == FakeUserConfig.EMAIL
     assert user['username'] == FakeUserConfig.USERNAME
-    assert not user['password']
+    assert 'password' not in user
 
 
 @pytest.mark.anyio
@@ -32,3 +41,95 @@ async def test_get_all_users_without_existing_users(async_client: AsyncClient, m
 
     response_content: List[Dict[str, Any]] = response.json()
     assert len(response_content) == 0
+
+
+@pytest.mark.anyio
+async def test_get_all_users_paginates_by_cursor(async_client: AsyncClient, create_test_user: None) -> None:
+    engine: AsyncEngine = create_async_engine(DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.execute(
+            insert(users_table),
+            [
+                {'email': f'user_{index}@yandex.ru', 'password': 'password', 'username': f'user_{index}'}
+                for index in range(2)
+            ]
+        )
+
+    await engine.dispose()
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'limit': 2, 'with_total': True}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [user['id'] for user in response.json()] == [1, 2]
+    assert response.headers[PaginationConfig.TOTAL_COUNT_HEADER] == '3'
+    next_cursor: str = response.headers[PaginationConfig.NEXT_CURSOR_HEADER]
+
+    response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'limit': 2, 'cursor': next_cursor}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [user['id'] for user in response.json()] == [3]
+    assert PaginationConfig.NEXT_CURSOR_HEADER not in response.headers
+    assert PaginationConfig.TOTAL_COUNT_HEADER not in response.headers
+
+
+@pytest.mark.anyio
+async def test_get_all_users_fail_invalid_pagination(async_client: AsyncClient, map_models_to_orm: None) -> None:
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'cursor': 'invalid'}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert get_error_message_from_response(response=response) == ErrorDetails.INVALID_CURSOR
+
+    response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'limit': PaginationConfig.MAX_LIMIT + 1}
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.anyio
+async def test_get_all_users_streams_export(async_client: AsyncClient, create_test_user: None) -> None:
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        headers={'Accept': ExportConfig.NDJSON_MEDIA_TYPE}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'].startswith(ExportConfig.NDJSON_MEDIA_TYPE)
+    assert response.text.splitlines() == [
+        json.dumps(
+            {'id': 1, 'email': FakeUserConfig.EMAIL, 'username': FakeUserConfig.USERNAME, 'email_verified': True}
+        )
+    ]
+
+    response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        headers={'Accept': ExportConfig.CSV_MEDIA_TYPE}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'].startswith(ExportConfig.CSV_MEDIA_TYPE)
+    assert response.text.splitlines() == [
+        'id,email,username,email_verified',
+        f'1,{FakeUserConfig.EMAIL},{FakeUserConfig.USERNAME},True'
+    ]
+
+
+@pytest.mark.anyio
+async def test_get_all_users_with_fields(async_client: AsyncClient, create_test_user: None) -> None:
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'fields': 'id,username', 'limit': 1}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [{'id': 1, 'username': FakeUserConfig.USERNAME}]
+
+    response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ALL,
+        params={'fields': 'email'},
+        headers={'Accept': ExportConfig.CSV_MEDIA_TYPE}
+    )
+    assert response.text.splitlines() == ['email', FakeUserConfig.EMAIL]
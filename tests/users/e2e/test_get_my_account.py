@@ -4,6 +4,7 @@ from httpx import Response, AsyncClient, Cookies
 from typing import Dict, Any
 
 from src.users.config import RouterConfig, URLPathsConfig, cookies_config
+from src.core.constants import ErrorDetails as CoreErrorDetails
 from src.users.constants import ErrorDetails
 from tests.config import FakeUserConfig
 from tests.utils import get_error_message_from_response
@@ -37,3 +38,27 @@ async def test_get_my_account_fail(async_client: AsyncClient, create_test_user:
 
     assert response.status_code == status.HTTP_401_UNAUTHORIZED
     assert get_error_message_from_response(response=response) == ErrorDetails.USER_NOT_AUTHENTICATED
+
+
+@pytest.mark.anyio
+async def test_get_my_account_with_fields(
+        async_client: AsyncClient,
+        create_test_user: None,
+        cookies: Cookies
+) -> None:
+
+    response: Response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ME,
+        params={'fields': 'username'},
+        cookies=cookies
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {'username': FakeUserConfig.USERNAME}
+
+    response = await async_client.get(
+        url=RouterConfig.PREFIX + URLPathsConfig.ME,
+        params={'fields': 'username,password'},
+        cookies=cookies
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert get_error_message_from_response(response=response) == CoreErrorDetails.INVALID_FIELDS
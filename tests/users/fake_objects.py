@@ -1,8 +1,12 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, AsyncIterator
 
 from src.users.interfaces.units_of_work import UsersUnitOfWork
 from src.users.interfaces.repositories import UsersRepository
+from src.users.interfaces.queries import UsersQueries
 from src.users.domain.models import UserModel
+from src.users.domain.read_models import UserReadModel
+from src.core.pagination import PageRequest
+from src.core.projection import Projection
 from src.core.interfaces import AbstractModel
 
 
@@ -28,11 +32,21 @@ class FakeUsersRepository(UsersRepository):
 
         return None
 
+    async def get_by_login(self, login: str) -> Optional[UserModel]:
+        return await self.get_by_email(email=login) or await self.get_by_username(username=login)
+
     async def add(self, model: AbstractModel) -> UserModel:
         user: UserModel = UserModel(**await model.to_dict())
         self.users[user.id] = user
         return user
 
+    async def add_if_not_exists(self, model: AbstractModel) -> Optional[UserModel]:
+        user: UserModel = UserModel(**await model.to_dict())
+        if await self.get_by_email(email=user.email) or await self.get_by_username(username=user.username):
+            return None
+
+        return await self.add(model=user)
+
     async def update(self, id: int, model: AbstractModel) -> UserModel:
         user: UserModel = UserModel(**await model.to_dict())
         if id in self.users:
@@ -48,11 +62,55 @@ class FakeUsersRepository(UsersRepository):
         return list(self.users.values())
 
 
+class FakeUsersQueries(UsersQueries):
+
+    def __init__(self, users_repository: UsersRepository) -> None:
+        self._users_repository: UsersRepository = users_repository
+
+    async def get_user_account(self, user_id: int, projection: Optional[Projection] = None) -> Optional[UserReadModel]:
+        user: Optional[UserModel] = await self._users_repository.get(id=user_id)
+        return self._to_read_model(user=user) if user else None
+
+    async def get_all_users(
+            self,
+            page_request: PageRequest,
+            projection: Optional[Projection] = None
+    ) -> List[UserReadModel]:
+
+        users: List[UserModel] = sorted(await self._users_repository.list(), key=lambda user: user.id)
+        return [
+            self._to_read_model(user=user)
+            for user in users
+            if page_request.after_id is None or user.id > page_request.after_id
+        ][:page_request.limit + 1]
+
+    async def get_approximate_users_count(self) -> Optional[int]:
+        return len(await self._users_repository.list())
+
+    async def stream_all_users(
+            self,
+            partition_size: int = 1000,
+            projection: Optional[Projection] = None
+    ) -> AsyncIterator[List[UserReadModel]]:
+
+        users: List[UserReadModel] = [
+            self._to_read_model(user=user)
+            for user in sorted(await self._users_repository.list(), key=lambda user: user.id)
+        ]
+        for index in range(0, len(users), partition_size):
+            yield users[index:index + partition_size]
+
+    @staticmethod
+    def _to_read_model(user: UserModel) -> UserReadModel:
+        return UserReadModel(id=user.id, email=user.email, username=user.username, email_verified=user.email_verified)
+
+
 class FakeUsersUnitOfWork(UsersUnitOfWork):
 
     def __init__(self, users_repository: UsersRepository) -> None:
         super().__init__()
         self.users: UsersRepository = users_repository
+        self.users_queries: UsersQueries = FakeUsersQueries(users_repository=users_repository)
         self.committed: bool = False
 
     async def commit(self) -> None:
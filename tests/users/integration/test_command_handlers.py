@@ -1,7 +1,9 @@
 import pytest
 from typing import List
 
+from src.celery.tasks.users_tasks import send_verify_email_message
 from src.core.interfaces import AbstractEvent
+from src.core.outbox.models import OutboxMessageModel
 from src.users.domain.commands import (
     RegisterUserCommand,
     VerifyUserCredentialsCommand
@@ -45,6 +47,15 @@ async def test_register_user_command_handler_success() -> None:
     assert len(events) == 1
     assert isinstance(events[0], UserRegisteredEvent)
 
+    outbox_messages: List[OutboxMessageModel] = list(users_unit_of_work.get_outbox_messages())
+    assert len(outbox_messages) == 1
+    assert outbox_messages[0].task == send_verify_email_message.name
+    assert outbox_messages[0].kwargs == {
+        'user_id': user.id,
+        'username': FakeUserConfig.USERNAME,
+        'email': FakeUserConfig.EMAIL
+    }
+
 
 @pytest.mark.anyio
 async def test_register_user_command_handler_fail_user_already_exists() -> None:
@@ -1,11 +1,15 @@
 import pytest
 from datetime import datetime, timezone
-from typing import List
+from fastapi.responses import StreamingResponse
+from typing import Union
 from sqlalchemy import update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
-from src.core.database.connection import DATABASE_URL
+from src.core.messagebus import MessageBus
+from src.core.pagination import Page, PageRequest
+from src.core.projection import Projection
+from src.core.database.connection import DATABASE_URL, engine, replica_session_factory
 from src.users.exceptions import (
     UserAlreadyExistsError,
     InvalidPasswordError,
@@ -14,10 +18,12 @@ from src.users.exceptions import (
 )
 from src.security.exceptions import InvalidTokenError
 from src.users.domain.models import UserModel
+from src.users.domain.read_models import UserReadModel
 from src.security.models import JWTDataModel
 from src.users.entrypoints.schemas import RegisterUserScheme, LoginUserScheme
 from src.security.utils import create_jwt_token
 from tests.config import FakeUserConfig
+from tests.utils import capture_statements
 from src.users.entrypoints.dependencies import (
     register_user,
     authenticate_user,
@@ -29,9 +35,9 @@ from src.users.entrypoints.dependencies import (
 
 
 @pytest.mark.anyio
-async def test_register_user_success(map_models_to_orm: None) -> None:
+async def test_register_user_success(map_models_to_orm: None, messagebus: MessageBus) -> None:
     user_data: RegisterUserScheme = RegisterUserScheme(**FakeUserConfig().to_dict(to_lower=True))
-    user: UserModel = await register_user(user_data=user_data)
+    user: UserModel = await register_user(user_data=user_data, messagebus=messagebus)
 
     assert user.id == 1
     assert user.username == FakeUserConfig.USERNAME
@@ -40,16 +46,32 @@ async def test_register_user_success(map_models_to_orm: None) -> None:
 
 
 @pytest.mark.anyio
-async def test_register_user_fail(create_test_user: None) -> None:
+async def test_register_user_fail(create_test_user: None, messagebus: MessageBus) -> None:
     user_data: RegisterUserScheme = RegisterUserScheme(**FakeUserConfig().to_dict(to_lower=True))
     with pytest.raises(UserAlreadyExistsError):
-        await register_user(user_data=user_data)
+        await register_user(user_data=user_data, messagebus=messagebus)
 
 
 @pytest.mark.anyio
-async def test_verify_user_credentials_by_username_success(create_test_user: None) -> None:
+async def test_register_user_fail_by_unique_constraint_without_existence_check(
+        create_test_user: None,
+        messagebus: MessageBus
+) -> None:
+
+    user_data: RegisterUserScheme = RegisterUserScheme(**FakeUserConfig().to_dict(to_lower=True))
+    user_data.email = 'another@yandex.ru'
+    with capture_statements(engine=engine) as statements:
+        with pytest.raises(UserAlreadyExistsError):
+            await register_user(user_data=user_data, messagebus=messagebus)
+
+    assert len(statements) == 1
+    assert statements[0][0].startswith('INSERT INTO users')
+
+
+@pytest.mark.anyio
+async def test_verify_user_credentials_by_username_success(create_test_user: None, messagebus: MessageBus) -> None:
     user_data: LoginUserScheme = LoginUserScheme(username=FakeUserConfig.USERNAME, password=FakeUserConfig.PASSWORD)
-    user: UserModel = await verify_user_credentials(user_data=user_data)
+    user: UserModel = await verify_user_credentials(user_data=user_data, messagebus=messagebus)
 
     assert user.id == 1
     assert user.username == FakeUserConfig.USERNAME
@@ -58,9 +80,9 @@ async def test_verify_user_credentials_by_username_success(create_test_user: Non
 
 
 @pytest.mark.anyio
-async def test_verify_user_credentials_by_email_success(create_test_user: None) -> None:
+async def test_verify_user_credentials_by_email_success(create_test_user: None, messagebus: MessageBus) -> None:
     user_data: LoginUserScheme = LoginUserScheme(username=FakeUserConfig.EMAIL, password=FakeUserConfig.PASSWORD)
-    user: UserModel = await verify_user_credentials(user_data=user_data)
+    user: UserModel = await verify_user_credentials(user_data=user_data, messagebus=messagebus)
 
     assert user.id == 1
     assert user.username == FakeUserConfig.USERNAME
@@ -69,22 +91,45 @@ async def test_verify_user_credentials_by_email_success(create_test_user: None)
 
 
 @pytest.mark.anyio
-async def test_verify_user_credentials_fail_user_does_not_exist(map_models_to_orm: None) -> None:
+@pytest.mark.parametrize('login', [FakeUserConfig.EMAIL, FakeUserConfig.USERNAME])
+async def test_verify_user_credentials_selects_user_by_one_query(
+        login: str,
+        create_test_user: None,
+        messagebus: MessageBus
+) -> None:
+
+    user_data: LoginUserScheme = LoginUserScheme(username=login, password=FakeUserConfig.PASSWORD)
+    with capture_statements(engine=engine) as statements:
+        await verify_user_credentials(user_data=user_data, messagebus=messagebus)
+
+    assert len(statements) == 1
+
+
+@pytest.mark.anyio
+async def test_verify_user_credentials_fail_user_does_not_exist(
+        map_models_to_orm: None,
+        messagebus: MessageBus
+) -> None:
+
     user_data: LoginUserScheme = LoginUserScheme(**FakeUserConfig().to_dict(to_lower=True))
     with pytest.raises(UserNotFoundError):
-        await verify_user_credentials(user_data=user_data)
+        await verify_user_credentials(user_data=user_data, messagebus=messagebus)
 
 
 @pytest.mark.anyio
-async def test_verify_user_credentials_fail_incorrect_password(create_test_user: None) -> None:
+async def test_verify_user_credentials_fail_incorrect_password(create_test_user: None, messagebus: MessageBus) -> None:
     user_data: LoginUserScheme = LoginUserScheme(**FakeUserConfig().to_dict(to_lower=True))
     user_data.password = 'some_incorrect_password'
     with pytest.raises(InvalidPasswordError):
-        await verify_user_credentials(user_data=user_data)
+        await verify_user_credentials(user_data=user_data, messagebus=messagebus)
 
 
 @pytest.mark.anyio
-async def test_verify_user_credentials_fail_email_is_not_verified(create_test_user: None) -> None:
+async def test_verify_user_credentials_fail_email_is_not_verified(
+        create_test_user: None,
+        messagebus: MessageBus
+) -> None:
+
     engine: AsyncEngine = create_async_engine(DATABASE_URL)
     async with engine.begin() as conn:
         try:
@@ -94,83 +139,111 @@ async def test_verify_user_credentials_fail_email_is_not_verified(create_test_us
             await conn.rollback()
 
     with pytest.raises(EmailIsNotVerifiedError):
-        await verify_user_credentials(user_data=LoginUserScheme(**FakeUserConfig().to_dict(to_lower=True)))
+        await verify_user_credentials(
+            user_data=LoginUserScheme(**FakeUserConfig().to_dict(to_lower=True)),
+            messagebus=messagebus
+        )
 
 
 @pytest.mark.anyio
-async def test_authenticate_user_success(map_models_to_orm: None, access_token: str) -> None:
-    user: UserModel = await authenticate_user(token=access_token)
+async def test_authenticate_user_success(map_models_to_orm: None, access_token: str, messagebus: MessageBus) -> None:
+    user: UserModel = await authenticate_user(token=access_token, messagebus=messagebus)
     assert user.email == FakeUserConfig.EMAIL
     assert user.username == FakeUserConfig.USERNAME
     assert not user.password
 
 
 @pytest.mark.anyio
-async def test_authenticate_user_fail_invalid_token(map_models_to_orm: None) -> None:
+async def test_authenticate_user_fail_invalid_token(map_models_to_orm: None, messagebus: MessageBus) -> None:
     with pytest.raises(InvalidTokenError):
-        await authenticate_user(token='someInvalidToken')
+        await authenticate_user(token='someInvalidToken', messagebus=messagebus)
 
 
 @pytest.mark.anyio
-async def test_authenticate_user_fail_token_expired(map_models_to_orm: None) -> None:
+async def test_authenticate_user_fail_token_expired(map_models_to_orm: None, messagebus: MessageBus) -> None:
     jwt_data: JWTDataModel = JWTDataModel(user_id=1, exp=datetime.now(timezone.utc))
     token: str = await create_jwt_token(jwt_data=jwt_data)
     with pytest.raises(InvalidTokenError):
-        await authenticate_user(token=token)
+        await authenticate_user(token=token, messagebus=messagebus)
 
 
 @pytest.mark.anyio
-async def test_authenticate_user_fail_user_does_not_exist(map_models_to_orm: None) -> None:
+async def test_authenticate_user_fail_user_does_not_exist(map_models_to_orm: None, messagebus: MessageBus) -> None:
     jwt_data: JWTDataModel = JWTDataModel(user_id=1)
     token: str = await create_jwt_token(jwt_data=jwt_data)
     with pytest.raises(UserNotFoundError):
-        await authenticate_user(token=token)
+        await authenticate_user(token=token, messagebus=messagebus)
 
 
 @pytest.mark.anyio
-async def test_verify_user_email_success(access_token: str) -> None:
-    user: UserModel = await verify_user_email(token=access_token)
+async def test_verify_user_email_success(access_token: str, messagebus: MessageBus) -> None:
+    user: UserModel = await verify_user_email(token=access_token, messagebus=messagebus)
     assert user.email_verified
     assert not user.password
 
 
 @pytest.mark.anyio
-async def test_verify_user_email_fail_user_does_not_exist(map_models_to_orm: None) -> None:
+async def test_verify_user_email_fail_user_does_not_exist(map_models_to_orm: None, messagebus: MessageBus) -> None:
     jwt_data: JWTDataModel = JWTDataModel(user_id=1)
     token: str = await create_jwt_token(jwt_data=jwt_data)
     with pytest.raises(UserNotFoundError):
-        await verify_user_email(token=token)
+        await verify_user_email(token=token, messagebus=messagebus)
 
 
 @pytest.mark.anyio
 async def test_get_all_users_with_existing_user(create_test_user: None) -> None:
-    users: List[UserModel] = await get_all_users()
-    assert len(users) == 1
-    user: UserModel = users[0]
+    page: Union[Page[UserReadModel], StreamingResponse] = await get_all_users(
+        page_request=PageRequest(),
+        with_total=True,
+        export_media_type=None,
+        projection=Projection(fields=('id', 'email', 'username', 'email_verified')),
+        session_factory=replica_session_factory
+    )
+    assert isinstance(page, Page)
+    assert len(page.items) == 1
+    assert page.next_cursor is None
+    assert page.total == 1
+    user: UserReadModel = page.items[0]
     assert user.id == 1
     assert user.username == FakeUserConfig.USERNAME
     assert user.email == FakeUserConfig.EMAIL
-    assert not user.password
+    assert not hasattr(user, 'password')
 
 
 @pytest.mark.anyio
 async def test_get_all_users_without_existing_users(map_models_to_orm: None) -> None:
-    users: List[UserModel] = await get_all_users()
-    assert len(users) == 0
+    page: Union[Page[UserReadModel], StreamingResponse] = await get_all_users(
+        page_request=PageRequest(),
+        with_total=False,
+        export_media_type=None,
+        projection=Projection(fields=('id', 'email', 'username', 'email_verified')),
+        session_factory=replica_session_factory
+    )
+    assert isinstance(page, Page)
+    assert len(page.items) == 0
+    assert page.total is None
 
 
 @pytest.mark.anyio
 async def test_get_my_account_success(map_models_to_orm: None, access_token: str) -> None:
-    user: UserModel = await get_my_account(token=access_token)
+    user: UserReadModel = await get_my_account(
+        token=access_token,
+        projection=Projection(fields=('id', 'email', 'username', 'email_verified')),
+        session_factory=replica_session_factory
+    )
     assert user.email == FakeUserConfig.EMAIL
     assert user.username == FakeUserConfig.USERNAME
-    assert not user.password
+    assert not hasattr(user, 'password')
 
 
 @pytest.mark.anyio
 async def test_get_my_account_fail_invalid_token(map_models_to_orm: None) -> None:
     with pytest.raises(InvalidTokenError):
-        await get_my_account(token='someInvalidToken')
+        await get_my_account(
+            token='someInvalidToken',
+            projection=Projection(fields=('id', 'email', 'username', 'email_verified')),
+            session_factory=replica_session_factory
+        )
 
 
 @pytest.mark.anyio
@@ -178,7 +251,11 @@ async def test_get_my_account_fail_token_expired(map_models_to_orm: None) -> Non
     jwt_data: JWTDataModel = JWTDataModel(user_id=1, exp=datetime.now(timezone.utc))
     token: str = await create_jwt_token(jwt_data=jwt_data)
     with pytest.raises(InvalidTokenError):
-        await get_my_account(token=token)
+        await get_my_account(
+            token=token,
+            projection=Projection(fields=('id', 'email', 'username', 'email_verified')),
+            session_factory=replica_session_factory
+        )
 
 
 @pytest.mark.anyio
@@ -186,4 +263,8 @@ async def test_aget_my_account_fail_user_does_not_exist(map_models_to_orm: None)
     jwt_data: JWTDataModel = JWTDataModel(user_id=1)
     token: str = await create_jwt_token(jwt_data=jwt_data)
     with pytest.raises(UserNotFoundError):
-        await get_my_account(token=token)
+        await get_my_account(
+            token=token,
+            projection=Projection(fields=('id', 'email', 'username', 'email_verified')),
+            session_factory=replica_session_factory
+        )
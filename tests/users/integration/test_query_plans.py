@@ -0,0 +1,60 @@
+import pytest
+from typing import List, Tuple, Any, Dict
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from src.core.pagination import PageRequest
+from src.users.adapters.queries import SQLAlchemyUsersQueries
+from src.users.adapters.repositories import SQLAlchemyUsersRepository
+from tests.utils import capture_statements, assert_statements_use_indexes, get_used_indexes
+
+
+# Unique constraints of users are not named, so that their indexes are named by each dialect in its own way:
+USERS_EMAIL_AND_USERNAME_INDEXES: Dict[str, List[str]] = {
+    'sqlite': ['sqlite_autoindex_users_2', 'sqlite_autoindex_users_3'],
+    'postgresql': ['users_email_key', 'users_username_key'],
+}
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_repository_and_queries_do_not_scan_tables(large_tables_engine: AsyncEngine) -> None:
+    engine: AsyncEngine = large_tables_engine
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine)
+    statements: List[Tuple[str, Any]]
+    with capture_statements(engine=engine) as statements:
+        async with session_factory() as session:
+            repository: SQLAlchemyUsersRepository = SQLAlchemyUsersRepository(session=session)
+            await repository.get(id=1)
+            await repository.get_by_email(email='user_1@test.com')
+            await repository.get_by_username(username='user_1')
+            await repository.get_by_login(login='user_1')
+
+            queries: SQLAlchemyUsersQueries = SQLAlchemyUsersQueries(session=session)
+            await queries.get_user_account(user_id=1)
+            await queries.get_all_users(page_request=PageRequest(after_id=1))
+
+    await assert_statements_use_indexes(engine=engine, statements=statements)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('login', ['user_1@test.com', 'user_1'])
+async def test_sqlalchemy_users_repository_get_by_login_uses_email_and_username_indexes(
+        login: str,
+        large_tables_engine: AsyncEngine
+) -> None:
+
+    """
+    Email and username are resolved by one statement, which reads both unique indexes, whichever of them matches.
+    """
+
+    engine: AsyncEngine = large_tables_engine
+    session_factory: async_sessionmaker = async_sessionmaker(bind=engine)
+    with capture_statements(engine=engine) as statements:
+        async with session_factory() as session:
+            assert await SQLAlchemyUsersRepository(session=session).get_by_login(login=login)
+
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    async with engine.connect() as conn:
+        used_indexes: List[str] = await get_used_indexes(connection=conn, statement=statement, parameters=parameters)
+
+    assert sorted(used_indexes) == USERS_EMAIL_AND_USERNAME_INDEXES[engine.dialect.name]
@@ -1,7 +1,7 @@
 import pytest
-from typing import List
 
-from src.users.domain.models import UserModel
+from src.core.pagination import Page, PageRequest
+from src.users.domain.read_models import UserReadModel
 from src.users.exceptions import UserNotFoundError
 from src.users.interfaces import UsersUnitOfWork, UsersRepository
 from src.users.entrypoints.views import UsersViews
@@ -14,10 +14,10 @@ from tests.users.utils import create_fake_users_repository_instance
 async def test_users_views_get_user_account_success() -> None:
     users_repository: UsersRepository = await create_fake_users_repository_instance(with_user=True)
     users_unit_of_work: UsersUnitOfWork = FakeUsersUnitOfWork(users_repository=users_repository)
-    user: UserModel = await UsersViews(uow=users_unit_of_work).get_user_account(user_id=1)
+    user: UserReadModel = await UsersViews(uow=users_unit_of_work).get_user_account(user_id=1)
     assert user.email == FakeUserConfig.EMAIL
     assert user.username == FakeUserConfig.USERNAME
-    assert not user.password
+    assert not hasattr(user, 'password')
 
 
 @pytest.mark.anyio
@@ -32,17 +32,17 @@ async def test_users_views_get_user_account_fails_user_does_not_exist() -> None:
 async def test_users_views_get_all_users_with_existing_users() -> None:
     users_repository: UsersRepository = await create_fake_users_repository_instance(with_user=True)
     users_unit_of_work: UsersUnitOfWork = FakeUsersUnitOfWork(users_repository=users_repository)
-    users: List[UserModel] = await UsersViews(uow=users_unit_of_work).get_all_users()
-    assert len(users) == 1
-    user: UserModel = users[0]
+    page: Page[UserReadModel] = await UsersViews(uow=users_unit_of_work).get_all_users(page_request=PageRequest())
+    assert len(page.items) == 1
+    user: UserReadModel = page.items[0]
     assert user.email == FakeUserConfig.EMAIL
     assert user.username == FakeUserConfig.USERNAME
-    assert not user.password
+    assert not hasattr(user, 'password')
 
 
 @pytest.mark.anyio
 async def test_users_views_get_all_users_without_existing_users() -> None:
     users_repository: UsersRepository = await create_fake_users_repository_instance()
     users_unit_of_work: UsersUnitOfWork = FakeUsersUnitOfWork(users_repository=users_repository)
-    users: List[UserModel] = await UsersViews(uow=users_unit_of_work).get_all_users()
-    assert len(users) == 0
+    page: Page[UserReadModel] = await UsersViews(uow=users_unit_of_work).get_all_users(page_request=PageRequest())
+    assert len(page.items) == 0
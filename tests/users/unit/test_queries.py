@@ -0,0 +1,89 @@
+import pytest
+from typing import Optional, List
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
+
+from src.core.pagination import PageRequest
+from src.core.projection import Projection
+from src.users.adapters.orm import users_table
+from src.users.adapters.queries import SQLAlchemyUsersQueries, USER_READ_MODEL_COLUMNS
+from src.users.domain.read_models import UserReadModel
+from tests.config import FakeUserConfig
+
+
+def test_sqlalchemy_users_queries_never_select_password() -> None:
+    assert users_table.c.password not in USER_READ_MODEL_COLUMNS
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_queries_get_user_account_success(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user: Optional[UserReadModel] = await SQLAlchemyUsersQueries(session=session).get_user_account(user_id=1)
+    assert user == UserReadModel(
+        id=1,
+        email=FakeUserConfig.EMAIL,
+        username=FakeUserConfig.USERNAME,
+        email_verified=FakeUserConfig.EMAIL_VERIFIED
+    )
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_queries_get_user_account_fail(
+        map_models_to_orm: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user: Optional[UserReadModel] = await SQLAlchemyUsersQueries(session=session).get_user_account(user_id=1)
+    assert user is None
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_queries_get_all_users(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    users: List[UserReadModel] = await SQLAlchemyUsersQueries(session=session).get_all_users(
+        page_request=PageRequest()
+    )
+    assert len(users) == 1
+    assert users[0].email == FakeUserConfig.EMAIL
+    assert users[0].username == FakeUserConfig.USERNAME
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_queries_stream_all_users(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    partitions: List[List[UserReadModel]] = [
+        partition async for partition in SQLAlchemyUsersQueries(session=session).stream_all_users(partition_size=1)
+    ]
+    assert len(partitions) == 1
+    assert partitions[0][0].email == FakeUserConfig.EMAIL
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_queries_select_only_projected_fields(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    users: List[UserReadModel] = await SQLAlchemyUsersQueries(session=session).get_all_users(
+        page_request=PageRequest(),
+        projection=Projection(fields=('username',), is_partial=True)
+    )
+    assert users == [UserReadModel(id=1, username=FakeUserConfig.USERNAME)]
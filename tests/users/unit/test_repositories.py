@@ -1,6 +1,6 @@
 import pytest
 from typing import Optional, List, Sequence
-from sqlalchemy import select, CursorResult, Row
+from sqlalchemy import select, insert, CursorResult, Row
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, async_sessionmaker
 
@@ -297,3 +297,74 @@ async def test_sqlalchemy_users_repository_update_non_existing_user(
     user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True))
     with pytest.raises(NoResultFound):
         await SQLAlchemyUsersRepository(session=session).update(id=1, model=user)
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize('login', [FakeUserConfig.EMAIL, FakeUserConfig.USERNAME])
+async def test_sqlalchemy_users_repository_get_by_login_success(
+        login: str,
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user: Optional[UserModel] = await SQLAlchemyUsersRepository(session=session).get_by_login(login=login)
+
+    assert user is not None
+    assert user.id == 1
+    assert user.email == FakeUserConfig.EMAIL
+    assert user.username == FakeUserConfig.USERNAME
+    assert user.password
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_repository_get_by_login_prefers_email(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    await async_connection.execute(
+        insert(UserModel).values(email='another@yandex.ru', password='password', username=FakeUserConfig.EMAIL)
+    )
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user: Optional[UserModel] = await SQLAlchemyUsersRepository(session=session).get_by_login(
+        login=FakeUserConfig.EMAIL
+    )
+
+    assert user is not None
+    assert user.id == 1
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_repository_get_by_login_fail(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    user: Optional[UserModel] = await SQLAlchemyUsersRepository(session=session).get_by_login(login='unknown')
+    assert user is None
+
+
+@pytest.mark.anyio
+async def test_sqlalchemy_users_repository_add_if_not_exists(
+        create_test_user: None,
+        async_connection: AsyncConnection
+) -> None:
+
+    async_session_factory: async_sessionmaker = async_sessionmaker(bind=async_connection)
+    session: AsyncSession = async_session_factory()
+    repository: SQLAlchemyUsersRepository = SQLAlchemyUsersRepository(session=session)
+    user: UserModel = UserModel(**FakeUserConfig().to_dict(to_lower=True))
+    assert await repository.add_if_not_exists(model=user) is None
+
+    user.email = 'another@yandex.ru'
+    assert await repository.add_if_not_exists(model=user) is None
+
+    user.username = 'another_username'
+    registered_user: Optional[UserModel] = await repository.add_if_not_exists(model=user)
+    assert registered_user is not None
+    assert registered_user.id == 2
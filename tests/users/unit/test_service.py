@@ -184,3 +184,23 @@ async def test_users_service_get_all_users_without_existing_users() -> None:
 
     users: List[UserModel] = await users_service.get_all_users()
     assert len(users) == 0
+
+
+@pytest.mark.anyio
+async def test_users_service_get_user_by_login_success() -> None:
+    users_repository: UsersRepository = await create_fake_users_repository_instance(with_user=True)
+    users_unit_of_work: UsersUnitOfWork = FakeUsersUnitOfWork(users_repository=users_repository)
+    users_service: UsersService = UsersService(uow=users_unit_of_work)
+
+    assert (await users_service.get_user_by_login(login=FakeUserConfig.EMAIL)).id == 1
+    assert (await users_service.get_user_by_login(login=FakeUserConfig.USERNAME)).id == 1
+
+
+@pytest.mark.anyio
+async def test_users_service_get_user_by_login_fail() -> None:
+    users_repository: UsersRepository = await create_fake_users_repository_instance()
+    users_unit_of_work: UsersUnitOfWork = FakeUsersUnitOfWork(users_repository=users_repository)
+    users_service: UsersService = UsersService(uow=users_unit_of_work)
+
+    with pytest.raises(UserNotFoundError):
+        await users_service.get_user_by_login(login=FakeUserConfig.EMAIL)
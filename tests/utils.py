@@ -1,12 +1,25 @@
+import json
 import os
+import re
+import socket
+from contextlib import contextmanager
 from random import choice
 from string import ascii_uppercase
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple, Iterator
 from httpx import Response
+from sqlalchemy import event, insert, URL
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection
 from starlette.requests import Request
 from starlette.datastructures import Headers
 
 from src.core.database.config import database_config
+from src.groups.adapters.orm import groups_table, group_members_table
+from src.users.adapters.orm import users_table
+from tests.config import LargeTablesConfig
+
+
+POSTGRES_TEST_HOST: str = os.environ.get('POSTGRES_TEST_HOST', 'localhost')
+POSTGRES_TEST_PORT: int = int(os.environ.get('POSTGRES_TEST_PORT', '5432'))
 
 
 def get_base_url() -> str:
@@ -20,6 +33,30 @@ def drop_test_db() -> None:
         os.remove(database_config.DATABASE_NAME)
 
 
+def get_postgres_test_url() -> URL:
+    """
+    Url of PostgreSQL database, which is used only by tests, that check PostgreSQL specific behaviour, such as query
+    plans. Its tables are dropped after each of such tests.
+    """
+
+    return URL.create(
+        drivername='postgresql+asyncpg',
+        username=os.environ.get('POSTGRES_TEST_USER', 'postgresql'),
+        password=os.environ.get('POSTGRES_TEST_PASSWORD', 'postgresql'),
+        host=POSTGRES_TEST_HOST,
+        port=POSTGRES_TEST_PORT,
+        database=os.environ.get('POSTGRES_TEST_DATABASE', 'benefit_bistro_test')
+    )
+
+
+def postgres_is_reachable() -> bool:
+    try:
+        with socket.create_connection((POSTGRES_TEST_HOST, POSTGRES_TEST_PORT), timeout=1):
+            return True
+    except OSError:
+        return False
+
+
 def get_error_message_from_response(response: Response) -> str:
     response_content: Dict[str, Any] = response.json()
     try:
@@ -32,6 +69,117 @@ def generate_random_string(length: int) -> str:
     return ''.join(choice(ascii_uppercase) for _ in range(length))
 
 
+@contextmanager
+def capture_statements(engine: AsyncEngine) -> Iterator[List[Tuple[str, Any]]]:
+    """
+    Collects SQL statements with their parameters, as they are sent to the database by engine, so that statements,
+    built inside repositories and queries, could be explained.
+    """
+
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def get_plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get('Plans', []):
+        yield from get_plan_nodes(node=child)
+
+
+async def get_sequential_scans(connection: AsyncConnection, statement: str, parameters: Any) -> List[str]:
+    """
+    Explains statement and returns descriptions of full table scans in its plan. Postgres reports them as "Seq Scan"
+    nodes, and SQLite as "SCAN <table>" steps, while index lookups are reported as "SEARCH <table> USING INDEX".
+    Scans of table valued functions, such as SQLite json_each() over a parameter, do not read tables and are skipped.
+    """
+
+    if connection.dialect.name == 'postgresql':
+        plan: Any = (await connection.exec_driver_sql('EXPLAIN (FORMAT JSON) ' + statement, parameters)).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return [
+            'Seq Scan on {}'.format(node['Relation Name'])
+            for node in get_plan_nodes(node=plan[0]['Plan'])
+            if node['Node Type'] == 'Seq Scan'
+        ]
+
+    return [
+        detail
+        for _, _, _, detail in await connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)
+        if detail.startswith('SCAN ') and detail != 'SCAN CONSTANT ROW' and 'VIRTUAL TABLE' not in detail
+    ]
+
+
+async def get_used_indexes(connection: AsyncConnection, statement: str, parameters: Any) -> List[str]:
+    """
+    Explains statement and returns names of indexes, which are used by its plan, in order of plan nodes.
+    """
+
+    if connection.dialect.name == 'postgresql':
+        plan: Any = (await connection.exec_driver_sql('EXPLAIN (FORMAT JSON) ' + statement, parameters)).scalar_one()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        return [node['Index Name'] for node in get_plan_nodes(node=plan[0]['Plan']) if 'Index Name' in node]
+
+    return [
+        match.group(1)
+        for _, _, _, detail in await connection.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters)
+        for match in [re.search(r'USING (?:COVERING )?INDEX (\S+)', detail)]
+        if match
+    ]
+
+
+async def assert_statements_use_indexes(engine: AsyncEngine, statements: List[Tuple[str, Any]]) -> None:
+    assert statements
+    async with engine.connect() as conn:
+        for statement, parameters in statements:
+            assert not await get_sequential_scans(connection=conn, statement=statement, parameters=parameters), (
+                statement
+            )
+
+
+async def insert_large_tables_rows(connection: AsyncConnection) -> None:
+    """
+    Inserts enough users, groups and group members rows, for sequential scans to be more expensive than index scans.
+    Planner statistics should be updated afterwards, so that query plans are the same as on production-sized tables.
+    """
+
+    config: LargeTablesConfig = LargeTablesConfig()
+    await connection.execute(
+        insert(users_table),
+        [
+            {'email': f'user_{user_id}@test.com', 'password': 'password', 'username': f'user_{user_id}'}
+            for user_id in range(1, config.USERS_COUNT + 1)
+        ]
+    )
+    await connection.execute(
+        insert(groups_table),
+        [
+            {'owner_id': user_id, 'name': f'group_{index}', 'member_count': config.MEMBERS_PER_GROUP}
+            for user_id in range(1, config.USERS_COUNT + 1)
+            for index in range(config.GROUPS_PER_USER)
+        ]
+    )
+    await connection.execute(
+        insert(group_members_table),
+        [
+            {'group_id': group_id, 'user_id': (group_id + index) % config.USERS_COUNT + 1}
+            for group_id in range(1, config.USERS_COUNT * config.GROUPS_PER_USER + 1)
+            for index in range(config.MEMBERS_PER_GROUP)
+        ]
+    )
+
+
 def build_request(
         method: str = 'GET',
         server: str = 'www.example.com',